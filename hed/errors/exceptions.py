@@ -8,6 +8,7 @@ class HedExceptions:
     BAD_PARAMETERS = 'badParameters'
     CANNOT_PARSE_XML = 'cannotParseXML'
     CANNOT_PARSE_JSON = 'cannotParseJson'
+    CANNOT_PARSE_COMPILED = 'cannotParseCompiled'
     INVALID_EXTENSION = 'invalidExtension'
     INVALID_HED_FORMAT = 'INVALID_HED_FORMAT'
 
@@ -9,6 +9,7 @@ from .expression_parser import QueryParser
 from .hed_group import HedGroup
 from .spreadsheet_input import SpreadsheetInput
 from .hed_string import HedString
+from .hed_string_cache import HedStringCache, get_hed_string, clear_parse_cache, parse_cache_info
 from .hed_tag import HedTag
 from .sidecar import Sidecar
 from .tabular_input import TabularInput
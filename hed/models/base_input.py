@@ -1,6 +1,8 @@
 import re
 import os
+import functools
 
+import numpy as np
 import openpyxl
 import pandas
 
@@ -57,6 +59,8 @@ class BaseInput:
         self._loaded_workbook = None
         self._worksheet_name = worksheet_name
         self._dataframe = None
+        # The number of rows before this data in the original file, if this is one chunk of a larger file.
+        self._row_offset = 0
 
         input_type = file_type
         if isinstance(file, str):
@@ -158,6 +162,11 @@ class BaseInput:
         """ Name of the data. """
         return self._name
 
+    @property
+    def row_offset(self):
+        """ The row number of the first row of this data in the original file. """
+        return self._row_offset
+
     @property
     def has_column_names(self):
         """ True if dataframe has column names. """
@@ -409,16 +418,11 @@ class BaseInput:
         return self._handle_curly_braces_refs(all_columns, refs, column_names)
 
     def _handle_transforms(self, mapper):
-        transformers, need_categorical = mapper.get_transformers()
+        transformers, _ = mapper.get_transformers()
         if transformers:
-            all_columns = self._dataframe
-            if need_categorical:
-                all_columns[need_categorical] = all_columns[need_categorical].astype('category')
-
-            all_columns = all_columns.transform(transformers)
-
-            if need_categorical:
-                all_columns[need_categorical] = all_columns[need_categorical].astype('str')
+            all_columns = pd.DataFrame({column: transform(self._dataframe[column])
+                                        for column, transform in transformers.items()},
+                                       index=self._dataframe.index)
         else:
             all_columns = self._dataframe
 
@@ -476,19 +480,99 @@ class BaseInput:
         remaining_columns = [column for column in column_names if column not in refs]
 
         # Replace references in the columns we are saving out.
-        saved_columns = df[refs]
-        for column_name in remaining_columns:
-            for replacing_name in refs:
-                # If the data has no n/a values, this version is MUCH faster.
-                # column_name_brackets = f"{{{replacing_name}}}"
-                # df[column_name] = pd.Series(x.replace(column_name_brackets, y) for x, y
-                #                             in zip(df[column_name], saved_columns[replacing_name]))
-                df[column_name] = pd.Series(BaseInput._replace_ref(x, y, replacing_name) for x, y
-                                            in zip(df[column_name], saved_columns[replacing_name]))
+        if refs:
+            ref_values = {ref: df[ref].to_numpy(dtype=object) for ref in refs}
+            ref_is_na = {ref: values == "n/a" for ref, values in ref_values.items()}
+            ref_is_unsafe = {ref: BaseInput._unsafe_ref_values(values) & ~ref_is_na[ref]
+                             for ref, values in ref_values.items()}
+            for column_name in remaining_columns:
+                df[column_name] = BaseInput._substitute_refs(df[column_name].to_numpy(dtype=object), refs,
+                                                             ref_values, ref_is_na, ref_is_unsafe)
         df = df[remaining_columns]
 
         return df
 
+    @staticmethod
+    def _unsafe_ref_values(values):
+        """ Return a mask of values that cannot be inserted using a substitution plan.
+
+            A value is unsafe if it could change how a neighbouring n/a ref is removed, because it is empty,
+            starts with a space, comma or closing parenthesis, or ends with a space, comma or opening parenthesis.
+            Values that contain a ref themselves are also unsafe.
+        """
+        codes, unique_values = pd.factorize(values)
+        unsafe = np.fromiter((not value or value[0].isspace() or value[-1].isspace() or
+                              value[0] in ",)" or value[-1] in ",(" or "{" in value
+                              for value in map(str, unique_values)), dtype=bool, count=len(unique_values))
+        return unsafe[codes]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _get_substitution_plan(text, refs, na_mask):
+        """ Return how to fill in the refs in text, for rows where the given refs are n/a.
+
+        Parameters:
+            text (str): The string containing the refs enclosed in curly braces.
+            refs (tuple): The refs found in text, in the order they are replaced.
+            na_mask (tuple): For each ref, True if its value is n/a.
+
+        Returns:
+            tuple:
+                pieces(tuple of str): The literal text between the refs that are filled in.
+                slot_refs(tuple of str): The ref to insert after each piece, one fewer than pieces.
+        """
+        for ref, is_na in zip(refs, na_mask):
+            if is_na:
+                text = BaseInput._replace_ref(text, "n/a", ref)
+        filled_refs = [ref for ref, is_na in zip(refs, na_mask) if not is_na]
+        if not filled_refs:
+            return (text,), ()
+        parts = re.split(r"\{(" + "|".join(re.escape(ref) for ref in filled_refs) + r")\}", text)
+        return tuple(parts[0::2]), tuple(parts[1::2])
+
+    @staticmethod
+    def _substitute_refs(texts, refs, ref_values, ref_is_na, ref_is_unsafe):
+        """ Replace the refs in each of texts with the ref values from the same row.
+
+            Rows are grouped by their text and which refs are n/a, and each group is filled in from a cached
+            substitution plan.  Rows with unsafe ref values are replaced one ref at a time instead.
+
+        Parameters:
+            texts (np.ndarray): The column to replace refs in.
+            refs (list): The names of the ref columns, in the order they are replaced.
+            ref_values (dict): The values of each ref column.
+            ref_is_na (dict): A mask of the n/a values in each ref column.
+            ref_is_unsafe (dict): A mask of the values in each ref column that cannot use a plan.
+
+        Returns:
+            np.ndarray: The column with all refs replaced.
+        """
+        result = texts.copy()
+        text_codes, unique_texts = pd.factorize(texts)
+        rows_by_text = np.split(np.argsort(text_codes, kind="stable"), np.cumsum(np.bincount(text_codes))[:-1])
+        for text, rows in zip(unique_texts, rows_by_text):
+            text_refs = tuple(ref for ref in refs if f"{{{ref}}}" in text)
+            if not text_refs:
+                continue
+            unsafe = np.zeros(len(rows), dtype=bool)
+            na_codes = np.zeros(len(rows), dtype=np.int64)
+            for bit, ref in enumerate(text_refs):
+                unsafe |= ref_is_unsafe[ref][rows]
+                na_codes |= ref_is_na[ref][rows].astype(np.int64) << bit
+            for row in rows[unsafe]:
+                for ref in refs:
+                    result[row] = BaseInput._replace_ref(result[row], ref_values[ref][row], ref)
+            rows, na_codes = rows[~unsafe], na_codes[~unsafe]
+            for na_code in np.unique(na_codes):
+                group_rows = rows[na_codes == na_code]
+                na_mask = tuple(bool(na_code >> bit & 1) for bit in range(len(text_refs)))
+                pieces, slot_refs = BaseInput._get_substitution_plan(text, text_refs, na_mask)
+                filled = np.full(len(group_rows), pieces[0], dtype=object)
+                for piece, ref in zip(pieces[1:], slot_refs):
+                    filled = filled + ref_values[ref][group_rows] + piece
+                result[group_rows] = filled
+        return result
+
     @staticmethod
     def combine_dataframe(dataframe):
         """ Combines all columns in the given dataframe into a single HED string series,
@@ -500,11 +584,12 @@ class BaseInput:
         Returns:
             Series: the assembled series
         """
-        dataframe = dataframe.apply(
-            lambda x: ', '.join(filter(lambda e: bool(e) and e != "n/a", map(str, x))),
-            axis=1
-        )
-        return dataframe
+        columns = [dataframe.iloc[:, column_number].astype(str).to_numpy(dtype=object)
+                   for column_number in range(len(dataframe.columns))]
+        if not columns:
+            return pd.Series([""] * len(dataframe), index=dataframe.index, dtype=object)
+        return pd.Series([', '.join([value for value in row if value and value != "n/a"]) for row in zip(*columns)],
+                         index=dataframe.index, dtype=object)
 
     def get_def_dict(self, hed_schema, extra_def_dicts=None):
         """ Returns the definition dict for this file
@@ -5,6 +5,10 @@ from hed.errors.error_types import ValidationErrors
 
 import copy
 from collections import Counter
+from functools import partial
+
+import numpy as np
+import pandas as pd
 
 PANDAS_COLUMN_PREFIX_TO_IGNORE = "Unnamed: "
 
@@ -90,7 +94,8 @@ class ColumnMapper:
 
             Returns:
                 tuple(dict, list):
-                    dict({str or int: func}): the functions to use to transform each column
+                    dict({str or int: func}): the functions to use to transform each column.
+                                              Each takes the column as a Series and returns the new Series.
                     need_categorical(list of int): a list of columns to treat as categoriacl
         """
         final_transformers = {}
@@ -106,13 +111,13 @@ class ColumnMapper:
                 continue
             elif column.column_type == ColumnType.Value:
                 value_str = column.hed_dict
-                from functools import partial
-                final_transformers[assign_to_column] = partial(self._value_handler, value_str)
+                final_transformers[assign_to_column] = partial(self._transform_unique_values,
+                                                               partial(self._value_handler, value_str))
             elif column.column_type == ColumnType.Categorical:
                 need_categorical.append(column.column_name)
                 category_values = column.hed_dict
-                from functools import partial
-                final_transformers[assign_to_column] = partial(self._category_handler, category_values)
+                final_transformers[assign_to_column] = partial(self._transform_unique_values,
+                                                               partial(self._category_handler, category_values))
             else:
                 final_transformers[assign_to_column] = lambda x: x
 
@@ -406,6 +411,31 @@ class ColumnMapper:
         """
         return self.check_for_mapping_issues()
 
+    @staticmethod
+    def _transform_unique_values(handler, series):
+        """ Apply handler once per unique value in series, and broadcast the results back to every row.
+
+        Parameters:
+            handler (func): Function mapping a single cell value to its HED string.
+            series (pd.Series): The column to transform.
+
+        Returns:
+            pd.Series: The transformed column, with the same index as series.
+
+        Notes:
+            - Missing cells (None or NaN, as kept by Excel input) get code -1 from factorize,
+              so the handler is applied to each of them directly.
+        """
+        codes, uniques = pd.factorize(series)
+        lookup = np.empty(len(uniques), dtype=object)
+        lookup[:] = [handler(value) for value in uniques]
+        results = lookup[codes]
+        missing = np.flatnonzero(codes < 0)
+        if len(missing):
+            values = series.to_numpy()
+            results[missing] = [handler(values[row]) for row in missing]
+        return pd.Series(results, index=series.index, name=series.name)
+
     @staticmethod
     def _category_handler(category_values, x):
         return category_values.get(x, "")
@@ -1,15 +1,54 @@
+import math
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
-from hed.models.definition_dict import DefinitionDict
+from hed.models.definition_dict import DefinitionDict, DefTagNames
 from hed.models.definition_entry import DefinitionEntry
 from hed.models.hed_string import HedString
 
 
 class AmbiguousDef:
+    """ The def-expand groups seen so far for a definition that cannot be resolved yet.
+
+    Attributes:
+        actual_defs (list):      The distinct contents of the def-expand groups.
+        placeholder_defs (list): The same contents with the def-expand value replaced by #.
+        occurrences (list):      The index in actual_defs of each def-expand group added, in the order added.
+
+    """
     def __init__(self):
         self.actual_defs = []
         self.placeholder_defs = []
+        self.occurrences = []
+        self._positions = {}
+
+    @property
+    def counts(self):
+        """ list: The number of times each of the distinct def-expand groups was added. """
+        counts = Counter(self.occurrences)
+        return [counts[index] for index in range(len(self.actual_defs))]
 
     def add_def(self, def_tag, def_expand_group):
+        """ Add a def-expand group for this definition.
+
+        Parameters:
+            def_tag (HedTag): The def-expand tag.
+            def_expand_group (HedGroup): The group containing the def-expand tag.
+
+        Returns:
+            bool: True if the group is new, False if an identical group was already added.
+
+        Notes:
+            - A repeated group is only counted, since it cannot change the result of validate or get_group.
+
+        """
+        group_key = str(def_expand_group)
+        position = self._positions.get(group_key)
+        if position is not None:
+            self.occurrences.append(position)
+            return False
+        self._positions[group_key] = len(self.actual_defs)
+        self.occurrences.append(len(self.actual_defs))
         group_tag = def_expand_group.get_first_group()
         def_extension = def_tag.extension.split('/')[-1]
         self.actual_defs.append(group_tag)
@@ -20,6 +59,7 @@ class AmbiguousDef:
         for tag in matching_tags:
             tag.extension = "#"
         self.placeholder_defs.append(group_tag)
+        return True
 
     def validate(self):
         """Validate the given ambiguous definition
@@ -95,16 +135,25 @@ class DefExpandGatherer:
         self.ambiguous_defs = ambiguous_defs if ambiguous_defs else {}
         self.errors = errors if errors else {}
         self.def_dict = DefinitionDict(known_defs, self.hed_schema)
+        self._def_expands = {}
+        self._known_results = {}
 
-    def process_def_expands(self, hed_strings, known_defs=None):
+    def process_def_expands(self, hed_strings, known_defs=None, workers=None):
         """Process the HED strings containing def-expand tags.
 
         Parameters:
             hed_strings (pd.Series or list): A Pandas Series or list of HED strings to be processed.
             known_defs (dict, optional): A dictionary of known definitions to be added.
+            workers (int or None): If greater than 1, parse the strings in this many worker processes.
 
         Returns:
             tuple: A tuple containing the DefinitionDict, ambiguous definitions, and errors.
+
+        Notes:
+            - Each distinct string and each distinct def-expand group is only parsed once.
+            - The def-expand groups are resolved in the order they appear, since an ambiguous definition
+              depends on the groups seen before it.  Only the parsing is done by the worker processes.
+
         """
         if not isinstance(hed_strings, pd.Series):
             hed_strings = pd.Series(hed_strings)
@@ -113,34 +162,77 @@ class DefExpandGatherer:
 
         if known_defs:
             self.def_dict.add_definitions(known_defs, self.hed_schema)
-        for i in hed_strings[def_expand_mask].index:
-            string = hed_strings.loc[i]
-            self._process_def_expand(string)
+        strings = list(hed_strings[def_expand_mask])
+        string_keys = self._get_string_keys(list(dict.fromkeys(strings)), workers)
+        for string in strings:
+            for key in string_keys[string]:
+                self._process_def_expand(key)
 
         return self.def_dict, self.ambiguous_defs, self.errors
 
-    def _process_def_expand(self, string):
-        """Process a single HED string to extract definitions and handle known and ambiguous definitions.
+    def _get_string_keys(self, unique_strings, workers):
+        """Return the def-expand keys of each of the strings.
 
         Parameters:
-            string (str): The HED string to be processed.
+            unique_strings (list): The distinct HED strings to be parsed.
+            workers (int or None): If greater than 1, parse the strings in this many worker processes.
+
+        Returns:
+            dict: The list of def-expand keys in each string keyed by the string.
         """
-        hed_str = HedString(string, self.hed_schema)
+        if not workers or workers < 2 or len(unique_strings) < 2:
+            return {string: _get_def_expand_keys(string, self.hed_schema) for string in unique_strings}
+        chunk_size = math.ceil(len(unique_strings) / (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_gather_worker,
+                                 initargs=(self.hed_schema,)) as pool:
+            keys = pool.map(_get_def_expand_keys_in_worker, unique_strings, chunksize=chunk_size)
+            return dict(zip(unique_strings, keys))
 
-        for def_tag, def_expand_group, def_group in hed_str.find_def_tags(recursive=True):
-            if def_tag == def_expand_group:
-                continue
+    def _get_def_expand(self, key):
+        """Return the def-expand tag and group for a def-expand key, parsing the group the first time it is seen.
 
-            if not self._handle_known_definition(def_tag, def_expand_group, def_group):
-                self._handle_ambiguous_definition(def_tag, def_expand_group)
+        Parameters:
+            key (tuple): The text of the def-expand tag and the text of its group.
 
-    def _handle_known_definition(self, def_tag, def_expand_group, def_group):
+        Returns:
+            tuple: The def-expand tag (HedTag) and the group containing it (HedGroup).
+        """
+        def_expand = self._def_expands.get(key)
+        if def_expand is None:
+            tag_text, group_text = key
+            def_expand_group = HedString(group_text, self.hed_schema).children[0]
+            def_tag = next(tag for tag in def_expand_group.tags()
+                           if tag.short_base_tag == DefTagNames.DEF_EXPAND_ORG_KEY and str(tag) == tag_text)
+            def_expand = self._def_expands[key] = (def_tag, def_expand_group)
+        return def_expand
+
+    def _process_def_expand(self, key):
+        """Process a single def-expand group to handle known and ambiguous definitions.
+
+        Parameters:
+            key (tuple): The text of the def-expand tag and the text of its group.
+        """
+        def_tag, def_expand_group = self._get_def_expand(key)
+        known_result = self._known_results.get(key)
+        if known_result:
+            def_entry, mismatch = known_result
+            def_tag_name = def_tag.extension.split('/')[0]
+            if self.def_dict.defs.get(def_tag_name.lower()) is def_entry:
+                if mismatch is not None:
+                    self.errors.setdefault(def_tag_name.lower(), []).append(mismatch)
+                return
+
+        if not self._handle_known_definition(def_tag, def_expand_group, None, key):
+            self._handle_ambiguous_definition(def_tag, def_expand_group)
+
+    def _handle_known_definition(self, def_tag, def_expand_group, def_group, key=None):
         """Handle known def-expand tag in a HED string.
 
         Parameters:
             def_tag (HedTag): The def-expand tag.
             def_expand_group (HedGroup): The group containing the def-expand tag.
             def_group (HedGroup): The group containing the def-expand group.
+            key (tuple or None): If given, remember the comparison with a known definition under this key.
 
         Returns:
             bool: True if the def-expand tag is known and handled, False otherwise.
@@ -150,8 +242,12 @@ class DefExpandGatherer:
         def_expand_group.sort()
 
         if def_group_contents:
+            mismatch = None
             if def_group_contents != def_expand_group:
-                self.errors.setdefault(def_tag_name.lower(), []).append(def_expand_group.get_first_group())
+                mismatch = def_expand_group.get_first_group()
+                self.errors.setdefault(def_tag_name.lower(), []).append(mismatch)
+            if key is not None:
+                self._known_results[key] = (self.def_dict.defs[def_tag_name.lower()], mismatch)
             return True
 
         has_extension = "/" in def_tag.extension
@@ -178,7 +274,9 @@ class DefExpandGatherer:
         """
         def_tag_name = def_tag.extension.split('/')[0]
         these_defs = self.ambiguous_defs.setdefault(def_tag_name.lower(), AmbiguousDef())
-        these_defs.add_def(def_tag, def_expand_group)
+
+        if not these_defs.add_def(def_tag, def_expand_group):
+            return
 
         try:
             if these_defs.validate():
@@ -188,8 +286,8 @@ class DefExpandGatherer:
                                                                            source_context=[])
                 del self.ambiguous_defs[def_tag_name.lower()]
         except ValueError as e:
-            for ambiguous_def in these_defs.placeholder_defs:
-                self.errors.setdefault(def_tag_name.lower(), []).append(ambiguous_def)
+            for index in these_defs.occurrences:
+                self.errors.setdefault(def_tag_name.lower(), []).append(these_defs.placeholder_defs[index])
             del self.ambiguous_defs[def_tag_name.lower()]
 
         return
@@ -202,3 +300,32 @@ class DefExpandGatherer:
             HedGroup: the ambiguous definition with known placeholders filled in
         """
         return ambiguous_def.get_group()
+
+
+def _get_def_expand_keys(string, hed_schema):
+    """Return the text of each def-expand tag in a HED string together with the text of its group.
+
+    Parameters:
+        string (str): The HED string to be parsed.
+        hed_schema (HedSchema): The HED schema to be used for parsing.
+
+    Returns:
+        list: A list of (tag text, group text) tuples in the order they appear in the string.
+    """
+    hed_str = HedString(string, hed_schema)
+    return [(str(def_tag), str(def_expand_group))
+            for def_tag, def_expand_group, _ in hed_str.find_def_tags(recursive=True)
+            if def_tag != def_expand_group]
+
+
+_worker_state = {}
+
+
+def _init_gather_worker(hed_schema):
+    """ Keep the schema in this worker process so it is only transferred once. """
+    _worker_state["hed_schema"] = hed_schema
+
+
+def _get_def_expand_keys_in_worker(string):
+    """ Return the def-expand keys of a HED string in a worker process. """
+    return _get_def_expand_keys(string, _worker_state["hed_schema"])
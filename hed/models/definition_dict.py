@@ -267,13 +267,31 @@ class DefinitionDict:
         # Finish tracking down why parent is set incorrectly on def tags sometimes
         # It should be ALWAYS set
         if hed_tag.short_base_tag in {DefTagNames.DEF_ORG_KEY, DefTagNames.DEF_EXPAND_ORG_KEY}:
-            save_parent = hed_tag._parent
-            def_contents = self._get_definition_contents(hed_tag)
-            hed_tag._parent = save_parent
-            if def_contents is not None:
-                hed_tag._expandable = def_contents
+            definition = self._get_definition_entry(hed_tag)
+            if definition is not None:
+                # The contents are only built when the tag's expandable is first used.
+                hed_tag._definition = definition
+                hed_tag._expandable = None
                 hed_tag._expanded = hed_tag.short_base_tag == DefTagNames.DEF_EXPAND_ORG_KEY
 
+    def _get_definition_entry(self, def_tag):
+        """ Get the definition entry and placeholder value for a given def tag.
+
+            Does not validate at all.
+
+        Parameters:
+            def_tag (HedTag): Source hed tag that may be a Def or Def-expand tag.
+
+        Returns:
+            tuple or None: The DefinitionEntry and the placeholder value, or None if there is no matching definition
+                           or the tag has a placeholder value exactly when the definition does not take one.
+        """
+        tag_label, _, placeholder = def_tag.extension.partition('/')
+        def_entry = self.defs.get(tag_label.lower())
+        if def_entry is None or def_entry.takes_value == (not placeholder):
+            return None
+        return def_entry, placeholder
+
     def _get_definition_contents(self, def_tag):
         """ Get the contents for a given def tag.
 
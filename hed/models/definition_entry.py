@@ -7,6 +7,8 @@ from hed.models.model_constants import DefTagNames
 class DefinitionEntry:
     """ A single definition. """
 
+    MAX_EXPANSIONS = 1000  # Maximum number of placeholder values whose expanded contents are kept.
+
     def __init__(self, name, contents, takes_value, source_context):
         """ Initialize info for a single definition.
 
@@ -23,6 +25,7 @@ class DefinitionEntry:
         self.contents = contents
         self.takes_value = takes_value
         self.source_context = source_context
+        self._expansions = {}  # Expanded contents keyed by placeholder value, cloned for each expansion.
 
     def get_definition(self, replace_tag, placeholder_value=None, return_copy_of_tag=False):
         """ Return a copy of the definition with the tag expanded and the placeholder plugged in.
@@ -48,18 +51,49 @@ class DefinitionEntry:
             replace_tag = replace_tag.copy()
         output_contents = [replace_tag]
         if self.contents:
-            output_group = copy.deepcopy(self.contents)
+            output_contents = [replace_tag, self._get_expanded_contents(placeholder_value)]
+
+        output_contents = HedGroup(replace_tag._hed_string,
+                                   startpos=replace_tag.span[0], endpos=replace_tag.span[1], contents=output_contents)
+        return output_contents
+
+    def _get_expanded_contents(self, placeholder_value):
+        """ Return a new copy of the contents with the placeholder value plugged in.
+
+        Parameters:
+            placeholder_value (str or None):  The value to replace the pound sign with if the definition takes a value.
+
+        Returns:
+            HedGroup: A copy of the contents that the caller may modify.
+
+        :raises ValueError:
+            - Something internally went wrong with finding the placeholder tag.  This should not be possible.
+
+        Notes:
+            - The contents are deep copied and the placeholder replaced once per placeholder value. The result is
+              kept unmodified and each expansion gets a structural clone of it, which shares the schema entries.
+
+        """
+        expanded = self._expansions.get(placeholder_value)
+        if expanded is None:
+            expanded = copy.deepcopy(self.contents)
             if placeholder_value:
-                placeholder_tag = output_group.find_placeholder_tag()
+                placeholder_tag = expanded.find_placeholder_tag()
                 if not placeholder_tag:
                     raise ValueError("Internal error related to placeholders in definition mapping")
                 placeholder_tag.replace_placeholder(placeholder_value)
+            # Several threads may share this entry, so evict from a snapshot of the keys and allow for
+            # another thread having evicted the same key first.
+            keys = list(self._expansions)
+            if len(keys) >= self.MAX_EXPANSIONS:
+                self._expansions.pop(keys[0], None)
+            self._expansions[placeholder_value] = expanded
+        return expanded._clone({})
 
-            output_contents = [replace_tag, output_group]
-
-        output_contents = HedGroup(replace_tag._hed_string,
-                                   startpos=replace_tag.span[0], endpos=replace_tag.span[1], contents=output_contents)
-        return output_contents
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_expansions'] = {}
+        return state
 
     def __str__(self):
         return str(self.contents)
@@ -4,6 +4,7 @@ import pandas as pd
 from hed.models.sidecar import Sidecar
 from hed.models.tabular_input import TabularInput
 from hed.models.hed_string import HedString
+from hed.models.hed_string_cache import get_hed_string
 from hed.models.definition_dict import DefinitionDict
 
 
@@ -43,15 +44,15 @@ def get_assembled(tabular_file, sidecar, hed_schema, extra_def_dicts=None, join_
 
     if join_columns:
         if expand_defs:
-            return [HedString(x, hed_schema, def_dict).expand_defs() for x in tabular_file.series_a], def_dict
+            return [get_hed_string(x, hed_schema, def_dict).expand_defs() for x in tabular_file.series_a], def_dict
         elif shrink_defs:
-            return [HedString(x, hed_schema, def_dict).shrink_defs() for x in tabular_file.series_a], def_dict
+            return [get_hed_string(x, hed_schema, def_dict).shrink_defs() for x in tabular_file.series_a], def_dict
         else:
-            return [HedString(x, hed_schema, def_dict) for x in tabular_file.series_a], def_dict
+            return [get_hed_string(x, hed_schema, def_dict) for x in tabular_file.series_a], def_dict
     else:
-        return [[HedString(x, hed_schema, def_dict).expand_defs() if expand_defs
-                 else HedString(x, hed_schema, def_dict).shrink_defs() if shrink_defs
-                 else HedString(x, hed_schema, def_dict)
+        return [[get_hed_string(x, hed_schema, def_dict).expand_defs() if expand_defs
+                 else get_hed_string(x, hed_schema, def_dict).shrink_defs() if shrink_defs
+                 else get_hed_string(x, hed_schema, def_dict)
                  for x in text_file_row] for text_file_row in tabular_file.dataframe_a.itertuples(index=False)], \
                def_dict
 
@@ -132,7 +133,7 @@ def _expand_defs(hed_string, hed_schema, def_dict):
     return str(HedString(hed_string, hed_schema, def_dict).expand_defs())
 
 
-def process_def_expands(hed_strings, hed_schema, known_defs=None, ambiguous_defs=None):
+def process_def_expands(hed_strings, hed_schema, known_defs=None, ambiguous_defs=None, workers=None):
     """ Gather def-expand tags in the strings/compare with known definitions to find any differences
 
     Parameters:
@@ -143,10 +144,11 @@ def process_def_expands(hed_strings, hed_schema, known_defs=None, ambiguous_defs
             match perfectly.
         ambiguous_defs (dict): A dictionary containing ambiguous definitions
             format TBD.  Currently def name key: list of lists of HED tags values
+        workers (int or None): If greater than 1, parse the strings in this many worker processes.
     Returns:
         tuple: A tuple containing the DefinitionDict, ambiguous definitions, and errors.
     """
     
     from hed.models.def_expand_gather import DefExpandGatherer
     def_gatherer = DefExpandGatherer(hed_schema, known_defs, ambiguous_defs)
-    return def_gatherer.process_def_expands(hed_strings)
+    return def_gatherer.process_def_expands(hed_strings, workers=workers)
@@ -125,6 +125,18 @@ class Expression:
             output_str += str(self.right)
         return output_str
 
+    def get_required(self):
+        """ Return what a string must contain for this expression to find anything.
+
+        Returns:
+            set: A set of ("term", text) and ("exact", text) tuples.  Empty if nothing in particular is required.
+        """
+        if self._must_not_be_in_line or self._match_mode == 2:
+            return set()
+        if self._match_mode:
+            return {("exact", self.token.text)}
+        return {("term", self.token.text)}
+
     def handle_expr(self, hed_group, exact=False):
         if self._match_mode == 2:
             groups_found = hed_group.find_wildcard_tags([self.token.text], recursive=True, include_groups=2)
@@ -155,6 +167,9 @@ class Expression:
 
 
 class ExpressionAnd(Expression):
+    def get_required(self):
+        return self.left.get_required() | self.right.get_required()
+
     def handle_expr(self, hed_group, exact=False):
         groups1 = self.left.handle_expr(hed_group, exact=exact)
         if not groups1:
@@ -198,6 +213,9 @@ class ExpressionAnd(Expression):
 
 
 class ExpressionWildcardNew(Expression):
+    def get_required(self):
+        return set()
+
     def handle_expr(self, hed_group, exact=False):
         groups_found = []
         if self.token.text == "?":
@@ -226,6 +244,9 @@ class ExpressionWildcardNew(Expression):
 
 
 class ExpressionOr(Expression):
+    def get_required(self):
+        return self.left.get_required() & self.right.get_required()
+
     def handle_expr(self, hed_group, exact=False):
         groups1 = self.left.handle_expr(hed_group, exact=exact)
         # Don't early out as we need to gather all groups incase tags appear more than once etc
@@ -254,6 +275,9 @@ class ExpressionOr(Expression):
 
 
 class ExpressionNegation(Expression):
+    def get_required(self):
+        return set()
+
     def handle_expr(self, hed_group, exact=False):
         found_groups = self.right.handle_expr(hed_group, exact=exact)
 
@@ -269,6 +293,9 @@ class ExpressionNegation(Expression):
 
 
 class ExpressionContainingGroup(Expression):
+    def get_required(self):
+        return self.right.get_required()
+
     def handle_expr(self, hed_group, exact=False):
         result = self.right.handle_expr(hed_group, exact=True)
         found_groups = result
@@ -287,6 +314,9 @@ class ExpressionContainingGroup(Expression):
 
 
 class ExpressionDescendantGroup(Expression):
+    def get_required(self):
+        return self.right.get_required()
+
     def handle_expr(self, hed_group, exact=False):
         found_groups = self.right.handle_expr(hed_group)
         found_parent_groups = []
@@ -303,6 +333,9 @@ class ExpressionDescendantGroup(Expression):
 
 
 class ExpressionExactMatch(Expression):
+    def get_required(self):
+        return self.right.get_required()
+
     def handle_expr(self, hed_group, exact=False):
         found_groups = self.right.handle_expr(hed_group, exact=True)
         if found_groups:
@@ -331,6 +364,83 @@ class ExpressionExactMatch(Expression):
         return []
 
 
+class SearchIndex:
+    """ An index of the tags and groups in a HedString, so it can be searched by many queries in a single pass.
+
+        Pass this to QueryParser.search in place of the HedString.  The string must not be changed after indexing.
+    """
+
+    def __init__(self, hed_string_obj):
+        """ Index the tags and groups in a HedString.
+
+        Parameters:
+            hed_string_obj (HedString): The string to index.
+        """
+        from hed.models.hed_group import HedGroup
+        self.hed_string = hed_string_obj
+        self._all_groups = []
+        self._all_tags = []
+        self._term_tags = {}
+        self._exact_tags = None
+
+        # Same order as HedGroup.get_all_groups and HedGroup.get_all_tags
+        node_list = [hed_string_obj]
+        while node_list:
+            node = node_list.pop()
+            if isinstance(node, HedGroup):
+                self._all_groups.append(node)
+                node_list.extend(reversed(node.children))
+                continue
+            self._all_tags.append(node)
+            for term in dict.fromkeys(node.tag_terms):
+                self._term_tags.setdefault(term, []).append((node, node._parent))
+
+    def _get_exact_tags(self):
+        if self._exact_tags is None:
+            self._exact_tags = {}
+            for tag in self._all_tags:
+                self._exact_tags.setdefault(tag.lower(), []).append((tag, tag._parent))
+        return self._exact_tags
+
+    def has_required(self, required):
+        """ Return True if this string has everything in required.
+
+        Parameters:
+            required (set): The ("term", text) and ("exact", text) tuples from Expression.get_required.
+
+        Returns:
+            bool: False if a query with these requirements cannot find anything in this string.
+        """
+        for kind, text in required:
+            if text not in (self._term_tags if kind == "term" else self._get_exact_tags()):
+                return False
+        return True
+
+    # The functions below match the HedGroup versions with recursive=True and include_groups=2,
+    # which is how expressions call them.
+    def get_all_groups(self):
+        return self._all_groups
+
+    def get_all_tags(self):
+        return self._all_tags
+
+    def find_tags_with_term(self, term, recursive=True, include_groups=2):
+        return self._term_tags.get(term.lower(), [])
+
+    def find_exact_tags(self, exact_tags, recursive=True, include_groups=2):
+        if len(exact_tags) == 1:
+            return self._get_exact_tags().get(exact_tags[0], [])
+        return [(tag, tag._parent) for tag in self._all_tags if tag in exact_tags]
+
+    def find_wildcard_tags(self, search_tags, recursive=True, include_groups=2):
+        found_tags = []
+        for tag in self._all_tags:
+            short_tag = tag.short_tag.lower()
+            if any(short_tag.startswith(search_tag) for search_tag in search_tags):
+                found_tags.append((tag, tag._parent))
+        return found_tags
+
+
 class QueryParser:
     """Parse a search expression into a form than can be used to search a hed string."""
 
@@ -368,6 +478,7 @@ class QueryParser:
         self.at_token = -1
         self.tree = self._parse(expression_string.lower())
         self._org_string = expression_string
+        self._required = self.tree.get_required()
 
     def __str__(self):
         return str(self.tree)
@@ -478,6 +589,17 @@ class QueryParser:
         return tokens
 
     def search(self, hed_string_obj):
+        """ Search a HedString for this query.
+
+        Parameters:
+            hed_string_obj (HedString or SearchIndex): The string to search.
+                Use a SearchIndex when searching the same string with many queries.
+
+        Returns:
+            list: A list of search_result for the groups found.  Empty if nothing was found.
+        """
+        if isinstance(hed_string_obj, SearchIndex) and not hed_string_obj.has_required(self._required):
+            return []
         current_node = self.tree
 
         result = current_node.handle_expr(hed_string_obj)
@@ -146,6 +146,32 @@ class HedGroup:
         self._parent = save_parent
         return return_copy
 
+    def _clone(self, memo):
+        """ Return a structural copy of this group, sharing schema entries with the original.
+
+            This is a faster alternative to deepcopy used when copying whole parse trees.
+
+        Parameters:
+            memo (dict): Maps id of already copied tags/groups to their copies.
+
+        Returns:
+            HedGroup: The copied group.
+        """
+        new_group = memo.get(id(self))
+        if new_group is not None:
+            return new_group
+        new_group = self.__class__.__new__(self.__class__)
+        new_group.__dict__.update(self.__dict__)
+        memo[id(self)] = new_group
+        if self._parent is not None:
+            new_group._parent = self._parent._clone(memo)
+        new_group.children = [child._clone(memo) for child in self.children]
+        if self._original_children is self.children:
+            new_group._original_children = new_group.children
+        else:
+            new_group._original_children = [child._clone(memo) for child in self._original_children]
+        return new_group
+
     def sort(self):
         """ Sort the tags and groups in this HedString in a consistent order."""
         self._sorted(update_self=True)
@@ -101,6 +101,22 @@ class HedString(HedGroup):
 
         return new_string
 
+    def _clone(self, memo):
+        """ Return a structural copy of this string, sharing schema entries with the original.
+
+        Parameters:
+            memo (dict): Maps id of already copied tags/groups to their copies.
+
+        Returns:
+            HedString: The copied string.
+        """
+        if id(self) in memo:
+            return memo[id(self)]
+        new_string = super()._clone(memo)
+        if self._from_strings:
+            new_string._from_strings = [string._clone(memo) for string in self._from_strings]
+        return new_string
+
     def copy(self):
         """ Return a deep copy of this string.
 
@@ -0,0 +1,107 @@
+"""
+A bounded cache of parsed HED strings.
+
+Tabular files typically repeat a small number of distinct HED strings across many rows.  The cache keeps
+one parsed tree per (string, schema, definition dict) and hands out copies of it, so each distinct string
+is only split and converted to canonical form once.
+"""
+from collections import OrderedDict
+
+from hed.models.hed_string import HedString
+
+DEFAULT_MAX_SIZE = 10000
+
+
+class HedStringCache:
+    """ Least recently used cache of parsed HedString objects. """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """ Create an empty cache.
+
+        Parameters:
+            max_size (int): The maximum number of parsed strings to keep.  If 0, nothing is cached.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, hed_string, hed_schema, def_dict=None):
+        """ Return a HedString for the given string, parsing it only if it is not already cached.
+
+        Parameters:
+            hed_string (str): A HED string consisting of tags and tag groups.
+            hed_schema (HedSchema or HedSchemaGroup): The schema to use to identify tags.
+            def_dict (DefinitionDict or None): The def dict to use to identify def/def expand tags.
+
+        Returns:
+            HedString: A new HedString that can be modified without affecting the cached one.
+
+        Notes:
+            - Schemas and def dicts are matched by identity. They are assumed not to change while cached.
+              Call clear() if a cached definition dictionary is modified.
+        """
+        key = (hed_string, id(hed_schema), id(def_dict))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]._clone({})
+
+        self.misses += 1
+        parsed = HedString(hed_string, hed_schema, def_dict)
+        if self.max_size <= 0:
+            return parsed
+        # Keep references to the schema and def dict so their ids stay unique while cached.
+        self._entries[key] = (parsed, hed_schema, def_dict)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return parsed._clone({})
+
+    def clear(self):
+        """ Remove all entries and reset the hit and miss counters. """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def cache_info(self):
+        """ Return the statistics of this cache.
+
+        Returns:
+            dict: The hits, misses, max_size and current size of the cache.
+        """
+        return {"hits": self.hits, "misses": self.misses, "max_size": self.max_size, "size": len(self._entries)}
+
+
+_default_cache = HedStringCache()
+
+
+def get_hed_string(hed_string, hed_schema, def_dict=None):
+    """ Return a HedString for the given string using the shared parse cache.
+
+    Parameters:
+        hed_string (str): A HED string consisting of tags and tag groups.
+        hed_schema (HedSchema or HedSchemaGroup): The schema to use to identify tags.
+        def_dict (DefinitionDict or None): The def dict to use to identify def/def expand tags.
+
+    Returns:
+        HedString: A newly created HedString that the caller may modify.
+    """
+    return _default_cache.get(hed_string, hed_schema, def_dict)
+
+
+def clear_parse_cache():
+    """ Empty the shared parse cache. """
+    _default_cache.clear()
+
+
+def parse_cache_info():
+    """ Return the statistics of the shared parse cache.
+
+    Returns:
+        dict: The hits, misses, max_size and current size of the cache.
+    """
+    return _default_cache.cache_info()
@@ -1,39 +1,243 @@
-from functools import partial
-import pandas as pd
+""" An inverted index from HED tag terms to the rows of tabular files that contain them. """
+import zipfile
 
-from hed.models.sidecar import Sidecar
-from hed.models.tabular_input import TabularInput
+import numpy as np
+
+from hed.errors.exceptions import HedFileError, HedExceptions
+from hed.models.expression_parser import QueryParser
 from hed.models.hed_string import HedString
-from hed.models.definition_dict import DefinitionDict
+from hed.models.tabular_input import TabularInput
 from hed.models import df_util
 
+INDEX_FORMAT_VERSION = 2
+
 
 class IndexedDF:
+    """ An inverted index from HED tag terms to row numbers, for fast searching of one or more tabular files.
+
+        Each tag in a row is indexed under its short and long forms, every term in tag_terms (the tag and its
+        ancestors), and for Def and Def-expand tags under "def/<name>".  All keys are lowercase.
+        Rows are numbered consecutively across all the indexed files.  Each distinct HED string is stored once.
+    """
+
     def __init__(self, tabular_input, sidecar, hed_schema):
-        self._hed_strings = df_util.get_assembled(tabular_input, sidecar, hed_schema, expand_defs=True)
-    #     self._df = df
-    #     self._index = self._create_index(df)
-    #     self._hed_strings = df_util.get_assembled()
-    #
-    # def create_index_from_hed_strings(self):
-    #
-    #
-    #
-    # @staticmethod
-    # def find_rows_for_strings(self, df, search_strings):
-    #     cache = {}
-    #     for string in search_strings:
-    #         if string not in cache:
-    #             print("Hi")
-    #             parts = string.split('/')
-    #             for i in range(1, len(parts) + 1):
-    #                 part = '/'.join(parts[:i])
-    #                 if part not in cache:
-    #                     if i == 1:
-    #                         searchable_rows = df
-    #                     else:
-    #                         searchable_rows = df[cache['/'.join(parts[:i - 1])]]
-    #                     cache[part] = searchable_rows[searchable_rows.str.contains(part)].index.to_list()
-    #         # cache[string] = cache[part]  # Assign the cache result to the complete string
-    #
-    #     return cache
+        """ Assemble and index the HED strings of one or more tabular files.
+
+        Parameters:
+            tabular_input (TabularInput or str or list): A file or list of files to index.
+            sidecar (Sidecar or str or None): The sidecar used to assemble all the files.
+            hed_schema (HedSchema or HedSchemaGroup): The schema used to parse the HED strings.
+        """
+        self._schema = hed_schema
+        self.names = []
+        self._file_starts = [0]
+        self._strings = []
+        string_codes = []
+        code_for_string = {}
+        keys_for_code = []
+        rows_for_key = {}
+        if not isinstance(tabular_input, list):
+            tabular_input = [tabular_input]
+        for data in tabular_input:
+            if isinstance(data, str):
+                data = TabularInput(data, sidecar)
+            hed_strings, _ = df_util.get_assembled(data, sidecar, hed_schema, expand_defs=True)
+            for hed_string in hed_strings:
+                row = len(string_codes)
+                text = str(hed_string)
+                code = code_for_string.get(text)
+                if code is None:
+                    code = code_for_string[text] = len(self._strings)
+                    self._strings.append(text)
+                    keys_for_code.append(self._get_index_keys(hed_string))
+                string_codes.append(code)
+                for key in keys_for_code[code]:
+                    rows_for_key.setdefault(key, []).append(row)
+            self.names.append(data.name)
+            self._file_starts.append(len(string_codes))
+
+        self._file_starts = np.array(self._file_starts, dtype=np.int64)
+        row_dtype = self._row_dtype(len(string_codes))
+        self._string_codes = np.array(string_codes, dtype=row_dtype)
+        self._index = {key: np.array(rows, dtype=row_dtype) for key, rows in rows_for_key.items()}
+
+    @staticmethod
+    def _row_dtype(row_count):
+        return np.int32 if row_count < np.iinfo(np.int32).max else np.int64
+
+    @staticmethod
+    def _get_index_keys(hed_string):
+        """ Return the set of index keys for all the tags in a HedString. """
+        keys = set()
+        for tag in hed_string.get_all_tags():
+            keys.update(tag.tag_terms)
+            keys.add(tag.lower())
+            keys.add(tag.short_tag.lower())
+            keys.add(tag.long_tag.lower())
+            if tag.short_base_tag.lower() in ("def", "def-expand"):
+                keys.add(f"def/{tag.extension.split('/')[0].lower()}")
+        return keys
+
+    def __len__(self):
+        return len(self._string_codes)
+
+    @property
+    def keys(self):
+        """ All the terms in the index. """
+        return self._index.keys()
+
+    def find_rows(self, term):
+        """ Return the rows that contain a term.
+
+        Parameters:
+            term (str): A tag term, a short or long form tag, or "def/<name>".
+
+        Returns:
+            np.ndarray: The sorted row numbers containing the term.
+        """
+        return self._index.get(term.lower(), np.array([], dtype=self._string_codes.dtype))
+
+    def find_rows_for_strings(self, search_strings):
+        """ Return the rows containing each of a list of terms.
+
+        Parameters:
+            search_strings (list of str): The terms to look up.
+
+        Returns:
+            dict: The sorted row numbers for each term.
+        """
+        return {string: self.find_rows(string) for string in search_strings}
+
+    def find_rows_with_all(self, terms):
+        """ Return the rows that contain all the given terms.
+
+        Parameters:
+            terms (iterable of str): The terms that must all be present.
+
+        Returns:
+            np.ndarray or None: The sorted row numbers, or None if terms is empty (all rows qualify).
+        """
+        found = None
+        for term in sorted(terms, key=lambda x: len(self.find_rows(x))):
+            rows = self.find_rows(term)
+            found = rows if found is None else np.intersect1d(found, rows, assume_unique=True)
+            if not len(found):
+                break
+        return found
+
+    def search(self, query):
+        """ Return the rows matching a query.
+
+        Parameters:
+            query (str or QueryParser): The query to run.
+
+        Returns:
+            np.ndarray: The sorted row numbers where the query found a match.
+
+        Notes:
+            - The index first narrows down the rows to those having every term the query requires, and
+              the query is then run once on each distinct HED string in the remaining rows.
+        """
+        if isinstance(query, str):
+            query = QueryParser(query)
+        candidates = self.find_rows_with_all(text for _, text in query._required)
+        if candidates is None:
+            candidates = np.arange(len(self._string_codes), dtype=self._string_codes.dtype)
+        candidate_codes = self._string_codes[candidates]
+        unique_codes, inverse = np.unique(candidate_codes, return_inverse=True)
+        code_matches = np.fromiter((bool(query.search(HedString(self._strings[code], self._schema)))
+                                    for code in unique_codes), dtype=bool, count=len(unique_codes))
+        return candidates[code_matches[inverse]]
+
+    def get_hed_string(self, row):
+        """ Return the assembled HED string for a row.
+
+        Parameters:
+            row (int): The row number.
+
+        Returns:
+            HedString: The HED string for this row, with definitions expanded.
+        """
+        return HedString(self._strings[self._string_codes[row]], self._schema)
+
+    def get_row_locations(self, rows):
+        """ Return which file each row came from.
+
+        Parameters:
+            rows (array-like of int): Row numbers in this index.
+
+        Returns:
+            list: A (file name, row number in that file) tuple for each row.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        file_numbers = np.searchsorted(self._file_starts, rows, side="right") - 1
+        return [(self.names[file_number], int(row - self._file_starts[file_number]))
+                for file_number, row in zip(file_numbers, rows)]
+
+    def save(self, filename):
+        """ Save the index so it can be reloaded without assembling the files again.
+
+        Parameters:
+            filename (str): The file to write.  The .npz extension is added if missing.
+
+        Notes:
+            - The index and strings are written as numpy arrays, so loading does not unpickle anything.
+        """
+        keys = list(self._index)
+        key_offsets = np.cumsum([0] + [len(self._index[key]) for key in keys])
+        rows = np.concatenate([self._index[key] for key in keys]) if keys else np.array([], dtype=np.int64)
+        string_data, string_offsets = self._encode_strings(self._strings)
+        name_data, name_offsets = self._encode_strings([name or "" for name in self.names])
+        key_data, key_offsets_text = self._encode_strings(keys)
+        np.savez_compressed(filename, version=np.array([INDEX_FORMAT_VERSION]),
+                            key_data=key_data, key_text_offsets=key_offsets_text, key_offsets=key_offsets, rows=rows,
+                            string_data=string_data, string_offsets=string_offsets, string_codes=self._string_codes,
+                            name_data=name_data, name_offsets=name_offsets, file_starts=self._file_starts)
+
+    @classmethod
+    def load(cls, filename, hed_schema):
+        """ Load an index written by save.
+
+        Parameters:
+            filename (str): The file written by save.
+            hed_schema (HedSchema or HedSchemaGroup): The schema used to parse the HED strings.
+
+        Returns:
+            IndexedDF: The loaded index.
+
+        :raises HedFileError:
+            - The file cannot be read or is not a saved index.
+        """
+        try:
+            with np.load(filename, allow_pickle=False) as data:
+                if data["version"][0] != INDEX_FORMAT_VERSION:
+                    raise ValueError("Incompatible index format")
+                keys = cls._decode_strings(data["key_data"], data["key_text_offsets"])
+                key_offsets = data["key_offsets"]
+                rows = data["rows"]
+                strings = cls._decode_strings(data["string_data"], data["string_offsets"])
+                string_codes = data["string_codes"]
+                names = cls._decode_strings(data["name_data"], data["name_offsets"])
+                file_starts = data["file_starts"]
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            raise HedFileError(HedExceptions.INVALID_FILE_FORMAT, f"Cannot load HED index: {e}", filename) from e
+
+        indexed = cls.__new__(cls)
+        indexed._schema = hed_schema
+        indexed.names = names
+        indexed._file_starts = file_starts
+        indexed._strings = strings
+        indexed._string_codes = string_codes
+        indexed._index = {key: rows[start:end] for key, start, end in zip(keys, key_offsets, key_offsets[1:])}
+        return indexed
+
+    @staticmethod
+    def _encode_strings(strings):
+        encoded = [string.encode("utf-8") for string in strings]
+        offsets = np.cumsum([0] + [len(data) for data in encoded])
+        return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+    @staticmethod
+    def _decode_strings(data, offsets):
+        data = data.tobytes()
+        return [data[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])]
@@ -1,12 +1,16 @@
+import pandas as pd
+
 from hed.models.column_mapper import ColumnMapper
 from hed.models.base_input import BaseInput
 from hed.models.sidecar import Sidecar
+from hed.errors.exceptions import HedFileError, HedExceptions
 
 
 class TabularInput(BaseInput):
     """ A BIDS tabular tsv file with sidecar. """
 
     HED_COLUMN_NAME = "HED"
+    DEFAULT_CHUNK_ROWS = 10000
 
     def __init__(self, file=None, sidecar=None, name=None):
 
@@ -80,3 +84,89 @@ class TabularInput(BaseInput):
         if self._sidecar:
             return self._sidecar.get_column_refs()
         return []
+
+    @classmethod
+    def iter_chunks(cls, file, sidecar=None, name=None, rows=DEFAULT_CHUNK_ROWS):
+        """ Read a tsv file a chunk of rows at a time, without loading the whole file.
+
+        Parameters:
+            file (str or FileLike or pd.DataFrame): A tsv file to open.
+            sidecar (str or Sidecar or FileLike): A Sidecar or source file/filename.
+            name (str): The name to display for this file for error purposes.
+            rows (int): The number of rows to read at a time.
+
+        Yields:
+            TabularInput: The next chunk of the file.  Its row_offset is the row number of its first row in the file.
+
+        :raises HedFileError:
+            - file is blank
+            - The file has no rows
+            - The file could not be read as a tsv file
+            - A duplicate or empty column name appears
+
+        Notes:
+            - Consecutive rows with the same onset are always put in the same chunk,
+              so series_filtered gives the same results as for the whole file.
+            - Pass the chunks to SpreadsheetValidator.validate_chunks to validate them.
+        """
+        if sidecar and not isinstance(sidecar, Sidecar):
+            sidecar = Sidecar(sidecar)
+        if name is None and isinstance(file, str):
+            name = file
+
+        row_offset = 0
+        remaining = None
+        for frame in cls._read_frames(file, rows, name):
+            if remaining is not None:
+                frame = pd.concat([remaining, frame], ignore_index=True)
+            split = cls._last_onset_group_start(frame)
+            remaining = frame.iloc[split:]
+            if split:
+                yield cls._create_chunk(frame.iloc[:split], sidecar, name, row_offset)
+                row_offset += split
+
+        if remaining is not None and len(remaining):
+            yield cls._create_chunk(remaining, sidecar, name, row_offset)
+        elif not row_offset:
+            raise HedFileError(HedExceptions.INVALID_DATAFRAME, "Invalid dataframe(malformed datafile, etc)", name)
+
+    @classmethod
+    def _create_chunk(cls, frame, sidecar, name, row_offset):
+        chunk = cls(frame.reset_index(drop=True), sidecar=sidecar, name=name)
+        chunk._row_offset = row_offset
+        return chunk
+
+    @staticmethod
+    def _read_frames(file, rows, name):
+        """ Yield the rows of a tsv file or dataframe as dataframes of at most rows rows. """
+        if isinstance(file, pd.DataFrame):
+            for start in range(0, len(file), rows):
+                yield file.iloc[start:start + rows]
+            return
+        if not file:
+            raise HedFileError(HedExceptions.FILE_NOT_FOUND, "Empty file passed to TabularInput.", file)
+
+        try:
+            reader = pd.read_csv(file, delimiter='\t', header=0, dtype=str, keep_default_na=True,
+                                 na_values=["", "null"], chunksize=rows)
+        except Exception as e:
+            raise HedFileError(HedExceptions.INVALID_FILE_FORMAT, str(e), name) from e
+        with reader:
+            while True:
+                try:
+                    frame = next(reader)
+                except StopIteration:
+                    return
+                except Exception as e:
+                    raise HedFileError(HedExceptions.INVALID_FILE_FORMAT, str(e), name) from e
+                # Convert nan values to a known value
+                yield frame.fillna("n/a")
+
+    @classmethod
+    def _last_onset_group_start(cls, frame):
+        """ Return the index of the first row with the same onset as the last row, or the length if no onsets. """
+        if "onset" not in frame.columns:
+            return len(frame)
+        onsets = pd.to_numeric(frame["onset"], errors="coerce")
+        indexed_dict = cls._indexed_dict_from_onsets(onsets)
+        return max(indices[0] for indices in indexed_dict.values())
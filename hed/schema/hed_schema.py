@@ -9,6 +9,7 @@ from hed.schema.hed_schema_section import HedSchemaSection, HedSchemaTagSection,
 from hed.errors import ErrorHandler
 from hed.errors.error_types import ValidationErrors
 from hed.schema.hed_schema_base import HedSchemaBase
+from hed.schema.tag_resolution_cache import TagResolutionCache
 
 
 class HedSchema(HedSchemaBase):
@@ -30,6 +31,7 @@ class HedSchema(HedSchemaBase):
         self._namespace = ""
 
         self._sections = self._create_empty_sections()
+        self._tag_cache = TagResolutionCache()
 
     # ===============================================
     # Basic schema properties
@@ -425,6 +427,7 @@ class HedSchema(HedSchemaBase):
 
         Notes:
             Works left to right (which is mostly relevant for errors).
+            The resolution of each lowercase tag is cached, so only the remainder and issues are rebuilt on a hit.
 
         """
         clean_tag = str(tag)
@@ -432,34 +435,53 @@ class HedSchema(HedSchemaBase):
         clean_tag = clean_tag[len(namespace):]
         working_tag = clean_tag.lower()
 
+        resolution = self._tag_cache.get(working_tag)
+        if resolution is None:
+            resolution = self._resolve_tag(working_tag)
+            self._tag_cache.add(working_tag, resolution)
+        found_entry, remainder_start, error = resolution
+
+        if error:
+            error_type, start, end, kwargs = error
+            prefix_tag_adj = len(namespace)
+            issue = ErrorHandler.format_error(error_type, tag, index_in_tag=prefix_tag_adj + start,
+                                              index_in_tag_end=prefix_tag_adj + end, **kwargs)
+            return None, None, issue
+
+        remainder = None
+        if remainder_start is not None:
+            remainder = clean_tag[remainder_start:]
+        return found_entry, remainder, []
+
+    def _resolve_tag(self, working_tag):
+        """ Find the entry for a lowercase tag without its namespace.
+
+        Parameters:
+            working_tag (str): The lowercase tag to look up.
+
+        Returns:
+            tuple: The entry, the start of the remainder in the tag (or None), and the error found (or None).
+                   The error is a tuple of the error type, its start and end in the tag, and extra parameters.
+        """
         # Most tags are in the schema directly, so test that first
         found_entry = self._get_tag_entry(working_tag)
         if found_entry:
             # this handles the one special case where the actual tag contains "/#" instead of something specific.
             if working_tag.endswith("/#"):
-                remainder = working_tag[-2:]
-            else:
-                remainder = ""
-
-            return found_entry, remainder, []
-
-        prefix_tag_adj = len(namespace)
+                return found_entry, len(working_tag) - 2, None
+            return found_entry, len(working_tag), None
 
         try:
-            found_entry, current_slash_index = self._find_tag_subfunction(tag, working_tag, prefix_tag_adj)
+            found_entry, current_slash_index = self._find_tag_subfunction(working_tag)
         except self._TagIdentifyError as e:
-            issue = e.issue
-            return None, None, issue
+            return None, None, e.issue
 
-        remainder = None
-        if current_slash_index != -1:
-            remainder = clean_tag[current_slash_index:]
-        if remainder and found_entry.takes_value_child_entry:
+        if current_slash_index < len(working_tag) and found_entry.takes_value_child_entry:
             found_entry = found_entry.takes_value_child_entry
 
-        return found_entry, remainder, []
+        return found_entry, current_slash_index, None
 
-    def _find_tag_subfunction(self, tag, working_tag, prefix_tag_adj):
+    def _find_tag_subfunction(self, working_tag):
         """Finds the base tag and remainder from the left, raising exception on issues"""
         current_slash_index = -1
         current_entry = None
@@ -474,15 +496,11 @@ class HedSchema(HedSchemaBase):
             if not parent_entry:
                 # We haven't found any tag at all yet
                 if current_entry is None:
-                    error = ErrorHandler.format_error(ValidationErrors.NO_VALID_TAG_FOUND,
-                                                      tag,
-                                                      index_in_tag=prefix_tag_adj,
-                                                      index_in_tag_end=prefix_tag_adj + next_index)
-                    raise self._TagIdentifyError(error)
+                    raise self._TagIdentifyError((ValidationErrors.NO_VALID_TAG_FOUND, 0, next_index, {}))
                 # If this is not a takes value node, validate each term in the remainder.
                 if not current_entry.takes_value_child_entry:
                     # This will raise _TagIdentifyError on any issues
-                    self._validate_remaining_terms(tag, working_tag, prefix_tag_adj, current_slash_index)
+                    self._validate_remaining_terms(working_tag, current_slash_index)
                 break
 
             current_entry = parent_entry
@@ -492,24 +510,37 @@ class HedSchema(HedSchemaBase):
 
         return current_entry, current_slash_index
 
-    def _validate_remaining_terms(self, tag, working_tag, prefix_tag_adj, current_slash_index):
+    def _validate_remaining_terms(self, working_tag, current_slash_index):
         """ Validates the terms past current_slash_index.
-        
+
         :raises _TagIdentifyError:
             - One of the extension terms already exists as a schema term.
         """
         child_names = working_tag[current_slash_index + 1:].split("/")
-        word_start_index = current_slash_index + 1 + prefix_tag_adj
+        word_start_index = current_slash_index + 1
         for name in child_names:
             if self._get_tag_entry(name):
-                error = ErrorHandler.format_error(ValidationErrors.INVALID_PARENT_NODE,
-                                                  tag,
-                                                  index_in_tag=word_start_index,
-                                                  index_in_tag_end=word_start_index + len(name),
-                                                  expected_parent_tag=self.tags[name].name)
-                raise self._TagIdentifyError(error)
+                raise self._TagIdentifyError((ValidationErrors.INVALID_PARENT_NODE, word_start_index,
+                                              word_start_index + len(name),
+                                              {"expected_parent_tag": self.tags[name].name}))
             word_start_index += len(name) + 1
 
+    def tag_cache_info(self):
+        """ Return the statistics of the tag resolution cache.
+
+        Returns:
+            dict: The hits, misses, max_size and current size of the cache.
+        """
+        return self._tag_cache.cache_info()
+
+    def clear_tag_cache(self):
+        """ Empty the tag resolution cache.
+
+        Notes:
+            - Call this if tags are added to or removed from the schema after it is loaded.
+        """
+        self._tag_cache = TagResolutionCache()
+
     # ===============================================
     # Semi-private creation finalizing functions
     # ===============================================
@@ -517,6 +548,7 @@ class HedSchema(HedSchemaBase):
         """ Call to finish loading. """
         self._has_duplicate_tags = bool(self.tags.duplicate_names)
         self._update_all_entries()
+        self.clear_tag_cache()
 
     def _update_all_entries(self):
         """ Call finalize_entry on every schema entry(tag, unit, etc). """
@@ -160,3 +160,18 @@ class HedSchemaGroup(HedSchemaBase):
             return None, None, validation_issues
 
         return specific_schema._find_tag_entry(tag, schema_namespace)
+
+    def tag_cache_info(self):
+        """ Return the combined statistics of the tag resolution caches of the schemas in this group.
+
+        Returns:
+            dict: The hits, misses, max_size and current size summed over all the schemas.
+
+        Notes:
+            - Each schema keeps its own cache, which is used whether the schema is searched alone or in a group.
+        """
+        totals = {"hits": 0, "misses": 0, "max_size": 0, "size": 0}
+        for schema in self._schemas.values():
+            for key, value in schema.tag_cache_info().items():
+                totals[key] += value
+        return totals
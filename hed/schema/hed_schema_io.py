@@ -2,8 +2,10 @@
 import os
 import json
 import functools
+from hashlib import sha1
 from hed.schema.schema_io.xml2schema import SchemaLoaderXML
 from hed.schema.schema_io.wiki2schema import SchemaLoaderWiki
+from hed.schema.schema_io import compiled_schema
 from hed.schema import hed_cache
 
 from hed.errors.exceptions import HedFileError, HedExceptions
@@ -13,6 +15,7 @@ from hed.schema.schema_validation_util import validate_version_string
 
 
 MAX_MEMORY_CACHE = 20
+COMPILED_CACHE_FOLDER = "compiled"
 
 
 def from_string(schema_string, schema_format=".xml", schema_namespace=None):
@@ -106,6 +109,69 @@ def get_hed_xml_version(xml_file_path):
     return parser.schema.version
 
 
+def _get_compiled_path(hed_path, cache_folder=None):
+    """ Return the path of the compiled version of a schema file.
+
+    Parameters:
+        hed_path (str): Path to the source schema file.
+        cache_folder (str or None): The hed cache folder.  Defaults to the current cache directory.
+
+    Returns:
+        str or None: The path of the compiled schema, or None if the source file cannot be read.
+
+    Notes:
+        - The name includes the sha1 of the source file, so a changed source never matches a stale compiled file.
+    """
+    try:
+        with open(hed_path, "rb") as fp:
+            file_hash = sha1(fp.read()).hexdigest()
+    except OSError:
+        return None
+    if not cache_folder:
+        cache_folder = hed_cache.get_cache_directory()
+    base_name = os.path.splitext(os.path.basename(hed_path))[0]
+    return os.path.join(cache_folder, COMPILED_CACHE_FOLDER,
+                        f"{base_name}_{file_hash}{compiled_schema.COMPILED_EXTENSION}")
+
+
+def _load_schema_file(hed_path, cache_folder=None):
+    """ Load a local schema file, using and updating its compiled version in the cache folder.
+
+    Parameters:
+        hed_path (str): Path to the source schema file.
+        cache_folder (str or None): The hed cache folder.  Defaults to the current cache directory.
+
+    Returns:
+        HedSchema: The loaded schema.
+
+    :raises HedFileError:
+        - Any fatal issues when loading the source schema.
+
+    Notes:
+        - Failing to read or write the compiled file is not an error.  The source file is loaded instead.
+    """
+    compiled_path = _get_compiled_path(hed_path, cache_folder)
+    if compiled_path and os.path.exists(compiled_path):
+        try:
+            hed_schema = compiled_schema.load_compiled(compiled_path)
+            hed_schema.filename = hed_path
+            return hed_schema
+        except HedFileError:
+            pass
+
+    hed_schema = load_schema(hed_path)
+    if compiled_path:
+        temp_path = f"{compiled_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(compiled_path), exist_ok=True)
+            compiled_schema.save_compiled(hed_schema, temp_path)
+            os.replace(temp_path, compiled_path)
+        except (OSError, TypeError):
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    return hed_schema
+
+
 @functools.lru_cache(maxsize=MAX_MEMORY_CACHE)
 def _load_schema_version(xml_version=None, xml_folder=None):
     """ Return specified version or latest if not specified.
@@ -137,7 +203,7 @@ def _load_schema_version(xml_version=None, xml_folder=None):
         if not final_hed_xml_file:
             hed_cache.cache_local_versions(xml_folder)
             final_hed_xml_file = hed_cache.get_hed_version_path(xml_version, library_name, xml_folder)
-        hed_schema = load_schema(final_hed_xml_file)
+        hed_schema = _load_schema_file(final_hed_xml_file, xml_folder)
     except HedFileError as e:
         if e.code == HedExceptions.FILE_NOT_FOUND:
             hed_cache.cache_xml_versions(cache_folder=xml_folder)
@@ -146,7 +212,7 @@ def _load_schema_version(xml_version=None, xml_folder=None):
                 raise HedFileError(HedExceptions.FILE_NOT_FOUND,
                                    f"HED version '{xml_version}' not found in cache: {hed_cache.get_cache_directory()}",
                                    filename=xml_folder)
-            hed_schema = load_schema(final_hed_xml_file)
+            hed_schema = _load_schema_file(final_hed_xml_file, xml_folder)
         else:
             raise e
 
@@ -0,0 +1,172 @@
+"""
+Save and load a fully loaded HedSchema in a compiled binary form.
+
+The compiled form stores the state of the schema, its sections and entries after finalize_dictionaries,
+so loading it skips both XML parsing and finalizing.  Objects are written with marshal as plain data
+(no pickle), and only the schema classes listed here can be created when loading.
+"""
+import marshal
+
+from hed.errors.exceptions import HedFileError, HedExceptions
+from hed.schema.hed_schema import HedSchema
+from hed.schema.hed_schema_constants import HedSectionKey
+from hed.schema.hed_schema_entry import HedSchemaEntry, UnitClassEntry, UnitEntry, HedTagEntry
+from hed.schema.hed_schema_section import HedSchemaSection, HedSchemaTagSection, HedSchemaUnitClassSection
+
+# Increment this when the layout of the schema classes changes, so old compiled files are ignored.
+COMPILED_FORMAT_VERSION = 1
+COMPILED_EXTENSION = ".hedc"
+
+_SCHEMA_CLASSES = {cls.__name__: cls for cls in (HedSchema, HedSchemaSection, HedSchemaTagSection,
+                                                 HedSchemaUnitClassSection, HedSchemaEntry, UnitClassEntry,
+                                                 UnitEntry, HedTagEntry)}
+
+# Attributes rebuilt when loading rather than written to the compiled file.
+_TRANSIENT_ATTRIBUTES = {"_tag_cache"}
+
+# Values that are not plain data are written as tuples starting with one of these tags.
+# Plain lists and dicts (containing only strings, numbers and plain containers) are stored as is.
+_REF = 0
+_REF_LIST = 1
+_REF_DICT = 2
+_LIST = 3
+_DICT = 4
+_TUPLE = 5
+_PLAIN = 6
+_SECTION_KEY = 7
+_CLASS = 8
+
+
+class _SchemaEncoder:
+    """ Converts a schema into a list of (class name, state) pairs containing only marshal-able values. """
+
+    def __init__(self):
+        self.objects = []
+        self._indexes = {}
+
+    def add_object(self, obj):
+        index = self._indexes.get(id(obj))
+        if index is None:
+            index = len(self.objects)
+            self._indexes[id(obj)] = index
+            self.objects.append(None)
+            state = {key: self.encode(value) for key, value in obj.__dict__.items()
+                     if key not in _TRANSIENT_ATTRIBUTES}
+            self.objects[index] = (type(obj).__name__, state)
+        return index
+
+    def encode(self, value):
+        """ Return the encoded form of value.  Any tuple returned is tagged. """
+        if self._is_plain(value):
+            return (_PLAIN, value) if isinstance(value, tuple) else value
+        if self._is_schema_object(value):
+            return _REF, self.add_object(value)
+        if isinstance(value, HedSectionKey):
+            return _SECTION_KEY, value.value
+        if isinstance(value, type) and _SCHEMA_CLASSES.get(value.__name__) is value:
+            return _CLASS, value.__name__
+        if isinstance(value, list):
+            if all(self._is_schema_object(item) for item in value):
+                return _REF_LIST, [self.add_object(item) for item in value]
+            return _LIST, [self.encode(item) for item in value]
+        if isinstance(value, dict):
+            if all(isinstance(key, str) and self._is_schema_object(item) for key, item in value.items()):
+                return _REF_DICT, list(value.keys()), [self.add_object(item) for item in value.values()]
+            return _DICT, [(self.encode(key), self.encode(item)) for key, item in value.items()]
+        if isinstance(value, tuple):
+            return _TUPLE, [self.encode(item) for item in value]
+        raise TypeError(f"Cannot compile schema value of type '{type(value).__name__}'")
+
+    @staticmethod
+    def _is_schema_object(value):
+        return _SCHEMA_CLASSES.get(type(value).__name__) is type(value)
+
+    @classmethod
+    def _is_plain(cls, value):
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return True
+        if type(value) in (list, tuple):
+            return all(cls._is_plain(item) for item in value)
+        if type(value) is dict:
+            return all(cls._is_plain(key) and cls._is_plain(item) for key, item in value.items())
+        return False
+
+
+class _SchemaDecoder:
+    """ Rebuilds the schema objects from the list written by _SchemaEncoder. """
+
+    def __init__(self, objects):
+        self._states = [state for _, state in objects]
+        self._objects = [_SCHEMA_CLASSES[class_name].__new__(_SCHEMA_CLASSES[class_name])
+                         for class_name, _ in objects]
+
+    def decode_all(self):
+        for obj, state in zip(self._objects, self._states):
+            obj.__dict__.update({key: self.decode(value) for key, value in state.items()})
+        return self._objects[0]
+
+    def decode(self, value):
+        if type(value) is not tuple:
+            return value
+        tag = value[0]
+        if tag == _REF:
+            return self._objects[value[1]]
+        if tag == _REF_LIST:
+            return list(map(self._objects.__getitem__, value[1]))
+        if tag == _REF_DICT:
+            return dict(zip(value[1], map(self._objects.__getitem__, value[2])))
+        if tag == _LIST:
+            return [self.decode(item) for item in value[1]]
+        if tag == _DICT:
+            return {self.decode(key): self.decode(item) for key, item in value[1]}
+        if tag == _TUPLE:
+            return tuple(self.decode(item) for item in value[1])
+        if tag == _PLAIN:
+            return value[1]
+        if tag == _SECTION_KEY:
+            return HedSectionKey(value[1])
+        if tag == _CLASS:
+            return _SCHEMA_CLASSES[value[1]]
+        raise ValueError(f"Unknown value tag '{tag}' in compiled schema")
+
+
+def save_compiled(hed_schema, filename):
+    """ Save a loaded schema in compiled form.
+
+    Parameters:
+        hed_schema (HedSchema): A fully loaded schema.
+        filename (str): The file to write.
+
+    :raises TypeError:
+        - The schema contains a value that cannot be compiled.
+    :raises OSError:
+        - The file cannot be written.
+    """
+    encoder = _SchemaEncoder()
+    encoder.add_object(hed_schema)
+    with open(filename, "wb") as fp:
+        fp.write(marshal.dumps((COMPILED_FORMAT_VERSION, encoder.objects)))
+
+
+def load_compiled(filename):
+    """ Load a schema saved with save_compiled.
+
+    Parameters:
+        filename (str): The compiled schema file.
+
+    Returns:
+        HedSchema: The loaded schema.
+
+    :raises HedFileError:
+        - The file cannot be read, is not a compiled schema, or was written by an incompatible version.
+    """
+    try:
+        with open(filename, "rb") as fp:
+            format_version, objects = marshal.loads(fp.read())
+        if format_version != COMPILED_FORMAT_VERSION or not objects or objects[0][0] != HedSchema.__name__:
+            raise ValueError("Incompatible compiled schema format")
+        hed_schema = _SchemaDecoder(objects).decode_all()
+        hed_schema.clear_tag_cache()
+        return hed_schema
+    except (OSError, EOFError, ValueError, TypeError, KeyError, IndexError) as e:
+        raise HedFileError(HedExceptions.CANNOT_PARSE_COMPILED, f"Cannot load compiled schema: {e}", filename)
@@ -0,0 +1,82 @@
+"""
+Pickle objects that refer to a HED schema without copying the schema.
+
+Parsed HED strings, tags and validation issues point into the schema they were created with.  Pickling them
+normally would copy the whole schema into every payload.  Here the schema, its sections and its entries are
+written as references and resolved against an equivalent schema when loading, which is how results are
+passed between worker processes that each hold their own copy of the same schema.
+"""
+import io
+import pickle
+
+
+def _schema_objects(hed_schema):
+    """ Yield a (key, object) pair for each schema object that is pickled by reference.
+
+    Parameters:
+        hed_schema (HedSchema or HedSchemaGroup or None): The schema whose objects are enumerated.
+
+    Yields:
+        tuple: A key that identifies the object in any copy of the schema, and the object itself.
+    """
+    if hed_schema is None:
+        return
+    yield ("schema",), hed_schema
+    for namespace in hed_schema.valid_prefixes:
+        schema = hed_schema.schema_for_namespace(namespace)
+        yield ("namespace", namespace), schema
+        for section_key, section in schema._sections.items():
+            yield ("section", namespace, section_key), section
+            for index, entry in enumerate(section.all_entries):
+                yield ("entry", namespace, section_key, index), entry
+
+
+class _SchemaPickler(pickle.Pickler):
+    def __init__(self, file, hed_schema):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._keys = {}
+        for key, obj in _schema_objects(hed_schema):
+            self._keys.setdefault(id(obj), key)
+
+    def persistent_id(self, obj):
+        return self._keys.get(id(obj))
+
+
+class _SchemaUnpickler(pickle.Unpickler):
+    def __init__(self, file, hed_schema):
+        super().__init__(file)
+        self._objects = dict(_schema_objects(hed_schema))
+
+    def persistent_load(self, pid):
+        return self._objects[tuple(pid)]
+
+
+def dumps(obj, hed_schema):
+    """ Pickle an object, writing references to hed_schema instead of its contents.
+
+    Parameters:
+        obj (object): The object to pickle.
+        hed_schema (HedSchema or HedSchemaGroup or None): The schema that obj may refer to.
+
+    Returns:
+        bytes: The pickled object.
+    """
+    buffer = io.BytesIO()
+    _SchemaPickler(buffer, hed_schema).dump(obj)
+    return buffer.getvalue()
+
+
+def loads(data, hed_schema):
+    """ Unpickle an object created by dumps, resolving schema references against hed_schema.
+
+    Parameters:
+        data (bytes): The pickled object.
+        hed_schema (HedSchema or HedSchemaGroup or None): A schema equivalent to the one passed to dumps.
+
+    Returns:
+        object: The unpickled object.
+
+    :raises KeyError:
+        - The data refers to a schema object that hed_schema does not have.
+    """
+    return _SchemaUnpickler(io.BytesIO(data), hed_schema).load()
@@ -0,0 +1,66 @@
+"""
+A bounded cache of tag resolutions for a schema.
+
+Every tag of every HED string is looked up in the schema, and most files use a small number of distinct tags.
+The cache maps a lowercase tag (without its namespace) to the entry it resolves to, where its remainder starts,
+and the error found if any, so the slash by slash search is only done once per distinct tag.
+"""
+from collections import OrderedDict
+
+DEFAULT_MAX_SIZE = 20000
+
+
+class TagResolutionCache:
+    """ Least recently used cache of tag resolutions for one schema. """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """ Create an empty cache.
+
+        Parameters:
+            max_size (int): The maximum number of tags to keep.  If 0, nothing is cached.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, working_tag):
+        """ Return the cached resolution of a tag.
+
+        Parameters:
+            working_tag (str): A lowercase tag without its namespace.
+
+        Returns:
+            tuple or None: The resolution added for this tag, or None if it is not cached.
+        """
+        resolution = self._entries.get(working_tag)
+        if resolution is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(working_tag)
+        return resolution
+
+    def add(self, working_tag, resolution):
+        """ Cache the resolution of a tag, removing the least recently used tag if full.
+
+        Parameters:
+            working_tag (str): A lowercase tag without its namespace.
+            resolution (tuple): The entry, remainder start and error found for this tag.
+        """
+        if self.max_size <= 0:
+            return
+        self._entries[working_tag] = resolution
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def cache_info(self):
+        """ Return the statistics of this cache.
+
+        Returns:
+            dict: The hits, misses, max_size and current size of the cache.
+        """
+        return {"hits": self.hits, "misses": self.misses, "max_size": self.max_size, "size": len(self._entries)}
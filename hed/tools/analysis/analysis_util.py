@@ -1,5 +1,6 @@
 """ Utilities for assembly, analysis, and searching. """
 
+import numpy as np
 import pandas as pd
 from hed.models.tabular_input import TabularInput
 from hed.tools.util.data_util import separate_values
@@ -7,6 +8,7 @@ from hed.models.hed_tag import HedTag
 from hed.models.hed_group import HedGroup
 from hed.models import df_util
 from hed.models import QueryParser
+from hed.models.expression_parser import SearchIndex
 
 
 def assemble_hed(data_input, sidecar, schema, columns_included=None, expand_defs=False):
@@ -98,13 +100,16 @@ def search_strings(hed_strings, queries, query_names=None):
     """
 
     expression_parsers, query_names = get_expression_parsers(queries, query_names=query_names)
-    df_factors = pd.DataFrame(0, index=range(len(hed_strings)), columns=query_names)
-    for parse_ind, parser in enumerate(expression_parsers):
-        for index, next_item in enumerate(hed_strings):
-            match = parser.search(next_item)
-            if match:
-                df_factors.at[index, query_names[parse_ind]] = 1
-    return df_factors
+    factors = np.zeros((len(hed_strings), len(query_names)), dtype=np.int64)
+    for index, next_item in enumerate(hed_strings):
+        if next_item is None:
+            continue
+        # Index each string once, and skip queries whose required tags it lacks.
+        search_index = SearchIndex(next_item)
+        for parse_ind, parser in enumerate(expression_parsers):
+            if parser.search(search_index):
+                factors[index, parse_ind] = 1
+    return pd.DataFrame(factors, index=range(len(hed_strings)), columns=query_names)
 
 # def get_assembled_strings(table, hed_schema=None, expand_defs=False):
 #     """ Return HED string objects for a tabular file.
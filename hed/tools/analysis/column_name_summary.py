@@ -25,6 +25,26 @@ class ColumnNameSummary:
         self.unique_headers.append(column_names)
         return len(self.unique_headers) - 1
 
+    def to_dict(self):
+        """ Return the contents of this summary in a form that can be saved as JSON. """
+        return {'name': self.name, 'file_dict': self.file_dict, 'unique_headers': self.unique_headers}
+
+    @staticmethod
+    def from_dict(summary_dict):
+        """ Create a ColumnNameSummary from the dictionary returned by to_dict.
+
+        Parameters:
+            summary_dict (dict):  The contents of a ColumnNameSummary.
+
+        Returns:
+            ColumnNameSummary:  A summary with the same contents.
+
+        """
+        summary = ColumnNameSummary(name=summary_dict['name'])
+        summary.file_dict = {name: int(position) for name, position in summary_dict['file_dict'].items()}
+        summary.unique_headers = [list(headers) for headers in summary_dict['unique_headers']]
+        return summary
+
     def get_summary(self, as_json=False):
         patterns = [list() for _ in self.unique_headers]
         for key, value in self.file_dict.items():
@@ -3,6 +3,7 @@
 from hed.models import HedString
 from hed.models.model_constants import DefTagNames
 from hed.models.df_util import get_assembled
+from hed.models.hed_string_cache import get_hed_string
 from hed.models.string_util import split_base_tags, split_def_tags
 from hed.tools.analysis.temporal_event import TemporalEvent
 from hed.tools.analysis.hed_type_defs import HedTypeDefs
@@ -106,35 +107,84 @@ class EventManager:
         new_base = [placeholder for _ in range(len(self.hed_strings))]
         new_contexts = [placeholder for _ in range(len(self.hed_strings))]
         base, contexts = self._expand_context()
+        processed = {}  # Rows with identical strings (for example the rows of one context segment) share results.
         for index, item in enumerate(self.hed_strings):
-            new_hed[index] = self._process_hed(item, remove_types=remove_types,
-                                               remove_defs=remove_defs, remove_group=False)
-            new_base[index] = self._process_hed(base[index], remove_types=remove_types,
-                                                remove_defs=remove_defs, remove_group=True)
-            new_contexts[index] = self._process_hed(contexts[index], remove_types=remove_types,
-                                                    remove_defs=remove_defs, remove_group=True)
+            new_hed[index] = self._process_hed_cached(item, processed, remove_types=remove_types,
+                                                      remove_defs=remove_defs, remove_group=False)
+            new_base[index] = self._process_hed_cached(base[index], processed, remove_types=remove_types,
+                                                       remove_defs=remove_defs, remove_group=True)
+            new_contexts[index] = self._process_hed_cached(contexts[index], processed, remove_types=remove_types,
+                                                           remove_defs=remove_defs, remove_group=True)
         return new_hed, new_base, new_contexts   # these are each a list of strings
 
     def _expand_context(self):
         """ Expands the onset and the ongoing context for additional processing.
 
+        Returns:
+            tuple:
+                - list: The comma-joined contents of the temporal events starting at each row.
+                - list: The comma-joined contents of the temporal events ongoing at each row.
+
+        Notes:
+            - The ongoing context only changes at rows where an event becomes ongoing or ends, so a sweep over
+              those change points builds each distinct context string once and the rows in between share it.
+
         """
         base = [[] for _ in range(len(self.hed_strings))]
-        contexts = [[] for _ in range(len(self.hed_strings))]
+        starts = {}  # Row at which events become ongoing -> list of (event number, contents)
+        ends = {}    # Row at which events stop being ongoing -> list of event numbers
+        event_number = 0
         for events in self.event_list:
             for event in events:
                 this_str = str(event.contents)
                 base[event.start_index].append(this_str)
-                for i in range(event.start_index + 1, event.end_index):
-                    contexts[i].append(this_str)
+                if event.end_index > event.start_index + 1:
+                    starts.setdefault(event.start_index + 1, []).append((event_number, this_str))
+                    ends.setdefault(event.end_index, []).append(event_number)
+                event_number += 1
+
+        contexts = ["" for _ in range(len(self.hed_strings))]
+        active = {}  # Ongoing events in order of their onsets.
+        change_points = sorted(set(starts).union(ends))
+        for position, change_point in enumerate(change_points):
+            for number in ends.get(change_point, []):
+                active.pop(number, None)
+            for number, this_str in starts.get(change_point, []):
+                active[number] = this_str
+            if not active:
+                continue
+            next_point = change_points[position + 1] if position + 1 < len(change_points) else len(contexts)
+            context = ",".join(active.values())
+            contexts[change_point:next_point] = [context] * (next_point - change_point)
+        return self.compress_strings(base), contexts
+
+    def _process_hed_cached(self, hed, processed, remove_types=[], remove_defs=[], remove_group=False):
+        """ Return the processed string for hed, reusing the result for an identical string processed earlier.
+
+        Parameters:
+            hed (HedString, str, or None): The HED to process.
+            processed (dict): Results of earlier calls keyed by the string and remove_group.
+            remove_types (list):  List of types to remove.
+            remove_defs (list): List of definition names to remove.
+            remove_group (bool): If true, remove the groups containing the removed tags.
 
-        return self.compress_strings(base), self.compress_strings(contexts)
+        Returns:
+            str: The processed HED string.
+
+        """
+        key = (str(hed) if hed else "", remove_group)
+        result = processed.get(key)
+        if result is None:
+            result = self._process_hed(key[0], remove_types=remove_types, remove_defs=remove_defs,
+                                       remove_group=remove_group)
+            processed[key] = result
+        return result
 
     def _process_hed(self, hed, remove_types=[], remove_defs=[], remove_group=False):
         if not hed:
             return ""
         # Reconvert even if hed is already a HedString to make sure a copy and expandable.
-        hed_obj = HedString(str(hed), hed_schema=self.hed_schema, def_dict=self.def_dict)
+        hed_obj = get_hed_string(str(hed), self.hed_schema, def_dict=self.def_dict)
         hed_obj, temp1 = split_base_tags(hed_obj, remove_types, remove_group=remove_group)
         if remove_defs:
             hed_obj, temp2 = split_def_tags(hed_obj, remove_defs, remove_group=remove_group)
@@ -1,6 +1,7 @@
 """ Counts of HED tags in a file's annotations. """
 
 import copy
+import numpy as np
 
 
 class HedTagCount:
@@ -16,10 +17,32 @@ class HedTagCount:
         self.tag = hed_tag.short_base_tag
         self.tag_terms = hed_tag.tag_terms
         self.events = 1
-        self.files = {file_name: ''}
+        self.files = {file_name: 1}  # Number of events with this tag in each file
         self.value_dict = {}
         self.set_value(hed_tag)
 
+    @classmethod
+    def from_counts(cls, tag, tag_terms, files, value_dict):
+        """ Create a HedTagCount from counts that have already been computed.
+
+        Parameters:
+            tag (str):  The short base tag.
+            tag_terms (tuple):  The terms of the tag.
+            files (dict):  The number of events with this tag keyed by file name.
+            value_dict (dict):  The number of occurrences of each value of the tag.
+
+        Returns:
+            HedTagCount: The counts for the tag.
+
+        """
+        tag_count = cls.__new__(cls)
+        tag_count.tag = tag
+        tag_count.tag_terms = tag_terms
+        tag_count.events = sum(files.values())
+        tag_count.files = files
+        tag_count.value_dict = value_dict
+        return tag_count
+
     def set_value(self, hed_tag):
         """ Update the tag term value counts for a HedTag.
 
@@ -68,13 +91,41 @@ class HedTagCounts:
         name (str):  An identifier for these counts (usually the filename of the tabular file)
         total_events (int):  The total number of events in the tabular file.
 
+    Notes:
+        - The counts are columnar: each distinct tag has an integer id, event_counts holds the number of
+          events containing each tag (columns) in each file (rows), and value_counts holds a histogram of
+          the values of each tag.
+        - Counts computed separately (for example for different files in different processes) are combined
+          with merge. The counts only hold strings, dicts, and numpy arrays, so they pickle compactly.
+
     """
 
     def __init__(self, name, total_events=0):
-        self.tag_dict = {}
         self.name = name
         self.files = {}
         self.total_events = total_events
+        self.tag_ids = {}  # Lower-case short base tag -> tag id
+        self.tags = []  # Short base tag and tag terms for each tag id
+        self.value_counts = []  # Histogram of the values of each tag id
+        self.file_ids = {}  # File name -> row of event_counts
+        self.event_counts = np.zeros((0, 0), dtype=np.int64)
+
+    @property
+    def tag_dict(self):
+        """ Return the counts of each tag keyed by the lower-case short base tag.
+
+        Returns:
+            dict: A HedTagCount for each tag in the order the tags were first counted.
+
+        """
+        file_names = list(self.file_ids.keys())
+        tag_dict = {}
+        for tag_key, tag_id in self.tag_ids.items():
+            column = self.event_counts[:, tag_id]
+            files = {file_names[row]: int(column[row]) for row in np.flatnonzero(column)}
+            tag, tag_terms = self.tags[tag_id]
+            tag_dict[tag_key] = HedTagCount.from_counts(tag, tag_terms, files, dict(self.value_counts[tag_id]))
+        return tag_dict
 
     def update_event_counts(self, hed_string_obj, file_name):
         """ Update the tag counts based on a hed string object.
@@ -83,21 +134,88 @@ class HedTagCounts:
             hed_string_obj (HedString): The HED string whose tags should be counted.
             file_name (str): The name of the file corresponding to these counts.
 
+        """
+        self.update_counts([hed_string_obj], file_name)
+
+    def update_counts(self, hed_objs, file_name):
+        """ Update the tag counts based on the HED string objects of the events of a file.
+
+        Parameters:
+            hed_objs (list): The HedString (or None) of each event whose tags should be counted.
+            file_name (str): The name of the file corresponding to these counts.
+
+        Notes:
+            - A tag is counted once for each event that contains it, while all of its values are counted.
+
         """
         if file_name not in self.files:
             self.files[file_name] = ""
-        if not hed_string_obj:
-            return
-        tag_list = hed_string_obj.get_all_tags()
-        tag_dict = {}
-        for tag in tag_list:
-            str_tag = tag.short_base_tag.lower()
-            if str_tag not in tag_dict:
-                tag_dict[str_tag] = HedTagCount(tag, file_name)
-            else:
-                tag_dict[str_tag].set_value(tag)
+        file_id = self._get_file_id(file_name)
+        event_tag_ids = []
+        for hed_string_obj in hed_objs:
+            if not hed_string_obj:
+                continue
+            tag_ids = set()
+            for tag in hed_string_obj.get_all_tags():
+                tag_id = self._get_tag_id(tag.short_base_tag, tag.tag_terms)
+                tag_ids.add(tag_id)
+                value = tag.extension if tag.extension else None
+                self.value_counts[tag_id][value] = self.value_counts[tag_id].get(value, 0) + 1
+            event_tag_ids.extend(tag_ids)
+        self._resize()
+        if event_tag_ids:
+            self.event_counts[file_id] += np.bincount(event_tag_ids, minlength=len(self.tags))
+
+    def merge(self, other):
+        """ Add the counts, files, and events of another HedTagCounts to these counts.
+
+        Parameters:
+            other (HedTagCounts): The counts to add.
+
+        """
+        tag_map = np.array([self._get_tag_id(tag, tag_terms) for tag, tag_terms in other.tags], dtype=np.intp)
+        file_map = np.array([self._get_file_id(file_name) for file_name in other.file_ids], dtype=np.intp)
+        self._resize()
+        self.event_counts[np.ix_(file_map, tag_map)] += other.event_counts
+        for tag_id, value_counts in zip(tag_map, other.value_counts):
+            self._merge_values(tag_id, value_counts)
+        for file_name in other.files:
+            self.files[file_name] = ""
+        self.total_events = self.total_events + other.total_events
+
+    def to_dict(self):
+        """ Return the counts in a form that can be saved as JSON. """
+        return {'name': self.name, 'files': list(self.files), 'total_events': int(self.total_events),
+                'tags': [[tag, list(tag_terms)] for tag, tag_terms in self.tags],
+                'value_counts': [[[value, int(count)] for value, count in value_counts.items()]
+                                 for value_counts in self.value_counts],
+                'file_names': list(self.file_ids), 'event_counts': self.event_counts.tolist()}
+
+    @staticmethod
+    def from_dict(count_dict):
+        """ Create a HedTagCounts from the dictionary returned by to_dict.
 
-        self.merge_tag_dicts(tag_dict)
+        Parameters:
+            count_dict (dict):  The contents of a HedTagCounts.
+
+        Returns:
+            HedTagCounts:  Counts with the same contents.
+
+        :raises ValueError:
+            - If the event counts do not have a row for each file and a column for each tag.
+
+        """
+        counts = HedTagCounts(count_dict['name'], total_events=count_dict['total_events'])
+        counts.files = dict.fromkeys(count_dict['files'], '')
+        for (tag, tag_terms), value_counts in zip(count_dict['tags'], count_dict['value_counts']):
+            tag_id = counts._get_tag_id(tag, tuple(tag_terms))
+            counts._merge_values(tag_id, dict((value, count) for value, count in value_counts))
+        for file_name in count_dict['file_names']:
+            counts._get_file_id(file_name)
+        shape = (len(counts.file_ids), len(counts.tags))
+        event_counts = np.array(count_dict['event_counts'], dtype=np.int64)
+        counts.event_counts = event_counts.reshape(shape) if event_counts.size else np.zeros(shape, dtype=np.int64)
+        return counts
 
     def organize_tags(self, tag_template):
         """ Organize tags into categories as specified by the tag_template.
@@ -117,19 +235,62 @@ class HedTagCounts:
         return template, unmatched
 
     def merge_tag_dicts(self, other_dict):
-        for tag, count in other_dict.items():
-            if tag not in self.tag_dict:
-                self.tag_dict[tag] = count.get_empty()
-            self.tag_dict[tag].events = self.tag_dict[tag].events + count.events
-            for file in count.files:
-                self.tag_dict[tag].files[file] = ''
-            if not self.tag_dict[tag].value_dict:
-                continue
-            for value, val_count in count.value_dict.items():
-                if value in self.tag_dict[tag].value_dict:
-                    self.tag_dict[tag].value_dict[value] = self.tag_dict[tag].value_dict + val_count
-                else:
-                    self.tag_dict[tag].value_dict[value] = val_count
+        """ Add the counts in a dictionary of HedTagCount to these counts.
+
+        Parameters:
+            other_dict (dict): HedTagCount values keyed by lower-case short base tag.
+
+        Notes:
+            - Unlike merge, this does not add the files or events of the other counts.
+
+        """
+        updates = []
+        for count in other_dict.values():
+            tag_id = self._get_tag_id(count.tag, count.tag_terms)
+            self._merge_values(tag_id, count.value_dict)
+            updates.extend((self._get_file_id(file), tag_id, events) for file, events in count.files.items())
+        self._resize()
+        for file_id, tag_id, events in updates:
+            self.event_counts[file_id, tag_id] += events
+
+    def _get_tag_id(self, tag, tag_terms):
+        """ Return the id of a tag, assigning the next id if the tag has not been counted before.
+
+        Parameters:
+            tag (str):  The short base tag.
+            tag_terms (tuple):  The terms of the tag.
+
+        Returns:
+            int: The id of the tag.
+
+        """
+        tag_key = tag.lower()
+        tag_id = self.tag_ids.get(tag_key)
+        if tag_id is None:
+            tag_id = len(self.tags)
+            self.tag_ids[tag_key] = tag_id
+            self.tags.append((tag, tag_terms))
+            self.value_counts.append({})
+        return tag_id
+
+    def _get_file_id(self, file_name):
+        file_id = self.file_ids.get(file_name)
+        if file_id is None:
+            file_id = len(self.file_ids)
+            self.file_ids[file_name] = file_id
+        return file_id
+
+    def _merge_values(self, tag_id, value_counts):
+        counts = self.value_counts[tag_id]
+        for value, count in value_counts.items():
+            counts[value] = counts.get(value, 0) + count
+
+    def _resize(self):
+        """ Grow event_counts with zeros to have a row for each file and a column for each tag. """
+        rows, columns = self.event_counts.shape
+        if rows < len(self.file_ids) or columns < len(self.tags):
+            self.event_counts = np.pad(self.event_counts,
+                                       ((0, len(self.file_ids) - rows), (0, len(self.tags) - columns)))
 
     def get_summary(self):
         details = {}
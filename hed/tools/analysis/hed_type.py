@@ -75,12 +75,13 @@ class HedType:
             summary[var_name] = var_sum.get_summary()
         return summary
 
-    def get_type_factors(self, type_values=None, factor_encoding="one-hot"):
+    def get_type_factors(self, type_values=None, factor_encoding="one-hot", sparse=False):
         """ Create a dataframe with the indicated type tag values as factors.
 
         Parameters:
             type_values (list or None): A list of values of type tags for which to generate factors.
             factor_encoding (str):      Type of factor encoding (one-hot or categorical).
+            sparse (bool):              If true, the one-hot factor columns are returned as sparse columns.
 
         Returns:
             DataFrame:  Contains the specified factors associated with this type tag.
@@ -94,7 +95,7 @@ class HedType:
             var_sum = self._type_map.get(type_value, None)
             if not var_sum:
                 continue
-            df_list.append(var_sum.get_factors(factor_encoding=factor_encoding))
+            df_list.append(var_sum.get_factors(factor_encoding=factor_encoding, sparse=sparse))
         if not df_list:
             return None
         else:
@@ -142,6 +142,30 @@ class HedTypeCounts:
         for file_id in counts.files.keys():
             self.files[file_id] = ''
 
+    def to_dict(self):
+        """ Return the counts in a form that can be saved as JSON. """
+        return {'name': self.name, 'type_tag': self.type_tag, 'files': list(self.files),
+                'total_events': self.total_events, 'type_dict': [count.to_dict() for count in self.type_dict.values()]}
+
+    @staticmethod
+    def from_dict(count_dict):
+        """ Create a HedTypeCounts from the dictionary returned by to_dict.
+
+        Parameters:
+            count_dict (dict):  The contents of a HedTypeCounts.
+
+        Returns:
+            HedTypeCounts:  Counts with the same contents.
+
+        """
+        counts = HedTypeCounts(count_dict['name'], count_dict['type_tag'])
+        counts.files = dict.fromkeys(count_dict['files'], '')
+        counts.total_events = count_dict['total_events']
+        for type_count in count_dict['type_dict']:
+            counts.type_dict[type_count['type_value']] = HedTypeCount(type_count['type_value'], type_count['type_tag'])
+            counts.type_dict[type_count['type_value']].update(type_count, None)
+        return counts
+
     def get_summary(self):
         details = {}
         for type_value, count in self.type_dict.items():
@@ -1,5 +1,6 @@
 """ Manages factor information for a tabular file. """
 
+import numpy as np
 import pandas as pd
 from hed.errors.exceptions import HedFileError
 
@@ -29,52 +30,101 @@ class HedTypeFactors:
         return f"[{self.type_value},{self.type_tag}]: {self.number_elements} elements " + \
             f"{str(self.levels)} levels {len(self.direct_indices)} references"
 
-    def get_factors(self, factor_encoding="one-hot"):
+    def get_factors(self, factor_encoding="one-hot", sparse=False):
         """ Return a DataFrame of factor vectors for this type factor.
 
         Parameters:
             factor_encoding (str):   Specifies type of factor encoding (one-hot or categorical).
+            sparse (bool):           If true, the one-hot factor columns are returned as sparse columns.
 
         Returns:
             DataFrame:   DataFrame containing the factor vectors as the columns.
 
+        Notes:
+            - Sparse columns have a pandas SparseDtype with fill value 0 and are useful for designs with many levels.
+
         """
 
         if not self.levels:
-            df = pd.DataFrame(0, index=range(self.number_elements), columns=[self.type_value])
-            df.loc[list(self.direct_indices.keys()), [self.type_value]] = 1
-            return df
+            return self._make_factors([self.type_value], [self.direct_indices], sparse)
 
         levels = list(self.levels.keys())
         levels_list = [f"{self.type_value}.{level}" for level in levels]
-        factors = pd.DataFrame(0, index=range(self.number_elements), columns=levels_list)
-        for index, level in enumerate(levels):
-            index_keys = list(self.levels[level].keys())
-            factors.loc[index_keys, [levels_list[index]]] = 1
+        level_indices = [self.levels[level] for level in levels]
         if factor_encoding == "one-hot":
-            return factors
-        sum_factors = factors.sum(axis=1)
-        if factor_encoding == "categorical" and sum_factors.max() > 1:
+            return self._make_factors(levels_list, level_indices, sparse)
+        factors = pd.DataFrame(self._make_matrix(level_indices), columns=levels_list)
+        sum_factors = factors.to_numpy().sum(axis=1)
+        if factor_encoding == "categorical" and len(sum_factors) and sum_factors.max() > 1:
             raise HedFileError("MultipleFactorSameEvent",
-                               f"{self.type_value} has multiple occurrences at index {sum_factors.idxmax()}", "")
+                               f"{self.type_value} has multiple occurrences at index {sum_factors.argmax()}", "")
         elif factor_encoding == "categorical":
             return self._one_hot_to_categorical(factors, levels)
         else:
             raise ValueError("BadFactorEncoding",
                              f"{factor_encoding} is not in the allowed encodings: {str(self.ALLOWED_ENCODINGS)}")
 
+    def _make_factors(self, columns, column_indices, sparse=False):
+        """ Return a DataFrame of one-hot factor columns.
+
+        Parameters:
+            columns (list):         The names of the factor columns.
+            column_indices (list):  For each column, a dict or list of the positions that have value 1.
+            sparse (bool):          If true, the columns are sparse with fill value 0.
+
+        Returns:
+            DataFrame:   DataFrame containing the factor vectors as the columns.
+
+        """
+        if not sparse:
+            return pd.DataFrame(self._make_matrix(column_indices), columns=columns)
+        factors = {}
+        for column, indices in zip(columns, column_indices):
+            values = np.zeros(self.number_elements, dtype=np.int64)
+            values[self._get_positions(indices)] = 1
+            factors[column] = pd.arrays.SparseArray(values, fill_value=0)
+        return pd.DataFrame(factors, index=range(self.number_elements), columns=columns)
+
+    def _make_matrix(self, column_indices):
+        """ Return a dense one-hot matrix with a row for each element and a column for each set of positions.
+
+        Parameters:
+            column_indices (list):  For each column, a dict or list of the positions that have value 1.
+
+        Returns:
+            numpy.ndarray:  The number_elements x len(column_indices) matrix of 0's and 1's.
+
+        """
+        factors = np.zeros((self.number_elements, len(column_indices)), dtype=np.int64)
+        for column, indices in enumerate(column_indices):
+            factors[self._get_positions(indices), column] = 1
+        return factors
+
+    @staticmethod
+    def _get_positions(indices):
+        return np.fromiter(indices, dtype=np.intp, count=len(indices))
+
     def _one_hot_to_categorical(self, factors, levels):
-        df = pd.DataFrame('n/a', index=range(len(factors.index)), columns=[self.type_value])
-        for index, row in factors.iterrows():
-            if self.type_value in row.index and row[self.type_value]:
-                df.at[index, self.type_value] = self.type_value
-                continue
-            for level in levels:
-                level_str = f"{self.type_value}.{level.lower()}"
-                if level_str in row.index and row[level_str]:
-                    df.at[index, self.type_value] = level.lower()
-                    break
-        return df
+        """ Return a categorical column from one-hot factors.
+
+        Parameters:
+            factors (DataFrame):  The one-hot factors with columns named type_value or type_value.level.
+            levels (list):        The levels to look for in the columns of factors.
+
+        Returns:
+            DataFrame:  A DataFrame whose single column has the first level set in each row or n/a if none is.
+
+        """
+        candidates = [(self.type_value, self.type_value)] + \
+                     [(f"{self.type_value}.{level.lower()}", level.lower()) for level in levels]
+        candidates = [(column, value) for column, value in candidates if column in factors.columns]
+        values = np.full(len(factors.index), 'n/a', dtype=object)
+        if candidates:
+            is_set = factors[[column for column, _ in candidates]].to_numpy() != 0
+            has_level = is_set.any(axis=1)
+            labels = np.array([value for _, value in candidates], dtype=object)
+            values[has_level] = labels[is_set.argmax(axis=1)[has_level]]
+        return pd.DataFrame({self.type_value: values}, index=range(len(values)))
 
     def get_summary(self):
         count_list = [0] * self.number_elements
@@ -31,13 +31,14 @@ class HedTypeManager:
         self._type_map[type_name.lower()] = \
             HedType(self.event_manager, 'run-01', type_tag=type_name)
 
-    def get_factor_vectors(self, type_tag, type_values=None, factor_encoding="one-hot"):
+    def get_factor_vectors(self, type_tag, type_values=None, factor_encoding="one-hot", sparse=False):
         """ Return a DataFrame of factor vectors for the indicated HED tag and values
 
         Parameters:
             type_tag (str):    HED tag to retrieve factors for.
             type_values (list or None):  The values of the tag to create factors for or None if all unique values.
             factor_encoding (str):   Specifies type of factor encoding (one-hot or categorical).
+            sparse (bool):           If true, the one-hot factor columns are returned as sparse columns.
 
         Returns:
             DataFrame or None:   DataFrame containing the factor vectors as the columns.
@@ -52,7 +53,7 @@ class HedTypeManager:
         df_list = [0]*len(type_values)
         for index, variable in enumerate(type_values):
             var_sum = this_var._type_map[variable]
-            df_list[index] = var_sum.get_factors(factor_encoding=factor_encoding)
+            df_list[index] = var_sum.get_factors(factor_encoding=factor_encoding, sparse=sparse)
         if not df_list:
             return None
         return pd.concat(df_list, axis=1)
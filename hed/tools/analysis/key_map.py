@@ -1,9 +1,10 @@
 """ A map of column value keys into new column values. """
 
 
+import numpy as np
 import pandas as pd
 from hed.errors.exceptions import HedFileError
-from hed.tools.util.data_util import get_new_dataframe, get_row_hash, separate_values
+from hed.tools.util.data_util import get_new_dataframe, get_key_hash, separate_values
 
 
 class KeyMap:
@@ -49,9 +50,8 @@ class KeyMap:
 
     def __str__(self):
         temp_list = [f"{self.name} counts for key [{str(self.key_cols)}]:"]
-        for index, row in self.col_map.iterrows():
-            key_hash = get_row_hash(row, self.columns)
-            temp_list.append(f"{str(list(row.values))}:\t{self.count_dict[key_hash]}")
+        for row, count in zip(self.col_map.to_numpy(dtype=object), self._get_counts()):
+            temp_list.append(f"{str(list(row))}:\t{count}")
         return "\n".join(temp_list)
 
     def make_template(self, additional_cols=None, show_counts=True):
@@ -82,11 +82,50 @@ class KeyMap:
         return df
 
     def _get_counts(self):
-        counts = [0 for _ in range(len(self.col_map))]
-        for index, row in self.col_map.iterrows():
-            key_hash = get_row_hash(row, self.key_cols)
-            counts[index] = self.count_dict[key_hash]
-        return counts
+        return [self.count_dict[key_hash] for key_hash in self._get_key_hashes(self.col_map)]
+
+    def _get_key_frame(self, df):
+        """ Return the key columns of a dataframe as strings with n/a for missing values.
+
+        Parameters:
+            df (DataFrame):  DataFrame containing the key columns.
+
+        Returns:
+            DataFrame:  The key columns as strings.
+
+        Notes:
+            - These are the same strings that get_row_hash uses for the keys of map_dict and count_dict.
+
+        """
+        return df[self.key_cols].fillna('n/a').astype(str)
+
+    def _get_key_hashes(self, df):
+        """ Return the map_dict key of each row of a dataframe.
+
+        Parameters:
+            df (DataFrame):  DataFrame containing the key columns.
+
+        Returns:
+            list:  The key hash of each row in order.
+
+        """
+        return [get_key_hash(key) for key in self._get_key_frame(df).itertuples(index=False, name=None)]
+
+    def _get_positions(self, df):
+        """ Return the position in col_map of the key of each row of a dataframe.
+
+        Parameters:
+            df (DataFrame):  DataFrame containing the key columns.
+
+        Returns:
+            numpy.ndarray:  The position in col_map of each row or -1 if the row's key is not in the map.
+
+        Notes:
+            - The rows are joined to the map on their key values in one hashed lookup rather than row by row.
+
+        """
+        map_keys = pd.MultiIndex.from_frame(self._get_key_frame(self.col_map))
+        return map_keys.get_indexer(pd.MultiIndex.from_frame(self._get_key_frame(df)))
 
     def remap(self, data):
         """ Remap the columns of a dataframe or columnar file.
@@ -114,7 +153,7 @@ class KeyMap:
         return df_new, missing_indices
 
     def _remap(self, df):
-        """ Utility method that iterates through dataframes to do the remapping.
+        """ Utility method that joins the dataframe to the map to do the remapping.
 
         Parameters:
             df (DataFrame):    DataFrame in which to perform the mapping.
@@ -124,24 +163,20 @@ class KeyMap:
 
         """
 
-        missing_indices = []
-        for index, row in df.iterrows():
-            key = get_row_hash(row, self.key_cols)
-            key_value = self.map_dict.get(key, None)
-            if key_value is not None:
-                result = self.col_map.iloc[key_value]
-                row[self.target_cols] = result[self.target_cols].values
-                df.iloc[index] = row
-            else:
-                missing_indices.append(index)
-        return missing_indices
+        positions = self._get_positions(df)
+        found = positions >= 0
+        if self.target_cols and found.any():
+            targets = self.col_map[self.target_cols].to_numpy(dtype=object)[positions[found]]
+            for index, col in enumerate(self.target_cols):
+                values = df[col].to_numpy(dtype=object, copy=True)
+                values[found] = targets[:, index]
+                df[col] = values
+        return np.flatnonzero(~found).tolist()
 
     def resort(self):
         """ Sort the col_map in place by the key columns. """
         self.col_map.sort_values(by=self.key_cols, inplace=True, ignore_index=True)
-        for index, row in self.col_map.iterrows():
-            key_hash = get_row_hash(row, self.key_cols)
-            self.map_dict[key_hash] = index
+        self.map_dict = dict(zip(self._get_key_hashes(self.col_map), range(len(self.col_map))))
 
     def update(self, data, allow_missing=True):
         """ Update the existing map with information from data.
@@ -180,37 +215,24 @@ class KeyMap:
 
         """
 
-        row_list = []
+        if base_df.empty:
+            return
+        codes, unique_keys = pd.MultiIndex.from_frame(self._get_key_frame(base_df)).factorize()
+        counts = np.bincount(codes)
+        first_rows = np.unique(codes, return_index=True)[1]
+        new_rows = []
         next_pos = len(self.col_map)
-        for index, row in base_df.iterrows():
-            key, pos_update = self._handle_update(row, row_list, next_pos)
-            next_pos += pos_update
-        if row_list:
-            df = pd.DataFrame(row_list)
+        for code, key in enumerate(unique_keys):
+            key_hash = get_key_hash(key)
+            if key_hash not in self.map_dict:
+                self.map_dict[key_hash] = next_pos + len(new_rows)
+                self.count_dict[key_hash] = 0
+                new_rows.append(first_rows[code])
+            self.count_dict[key_hash] = self.count_dict[key_hash] + int(counts[code])
+        if new_rows:
+            df = base_df.iloc[new_rows][self.columns].astype(object)
             self.col_map = pd.concat([self.col_map, df], axis=0, ignore_index=True)
 
-    def _handle_update(self, row, row_list, next_pos):
-        """ Update the dictionary and counts of the number of times this combination of key columns appears.
-
-        Parameters:
-            row (DataSeries):  Data the values in a row.
-            row_list (list):   A list of rows to be appended to hold the unique rows
-            next_pos (int):    Index into the
-
-        Returns:
-            tuple: (key, pos_update)  key is the row hash and pos_update is 1 if new row or 0 otherwise.
-
-        """
-        key = get_row_hash(row, self.key_cols)
-        pos_update = 0
-        if key not in self.map_dict:
-            self.map_dict[key] = next_pos
-            row_list.append(row)
-            pos_update = 1
-            self.count_dict[key] = 0
-        self.count_dict[key] = self.count_dict[key] + 1
-        return key, pos_update
-
     @staticmethod
     def remove_quotes(df, columns=None):
         """ Remove quotes from the specified columns and convert to string.
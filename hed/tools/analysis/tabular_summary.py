@@ -2,6 +2,7 @@
 
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from hed.errors.exceptions import HedFileError
 from hed.tools.util.data_util import get_new_dataframe
 from hed.tools.analysis.annotation_util import generate_sidecar_entry
@@ -89,6 +90,40 @@ class TabularSummary:
         else:
             return summary
 
+    def to_dict(self):
+        """ Return the contents of this summary in a form that can be saved as JSON.
+
+        Notes:
+            - Unlike get_summary, the columns and values are kept in the order they were first seen.
+
+        """
+        categorical_info = {column: {value: [int(count) for count in counts] for value, counts in values.items()}
+                            for column, values in self.categorical_info.items()}
+        value_info = {column: [int(count) for count in counts] for column, counts in self.value_info.items()}
+        return {'name': self.name, 'categorical_info': categorical_info, 'value_info': value_info,
+                'skip_cols': self.skip_cols, 'total_files': int(self.total_files),
+                'total_events': int(self.total_events), 'files': list(self.files)}
+
+    @staticmethod
+    def from_dict(summary_dict):
+        """ Create a TabularSummary from the dictionary returned by to_dict.
+
+        Parameters:
+            summary_dict (dict):  The contents of a TabularSummary.
+
+        Returns:
+            TabularSummary:  A summary with the same contents.
+
+        """
+        new_tab = TabularSummary(skip_cols=list(summary_dict['skip_cols']), name=summary_dict['name'])
+        new_tab.categorical_info = {column: {value: list(counts) for value, counts in values.items()}
+                                    for column, values in summary_dict['categorical_info'].items()}
+        new_tab.value_info = {column: list(counts) for column, counts in summary_dict['value_info'].items()}
+        new_tab.total_files = summary_dict['total_files']
+        new_tab.total_events = summary_dict['total_events']
+        new_tab.files = dict.fromkeys(summary_dict['files'], '')
+        return new_tab
+
     def get_number_unique(self, column_names=None):
         """ Return the number of unique values in columns.
 
@@ -109,18 +144,25 @@ class TabularSummary:
                 counts[column_name] = len(self.categorical_info[column_name].keys())
         return counts
 
-    def update(self, data, name=None):
+    def update(self, data, name=None, max_workers=None):
         """ Update the counts based on data.
 
         Parameters:
             data (DataFrame, str, or list):    DataFrame containing data to update.
             name (str): Name of the summary
+            max_workers (int or None):  The number of threads reading a list of files (None uses the
+                                        ThreadPoolExecutor default).
+
+        Notes:
+            - The files in a list are read and summarized concurrently into partial summaries, which are
+              combined in the order of the list. The result is the same as updating with the files one at a time.
 
         """
 
         if isinstance(data, list):
-            for filename in data:
-                self._update_dataframe(filename, filename)
+            for partial in self.summarize_files(data, value_cols=list(self.value_info.keys()),
+                                                skip_cols=self.skip_cols, max_workers=max_workers):
+                self.update_summary(partial)
         elif isinstance(data, str):
             self._update_dataframe(data, data)
         else:
@@ -262,12 +304,46 @@ class TabularSummary:
         return col_info
 
     @staticmethod
-    def make_combined_dicts(file_dictionary, skip_cols=None):
+    def summarize_files(file_list, value_cols=None, skip_cols=None, names=None, max_workers=None):
+        """ Summarize each file in a list separately, reading the files concurrently.
+
+        Parameters:
+            file_list (list):  Paths of the tabular files.
+            value_cols (list, None):  List of columns to be treated as value columns.
+            skip_cols (list, None):   List of columns to be skipped.
+            names (list, None):  The name recorded in the files of each summary or None to use the paths.
+            max_workers (int or None):  The number of threads reading files (None uses the ThreadPoolExecutor default).
+
+        Returns:
+            generator: The TabularSummary of each file in the order of file_list.
+
+        Notes:
+            - The per-file summaries can be combined with update_summary in any grouping (for example pairwise
+              in a tree) and give the same result as combining them in order.
+
+        """
+        if names is None:
+            names = file_list
+
+        def summarize(file_path, name):
+            summary = TabularSummary(value_cols=value_cols, skip_cols=skip_cols)
+            summary._update_dataframe(file_path, name)
+            return summary
+
+        if len(file_list) < 2:
+            yield from map(summarize, file_list, names)
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            yield from pool.map(summarize, file_list, names)
+
+    @staticmethod
+    def make_combined_dicts(file_dictionary, skip_cols=None, max_workers=None):
         """ Return combined and individual summaries.
 
         Parameters:
             file_dictionary (FileDictionary):  Dictionary of file name keys and full path.
             skip_cols (list):  Name of the column.
+            max_workers (int or None):  The number of threads reading files (None uses the ThreadPoolExecutor default).
 
         Returns:
             tuple:
@@ -278,10 +354,13 @@ class TabularSummary:
 
         summary_all = TabularSummary(skip_cols=skip_cols)
         summary_dict = {}
+        keys, file_paths = [], []
         for key, file_path in file_dictionary.items():
-            orig_dict = TabularSummary(skip_cols=skip_cols)
-            df = get_new_dataframe(file_path)
-            orig_dict.update(df)
+            keys.append(key)
+            file_paths.append(file_path)
+        file_summaries = TabularSummary.summarize_files(file_paths, skip_cols=skip_cols, names=[None] * len(keys),
+                                                        max_workers=max_workers)
+        for key, orig_dict in zip(keys, file_summaries):
             summary_dict[key] = orig_dict
             summary_all.update_summary(orig_dict)
         return summary_all, summary_dict
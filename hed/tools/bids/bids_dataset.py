@@ -6,6 +6,7 @@ from hed.schema.hed_schema import HedSchema
 from hed.schema.hed_schema_io import load_schema_version
 from hed.schema.hed_schema_group import HedSchemaGroup
 from hed.tools.bids.bids_file_group import BidsFileGroup
+from hed.tools.bids.bids_file_index import BidsFileIndex
 
 
 LIBRARY_URL_BASE = "https://raw.githubusercontent.com/hed-standard/hed-schemas/main/library_schemas/"
@@ -18,11 +19,12 @@ class BidsDataset:
         root_path (str):  Real root path of the BIDS dataset.  
         schema (HedSchema or HedSchemaGroup):  The schema used for evaluation.  
         tabular_files (dict):  A dictionary of BidsTabularDictionary objects containing a given type.  
+        file_index (BidsFileIndex):  The files of the dataset, shared by the file groups.
 
     """
 
     def __init__(self, root_path, schema=None, tabular_types=None,
-                 exclude_dirs=['sourcedata', 'derivatives', 'code', 'stimuli']):
+                 exclude_dirs=['sourcedata', 'derivatives', 'code', 'stimuli'], index_path=None):
         """ Constructor for a BIDS dataset.
 
         Parameters:
@@ -31,6 +33,8 @@ class BidsDataset:
             tabular_types (list or None):  List of strings specifying types of tabular types to include.
                 If None or empty, then ['events'] is assumed.
             exclude_dirs=['sourcedata', 'derivatives', 'code']:
+            index_path (str or None):  If given, the list of files is saved in this file and reused for the
+                directories that have not changed the next time.
 
         """
         self.root_path = os.path.realpath(root_path)
@@ -42,14 +46,20 @@ class BidsDataset:
             self.schema = load_schema_version(self.dataset_description.get("HEDVersion", None))
 
         self.exclude_dirs = exclude_dirs
-        self.tabular_files = {"participants": BidsFileGroup(root_path, suffix="participants", obj_type="tabular")}
+        # The participants group keeps the default exclusions, so the index only leaves out the directories
+        # excluded from all the groups.
+        participants_exclude_dirs = ['sourcedata', 'derivatives', 'code', 'stimuli']
+        index_exclude_dirs = [name for name in exclude_dirs if name in participants_exclude_dirs] \
+            if exclude_dirs else []
+        self.file_index = BidsFileIndex(self.root_path, exclude_dirs=index_exclude_dirs, index_path=index_path)
+        self.tabular_files = {"participants": BidsFileGroup(root_path, suffix="participants", obj_type="tabular",
+                                                            exclude_dirs=participants_exclude_dirs,
+                                                            file_index=self.file_index)}
         if not tabular_types:
-            self.tabular_files["events"] = BidsFileGroup(root_path, suffix="events", obj_type="tabular",
-                                                         exclude_dirs=exclude_dirs)
-        else:
-            for suffix in tabular_types:
-                self.tabular_files[suffix] = BidsFileGroup(root_path, suffix=suffix, obj_type="tabular",
-                                                           exclude_dirs=exclude_dirs)
+            tabular_types = ["events"]
+        for suffix in tabular_types:
+            self.tabular_files[suffix] = BidsFileGroup(root_path, suffix=suffix, obj_type="tabular",
+                                                       exclude_dirs=exclude_dirs, file_index=self.file_index)
 
     def get_tabular_group(self, obj_type="events"):
         """ Return the specified tabular file group.
@@ -66,12 +76,13 @@ class BidsDataset:
         else:
             return None
 
-    def validate(self, types=None, check_for_warnings=True):
+    def validate(self, types=None, check_for_warnings=True, workers=None):
         """ Validate the specified file group types.
 
         Parameters:
             types (list):  A list of strings indicating the file group types to be validated.
             check_for_warnings (bool):  If True, check for warnings.
+            workers (int or None):  If greater than 1, validate the data files in this many worker processes.
 
         Returns:
             list:  List of issues encountered during validation. Each issue is a dictionary.
@@ -84,7 +95,7 @@ class BidsDataset:
         for tab_type in types:
             files = self.tabular_files[tab_type]
             issues += files.validate_sidecars(self.schema, check_for_warnings=check_for_warnings)
-            issues += files.validate_datafiles(self.schema, check_for_warnings=check_for_warnings)
+            issues += files.validate_datafiles(self.schema, check_for_warnings=check_for_warnings, workers=workers)
         return issues
 
     def get_summary(self):
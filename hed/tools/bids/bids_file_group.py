@@ -1,12 +1,15 @@
 """ A group of BIDS files with specified suffix name. """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 from hed.errors.error_reporter import ErrorHandler
+from hed.models.sidecar import Sidecar
+from hed.schema import schema_pickler
 from hed.validator.sidecar_validator import SidecarValidator
 from hed.tools.analysis.tabular_summary import TabularSummary
+from hed.tools.bids.bids_file_index import BidsFileIndex
 from hed.tools.bids.bids_tabular_file import BidsTabularFile
 from hed.tools.bids.bids_sidecar_file import BidsSidecarFile
-from hed.tools.util.io_util import get_dir_dictionary, get_file_list, get_path_components
 
 
 class BidsFileGroup:
@@ -20,11 +23,13 @@ class BidsFileGroup:
         datafile_dict (dict):     A dictionary with values either BidsTabularFile or BidsTimeseriesFile.
         sidecar_dir_dict (dict):  Dictionary whose keys are directory paths and values are list of sidecars in the
             corresponding directory.
+        sidecar_index (dict):     Trie of the directories below the root with the sidecars in each directory.
+        file_index (BidsFileIndex):  The files of the dataset, which may be shared with other groups.
 
     """
 
     def __init__(self, root_path, suffix="_events", obj_type="tabular",
-                 exclude_dirs=['sourcedata', 'derivatives', 'code', 'stimuli']):
+                 exclude_dirs=['sourcedata', 'derivatives', 'code', 'stimuli'], file_index=None):
         """ Constructor for a BidsFileGroup.
 
         Parameters:
@@ -32,19 +37,30 @@ class BidsFileGroup:
             suffix (str):     Suffix indicating the type this group represents (e.g. events, or channels, etc.).
             obj_type (str):   Indicates the type of underlying file represents the contents.
             exclude_dirs (list):  Directories to exclude.
+            file_index (BidsFileIndex or None):  The files of the dataset.  If None, the dataset is crawled.
 
+        :raises ValueError:
+            - If file_index is for a different root or does not include all the directories that are not excluded.
 
         """
         self.root_path = os.path.realpath(root_path)
         self.suffix = suffix
         self.obj_type = obj_type
         self.exclude_dirs = exclude_dirs
+        if file_index is None:
+            file_index = BidsFileIndex(self.root_path, exclude_dirs=exclude_dirs)
+        elif file_index.root_path != self.root_path:
+            raise ValueError("IndexRootMismatch", f"The file index of {file_index.root_path} cannot be used for "
+                                                  f"{self.root_path}")
+        self.file_index = file_index
         self.sidecar_dict = self._make_sidecar_dict()
         self.sidecar_dir_dict = self._make_sidecar_dir_dict()
+        self.sidecar_index = self._make_sidecar_index()
 
+        merged_dicts = {}
         for bids_obj in self.sidecar_dict.values():
-            x = self.get_sidecars_from_path(bids_obj)
-            bids_obj.set_contents(content_info=x)
+            sidecar_list = self.get_sidecars_from_path(bids_obj)
+            bids_obj.set_contents(content_info=self._get_merged_dict(sidecar_list, merged_dicts))
 
         self.datafile_dict = self._make_datafile_dict()
         for bids_obj in self.datafile_dict.values():
@@ -61,35 +77,92 @@ class BidsFileGroup:
         Returns:
             list:  A list of the paths for applicable sidecars for obj starting at the root.
 
+        Notes:
+            - The directories are looked up in sidecar_index, so the cost depends on the depth of obj, not on the
+              number of directories with sidecars.
+
         """
-        path_components = [self.root_path] + get_path_components(self.root_path, obj.file_path)
         sidecar_list = []
-        current_path = ''
-        for comp in path_components:
-            current_path = os.path.realpath(os.path.join(current_path, comp))
-            next_sidecar = self._get_sidecar_for_obj(obj, current_path)
+        for node in self._get_index_nodes(os.path.dirname(obj.file_path)):
+            next_sidecar = self._match_sidecar(node, obj)
             if next_sidecar:
                 sidecar_list.append(next_sidecar.file_path)
         return sidecar_list
 
-    def _get_sidecar_for_obj(self, obj, current_path):
-        """ Return a single BidsSidecarFile relevant to obj from the sidecars in the current path.
+    def _get_index_nodes(self, dir_path):
+        """ Generator for the nodes of sidecar_index from the root down to a directory.
+
+        Parameters:
+            dir_path (str): The real path of a directory in the dataset.
+
+        Yields:
+            dict: The node of each directory on the path that is in the index, starting with the root.
+
+        """
+        node = self.sidecar_index
+        yield node
+        for comp in self._get_dir_components(dir_path):
+            node = node["dirs"].get(comp)
+            if node is None:
+                return
+            yield node
+
+    def _get_dir_components(self, dir_path):
+        """ Return the names of the directories from the root down to dir_path, which must be a real path. """
+        rel_dir = os.path.relpath(dir_path, self.root_path)
+        return rel_dir.split(os.sep) if rel_dir != os.curdir else []
+
+    @staticmethod
+    def _match_sidecar(node, obj):
+        """ Return the first sidecar in a directory of the sidecar index that applies to obj.
 
         Parameters:
-            obj (BidsFile):      A file whose sidecars are to be found.
-            current_path (str):  The path of the directory whose sidecars are to be checked.
+            node (dict): The entry of sidecar_index for the directory.
+            obj (BidsFile): A file whose sidecars are to be found.
 
         Returns:
-            BidsSidecarFile or None:  The BidsSidecarFile in current_path relevant to obj, if any.
+            BidsSidecarFile or None:  The first sidecar in the directory relevant to obj, if any.
+
+        Notes:
+            - This gives the same result as checking BidsSidecarFile.is_sidecar_for on each sidecar in order.
+              The first match for each suffix and set of entities is remembered in the node.
 
-         """
-        sidecars = self.sidecar_dir_dict.get(current_path, None)
+        """
+        sidecars = node["sidecars"]
         if not sidecars:
             return None
-        for sidecar in sidecars:
-            if sidecar.is_sidecar_for(obj):
-                return sidecar
-        return None
+        key = (obj.suffix, frozenset(obj.entity_dict.items()))
+        position = node["matches"].get(key, -1)
+        if position == -1:
+            position = next((index for suffix, entities, index in node["signatures"]
+                             if suffix == obj.suffix and entities <= key[1]), None)
+            node["matches"][key] = position
+        own_position = node["positions"].get(obj.file_path)
+        if own_position is not None and (position is None or own_position < position):
+            position = own_position
+        return sidecars[position] if position is not None else None
+
+    @staticmethod
+    def _get_merged_dict(sidecar_list, merged_dicts):
+        """ Return the merged JSON of an inheritance chain of sidecars, reusing the merge of its parent chain.
+
+        Parameters:
+            sidecar_list (list): The paths of the sidecars starting at the root.
+            merged_dicts (dict): The merged JSON of the chains already loaded, keyed by tuples of paths.
+
+        Returns:
+            dict: The merged JSON, which is shared and must be copied before it is modified.
+
+        """
+        chain = tuple(sidecar_list)
+        if not chain:
+            return {}
+        merged = merged_dicts.get(chain)
+        if merged is None:
+            merged = dict(BidsFileGroup._get_merged_dict(chain[:-1], merged_dicts))
+            merged.update(Sidecar(chain[-1]).loaded_dict)
+            merged_dicts[chain] = merged
+        return merged
 
     def summarize(self, value_cols=None, skip_cols=None):
         """ Return a BidsTabularSummary of group files.
@@ -135,7 +208,8 @@ class BidsFileGroup:
                                          error_handler=error_handler)
         return issues
 
-    def validate_datafiles(self, hed_schema, extra_def_dicts=None, check_for_warnings=True, keep_contents=False):
+    def validate_datafiles(self, hed_schema, extra_def_dicts=None, check_for_warnings=True, keep_contents=False,
+                           workers=None):
         """ Validate the datafiles and return an error list.
 
         Parameters:
@@ -143,23 +217,42 @@ class BidsFileGroup:
             extra_def_dicts (DefinitionDict):  Extra definitions that come from outside.
             check_for_warnings (bool):  If True, include warnings in the check.
             keep_contents (bool):       If True, the underlying data files are read and their contents retained.
+            workers (int or None):      If greater than 1, validate the files in this many worker processes.
 
         Returns:
             list:    A list of validation issues found. Each issue is a dictionary.
 
+        Notes:
+            - The issues are returned in the same order whether or not worker processes are used.
+
         """
+        if workers and workers > 1 and len(self.datafile_dict) > 1:
+            return self._validate_datafiles_parallel(hed_schema, extra_def_dicts, check_for_warnings,
+                                                     keep_contents, workers)
 
         error_handler = ErrorHandler(check_for_warnings)
         issues = []
         for data_obj in self.datafile_dict.values():
-            data_obj.set_contents(overwrite=False)
-            name = os.path.basename(data_obj.file_path)
-            issues += data_obj.contents.validate(hed_schema, extra_def_dicts=extra_def_dicts, name=name,
-                                                 error_handler=error_handler)
+            issues += _validate_datafile(data_obj, hed_schema, extra_def_dicts, error_handler)
             if not keep_contents:
                 data_obj.clear_contents()
         return issues
 
+    def _validate_datafiles_parallel(self, hed_schema, extra_def_dicts, check_for_warnings, keep_contents, workers):
+        """ Validate the datafiles in a pool of worker processes, each holding its own copy of the schema. """
+        issues = []
+        data_objs = list(self.datafile_dict.values())
+        tasks = [schema_pickler.dumps(data_obj, hed_schema) for data_obj in data_objs]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_validation_worker,
+                                 initargs=(hed_schema, extra_def_dicts, check_for_warnings, keep_contents)) as pool:
+            for data_obj, result in zip(data_objs, pool.map(_validate_datafile_in_worker, tasks)):
+                file_issues, contents, has_hed = schema_pickler.loads(result, hed_schema)
+                issues += file_issues
+                data_obj.has_hed = has_hed
+                if keep_contents:
+                    data_obj._contents = contents
+        return issues
+
     def _make_datafile_dict(self):
         """ Get a dictionary of objects  corresponding to the underlying obj_type with underlying contents unset.
 
@@ -167,12 +260,13 @@ class BidsFileGroup:
             dict:   A dictionary of BidsTabularFile or BidsTimeseriesFile objects keyed by real path.
 
         """
-        files = get_file_list(self.root_path, name_suffix=self.suffix, extensions=['.tsv'],
-                              exclude_dirs=self.exclude_dirs)
+        files = self.file_index.get_file_list(name_suffix=self.suffix, extensions=['.tsv'],
+                                              exclude_dirs=self.exclude_dirs)
         file_dict = {}
         if self.obj_type == "tabular":
             for file in files:
-                file_dict[os.path.realpath(file)] = BidsTabularFile(file)
+                data_obj = BidsTabularFile(file)
+                file_dict[data_obj.file_path] = data_obj
         else:
             return None
         return file_dict
@@ -187,11 +281,12 @@ class BidsFileGroup:
             - This function creates the sidecars, but does not set their contents.
 
         """
-        files = get_file_list(self.root_path, name_suffix=self.suffix,
-                              extensions=['.json'], exclude_dirs=self.exclude_dirs)
+        files = self.file_index.get_file_list(name_suffix=self.suffix,
+                                              extensions=['.json'], exclude_dirs=self.exclude_dirs)
         file_dict = {}
         for file in files:
-            file_dict[os.path.realpath(file)] = BidsSidecarFile(os.path.realpath(file))
+            sidecar = BidsSidecarFile(file)
+            file_dict[sidecar.file_path] = sidecar
         return file_dict
 
     def _make_sidecar_dir_dict(self):
@@ -201,8 +296,8 @@ class BidsFileGroup:
             dict: A dictionary of lists of sidecar BidsSidecarFiles
 
         """
-        dir_dict = get_dir_dictionary(self.root_path, name_suffix=self.suffix, extensions=['.json'],
-                                      exclude_dirs=self.exclude_dirs)
+        dir_dict = self.file_index.get_dir_dictionary(name_suffix=self.suffix, extensions=['.json'],
+                                                      exclude_dirs=self.exclude_dirs)
         sidecar_dir_dict = {}
         for this_dir, dir_list in dir_dict.items():
             new_dir_list = []
@@ -210,3 +305,79 @@ class BidsFileGroup:
                 new_dir_list.append(self.sidecar_dict[os.path.realpath(s_file)])
             sidecar_dir_dict[os.path.realpath(this_dir)] = new_dir_list
         return sidecar_dir_dict
+
+    def _make_sidecar_index(self):
+        """ Create a trie of the directories with sidecars, keyed by directory name starting at the root.
+
+        Returns:
+            dict: The node for the root.  Each node has the sidecars of its directory and the nodes of the
+                  subdirectories below it that have sidecars.
+
+        Notes:
+            - The distinct suffix and entity signatures of the sidecars in a directory are kept in order, so that
+              finding the sidecar for a file only compares the signatures rather than all the sidecars.
+
+        """
+        index = self._make_index_node()
+        for this_dir, sidecars in self.sidecar_dir_dict.items():
+            node = index
+            for comp in self._get_dir_components(this_dir):
+                node = node["dirs"].setdefault(comp, self._make_index_node())
+            node["sidecars"] = sidecars
+            signatures = {}
+            for index_in_dir, sidecar in enumerate(sidecars):
+                node["positions"][sidecar.file_path] = index_in_dir
+                signatures.setdefault((sidecar.suffix, frozenset(sidecar.entity_dict.items())), index_in_dir)
+            node["signatures"] = [(suffix, entities, index_in_dir)
+                                  for (suffix, entities), index_in_dir in signatures.items()]
+        return index
+
+    @staticmethod
+    def _make_index_node():
+        return {"dirs": {}, "sidecars": [], "signatures": [], "positions": {}, "matches": {}}
+
+
+def _validate_datafile(data_obj, hed_schema, extra_def_dicts, error_handler):
+    """ Read and validate a single data file.
+
+    Parameters:
+        data_obj (BidsTabularFile):  The file to validate.  Its contents are set if not already present.
+        hed_schema (HedSchema):  Schema to apply to the validation.
+        extra_def_dicts (DefinitionDict):  Extra definitions that come from outside.
+        error_handler (ErrorHandler):  The error handler to use.
+
+    Returns:
+        list:    A list of validation issues found. Each issue is a dictionary.
+    """
+    data_obj.set_contents(overwrite=False)
+    name = os.path.basename(data_obj.file_path)
+    return data_obj.contents.validate(hed_schema, extra_def_dicts=extra_def_dicts, name=name,
+                                      error_handler=error_handler)
+
+
+_worker_state = {}
+
+
+def _init_validation_worker(hed_schema, extra_def_dicts, check_for_warnings, keep_contents):
+    """ Keep the arguments shared by all files in this worker process so they are only transferred once. """
+    _worker_state["hed_schema"] = hed_schema
+    _worker_state["extra_def_dicts"] = extra_def_dicts
+    _worker_state["check_for_warnings"] = check_for_warnings
+    _worker_state["keep_contents"] = keep_contents
+
+
+def _validate_datafile_in_worker(task):
+    """ Validate one data file in a worker process.
+
+    Parameters:
+        task (bytes): The BidsTabularFile to validate, pickled with schema_pickler.
+
+    Returns:
+        bytes: The issues, the file contents (if kept) and the has_hed flag, pickled with schema_pickler.
+    """
+    hed_schema = _worker_state["hed_schema"]
+    data_obj = schema_pickler.loads(task, hed_schema)
+    issues = _validate_datafile(data_obj, hed_schema, _worker_state["extra_def_dicts"],
+                                ErrorHandler(_worker_state["check_for_warnings"]))
+    contents = data_obj.contents if _worker_state["keep_contents"] else None
+    return schema_pickler.dumps((issues, contents, data_obj.has_hed), hed_schema)
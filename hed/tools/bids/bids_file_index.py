@@ -0,0 +1,176 @@
+""" A single crawl of the files of a BIDS dataset shared by its file groups. """
+
+import os
+import json
+from hed.errors.exceptions import HedFileError
+from hed.tools.util.io_util import check_filename, scan_directory
+
+INDEX_FORMAT_VERSION = 1
+
+
+class BidsFileIndex:
+    """ The files in the directories of a BIDS dataset, listed once and optionally saved for later runs.
+
+    Attributes:
+        root_path (str):      Real root path of the BIDS dataset.
+        exclude_dirs (list):  Names of the directories that are not crawled.
+        index_path (str or None):  Path of the file the index is saved in, if any.
+        dirs (dict):          For each directory relative to the root (with '' for the root), the modification time,
+            the (name, real path) lists of its files, and the names of its subdirectories in os.walk order.
+
+    Notes:
+        - A saved index is only reused for a directory whose modification time has not changed, so only the
+          directories that had files added, removed or renamed are listed again.
+
+    """
+
+    def __init__(self, root_path, exclude_dirs=None, index_path=None):
+        """ Crawl the dataset, reusing the directories of a saved index that have not changed.
+
+        Parameters:
+            root_path (str):  Path of the root of the BIDS dataset.
+            exclude_dirs (list or None):  Names of the directories to skip.
+            index_path (str or None):  If given, the index is read from and saved to this file.
+
+        :raises HedFileError:
+            - If the index has changed and cannot be saved.
+
+        """
+        self.root_path = os.path.realpath(root_path)
+        self.exclude_dirs = list(exclude_dirs) if exclude_dirs else []
+        self.index_path = index_path
+        self.dirs = {}
+        saved_dirs = self._load() if index_path else {}
+        changed = self._crawl(saved_dirs)
+        if index_path and (changed or list(saved_dirs) != list(self.dirs)):
+            self.save()
+
+    def get_file_list(self, name_prefix=None, name_suffix=None, extensions=None, exclude_dirs=None):
+        """ Return the real paths of the files satisfying various conditions, as io_util.get_file_list does.
+
+        Parameters:
+            name_prefix (str, None):      An optional name_prefix for the base filename.
+            name_suffix (str, None):      The name_suffix of the paths to be extracted.
+            extensions (list, None):      A list of extensions to be selected.
+            exclude_dirs (list, None):    Names of the directories to skip.  Must include those of the index.
+                If None, only the directories excluded from the index are skipped.
+
+        Returns:
+            list:   The full paths.
+
+        """
+        file_list = []
+        for _, files in self._get_dirs(exclude_dirs):
+            for name, real_path in files:
+                if check_filename(name, name_prefix, name_suffix, extensions):
+                    file_list.append(real_path)
+        return file_list
+
+    def get_dir_dictionary(self, name_prefix=None, name_suffix=None, extensions=None, skip_empty=True,
+                           exclude_dirs=None):
+        """ Return a dictionary of the files in each directory, as io_util.get_dir_dictionary does.
+
+        Parameters:
+            name_prefix (str, None):      An optional name_prefix for the base filename.
+            name_suffix (str, None):      An optional name_suffix for the base file name.
+            extensions (list, None):      An optional list of file extensions.
+            skip_empty (bool):            Do not put entry for directories that have no files.
+            exclude_dirs (list, None):    Names of the directories to skip.  Must include those of the index.
+                If None, only the directories excluded from the index are skipped.
+
+        Returns:
+            dict:  Dictionary with directories as keys and file lists values.
+
+        """
+        dir_dict = {}
+        for dir_path, files in self._get_dirs(exclude_dirs):
+            file_list = [os.path.join(dir_path, name) for name, _ in files
+                         if check_filename(name, name_prefix, name_suffix, extensions)]
+            if skip_empty and not file_list:
+                continue
+            dir_dict[dir_path] = file_list
+        return dir_dict
+
+    def save(self):
+        """ Write the index to index_path.
+
+        :raises HedFileError:
+            - If the index cannot be written.
+
+        """
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            index_dir = os.path.dirname(os.path.realpath(self.index_path))
+            os.makedirs(index_dir, exist_ok=True)
+            with open(temp_path, 'w') as fp:
+                json.dump({"version": INDEX_FORMAT_VERSION, "root_path": self.root_path, "dirs": self.dirs}, fp)
+            os.replace(temp_path, self.index_path)
+        except OSError as ex:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise HedFileError("IndexNotSaved", f"Cannot write BIDS file index: {str(ex)}", self.index_path) from ex
+
+    def _load(self):
+        """ Return the directories of the saved index or an empty dictionary if it cannot be used. """
+        try:
+            with open(self.index_path, 'r') as fp:
+                index = json.load(fp)
+            if index.get("version") == INDEX_FORMAT_VERSION and index.get("root_path") == self.root_path and \
+                    isinstance(index.get("dirs"), dict):
+                return index["dirs"]
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {}
+
+    def _crawl(self, saved_dirs):
+        """ Fill dirs with the directories in os.walk order, reusing the saved ones that have not changed.
+
+        Parameters:
+            saved_dirs (dict):  The directories of a saved index.
+
+        Returns:
+            bool:  True if any directory had to be listed.
+
+        """
+        changed = False
+        stack = ['']
+        while stack:
+            rel_dir = stack.pop()
+            dir_path = os.path.join(self.root_path, rel_dir) if rel_dir else self.root_path
+            try:
+                mtime = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                continue
+            entry = saved_dirs.get(rel_dir)
+            if not entry or entry.get("mtime") != mtime:
+                scanned = scan_directory(dir_path)
+                if scanned is None:
+                    continue
+                changed = True
+                entry = {"mtime": mtime, "files": [list(file) for file in scanned[0]], "dirs": scanned[1]}
+            self.dirs[rel_dir] = entry
+            stack.extend(os.path.join(rel_dir, sub_dir) for sub_dir in reversed(entry["dirs"])
+                         if sub_dir not in self.exclude_dirs)
+        return changed
+
+    def _get_dirs(self, exclude_dirs):
+        """ Generator for the real path and the files of the indexed directories that are not excluded.
+
+        Parameters:
+            exclude_dirs (list or None):  Names of the directories to skip.  If None, those excluded from the index.
+
+        Yields:
+            tuple:  The real path of a directory and the list of (name, real path) lists of its files.
+
+        :raises ValueError:
+            - If exclude_dirs does not include all the directories excluded from the index.
+
+        """
+        exclude_dirs = set(self.exclude_dirs if exclude_dirs is None else exclude_dirs)
+        if not exclude_dirs.issuperset(self.exclude_dirs):
+            raise ValueError("IndexMissingDirectories",
+                             f"Directories {str(sorted(set(self.exclude_dirs) - exclude_dirs))} are not indexed")
+        for rel_dir, entry in self.dirs.items():
+            if rel_dir and not exclude_dirs.isdisjoint(rel_dir.split(os.sep)):
+                continue
+            yield (os.path.join(self.root_path, rel_dir) if rel_dir else self.root_path), entry["files"]
@@ -1,5 +1,7 @@
 """ Container for a BIDS sidecar file. """
 
+import io
+import json
 import os
 from hed.models.sidecar import Sidecar
 from hed.tools.bids.bids_file import BidsFile
@@ -47,7 +49,7 @@ class BidsSidecarFile(BidsFile):
         """ Set the contents of the sidecar.
 
         Parameters:
-            content_info (list, str, or None): If None, create a Sidecar from the object's file-path.
+            content_info (list, str, dict, or None): If None, create a Sidecar from the object's file-path.
             overwrite (bool): If True, overwrite contents if already set.
 
         Notes:
@@ -55,12 +57,15 @@ class BidsSidecarFile(BidsFile):
                 - None: This object's file_path is used.
                 - str:  The string is interpreted as a path of the JSON.
                 - list: The list is of paths.
+                - dict: The dictionary is the already merged JSON, which is copied.
 
          """
         if not overwrite and self.contents:
             return
         if not content_info:
             content_info = self.file_path
+        elif isinstance(content_info, dict):
+            content_info = io.StringIO(json.dumps(content_info))
         self._contents = Sidecar(files=content_info, name=os.path.basename(self.file_path))
         self.has_hed = self.is_hed(self.contents.loaded_dict)
 
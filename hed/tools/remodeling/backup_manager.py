@@ -3,16 +3,29 @@
 import os
 import json
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from hed.errors.exceptions import HedFileError
 from hed.tools.util.io_util import get_file_list, get_path_components
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# The Linux ioctl that makes a file share the data blocks of another file on btrfs, XFS, and similar filesystems.
+FICLONE = 0x40049409
+
 
 class BackupManager:
     DEFAULT_BACKUP_NAME = 'default_back'
     RELATIVE_BACKUP_LOCATION = 'derivatives/remodel'
     BACKUP_DICTIONARY = 'backup_lock.json'
     BACKUP_ROOT = 'backup_root'
+    COPY = 'copy'
+    HARDLINK = 'hardlink'
+    REFLINK = 'reflink'
+    STRATEGIES = (COPY, HARDLINK, REFLINK)
 
     def __init__(self, data_root, backups_root=None):
         """ Constructor for the backup manager.
@@ -36,13 +49,15 @@ class BackupManager:
         os.makedirs(self.backups_path, exist_ok=True)
         self.backups_dict = self._get_backups()
 
-    def create_backup(self, file_list, backup_name=None, verbose=False):
+    def create_backup(self, file_list, backup_name=None, verbose=False, strategy=COPY, max_workers=None):
         """ Create a new backup from file_list.
 
         Parameters:
             file_list (list):   Full paths of the files to be in the backup.
             backup_name (str or None):  Name of the backup. If None, uses the default
             verbose (bool):     If True, print out the files that are being backed up.
+            strategy (str):     How the files are copied: 'copy', 'hardlink', or 'reflink' (see transfer_files).
+            max_workers (int or None):  The number of threads copying files (None uses the ThreadPoolExecutor default).
 
         Returns:
             bool:  True if the backup was successful. False if a backup of that name already exists.
@@ -53,6 +68,9 @@ class BackupManager:
         :raises OS-related error:
             - OS-related error when file copying occurs.
 
+        :raises ValueError:
+            - If strategy is not one of BackupManager.STRATEGIES.
+
         """
         if not backup_name:
             backup_name = self.DEFAULT_BACKUP_NAME
@@ -64,13 +82,11 @@ class BackupManager:
             print(f"Creating backup {backup_name}")
         backup_dir_path = os.path.realpath(os.path.join(self.backups_path, backup_name, BackupManager.BACKUP_ROOT))
         os.makedirs(backup_dir_path, exist_ok=True)
+        file_pairs = []
         for file in file_list:
-            backup_file = self.get_backup_path(backup_name, file)
-            os.makedirs(os.path.dirname(backup_file), exist_ok=True)
-            if verbose:
-                print(f"Copying {file} to {backup_file}")
-            shutil.copy2(file, backup_file)
+            file_pairs.append((file, self.get_backup_path(backup_name, file)))
             backup[self.get_file_key(file)] = time_stamp
+        self.transfer_files(file_pairs, strategy=strategy, verbose=verbose, max_workers=max_workers)
         self.backups_dict[backup_name] = backup
         backup_dict_path = os.path.realpath(os.path.join(self.backups_path, backup_name,
                                                          self.BACKUP_DICTIONARY))
@@ -138,26 +154,123 @@ class BackupManager:
         file_comp = get_path_components(self.data_root, file_name) + [os.path.basename(file_name)]
         return '/'.join(file_comp)
 
-    def restore_backup(self, backup_name=DEFAULT_BACKUP_NAME, task_names=[], verbose=True):
+    def restore_backup(self, backup_name=DEFAULT_BACKUP_NAME, task_names=[], verbose=True, strategy=COPY,
+                       max_workers=None):
         """ Restore the files from backup_name to the main directory.
 
         Parameters:
             backup_name (str):  Name of the backup to restore.
             task_names (list):  A list of task names to restore.
             verbose (bool):  If true, print out the file names being restored.
+            strategy (str):     How the files are copied: 'copy', 'hardlink', or 'reflink' (see transfer_files).
+            max_workers (int or None):  The number of threads copying files (None uses the ThreadPoolExecutor default).
+
+        :raises ValueError:
+            - If strategy is not one of BackupManager.STRATEGIES.
 
         """
         if verbose:
             print(f"Restoring from backup {backup_name}")
         backup_files = self.get_backup_files(backup_name)
         data_files = self.get_backup_files(backup_name, original_paths=True)
-        for index, file in enumerate(backup_files):
-            if task_names and not self.get_task(task_names, file):
-                continue
-            os.makedirs(os.path.dirname(data_files[index]), exist_ok=True)
-            if verbose:
-                print(f"Copying {file} to {data_files[index]}")
-            shutil.copy2(file, data_files[index])
+        file_pairs = [(file, data_files[index]) for index, file in enumerate(backup_files)
+                      if not task_names or self.get_task(task_names, file)]
+        self.transfer_files(file_pairs, strategy=strategy, verbose=verbose, max_workers=max_workers)
+
+    @staticmethod
+    def transfer_files(file_pairs, strategy=COPY, verbose=False, max_workers=None):
+        """ Copy files using a pool of threads, skipping those whose destination has the same size and mtime.
+
+        Parameters:
+            file_pairs (list):  A (source path, destination path) tuple for each file.
+            strategy (str):     How the files are copied: 'copy', 'hardlink', or 'reflink'.
+            verbose (bool):     If True, print out the files that are being copied.
+            max_workers (int or None):  The number of threads copying files (None uses the ThreadPoolExecutor default).
+
+        Returns:
+            int:  The number of files that were copied rather than skipped.
+
+        :raises ValueError:
+            - If strategy is not one of BackupManager.STRATEGIES.
+
+        :raises OS-related error:
+            - OS-related error when file copying occurs.
+
+        Notes:
+            - 'copy' makes an independent copy of each file as shutil.copy2 does.
+            - 'reflink' makes a copy that shares the data blocks of the source until either is changed.
+              This needs a filesystem that supports it (such as btrfs or XFS on Linux), otherwise the file is copied.
+            - 'hardlink' makes the destination another name for the source file, so no data is copied.
+              If linking fails (for example across filesystems), the file is copied.  Changing one of the
+              files in place also changes the other, so use it only if files are replaced rather than
+              rewritten (the remodeling tools replace the files they write).
+            - Each destination is replaced rather than written in place, so a destination that was
+              hard-linked to another file never changes that file.
+
+        """
+        if strategy not in BackupManager.STRATEGIES:
+            raise ValueError("InvalidCopyStrategy",
+                             f"Copy strategy {strategy} must be one of {str(BackupManager.STRATEGIES)}")
+        file_pairs = [(source, dest) for source, dest in file_pairs if not BackupManager._is_same_file(source, dest)]
+        if verbose:
+            for source, dest in file_pairs:
+                print(f"Copying {source} to {dest}")
+        if len(file_pairs) < 2:
+            for source, dest in file_pairs:
+                BackupManager._transfer_file(source, dest, strategy)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                list(pool.map(lambda pair: BackupManager._transfer_file(pair[0], pair[1], strategy), file_pairs))
+        return len(file_pairs)
+
+    @staticmethod
+    def _is_same_file(source, dest):
+        """ Return True if dest exists and has the same size and modification time as source. """
+        try:
+            source_stat = os.stat(source)
+            dest_stat = os.stat(dest)
+        except OSError:
+            return False
+        return source_stat.st_size == dest_stat.st_size and source_stat.st_mtime_ns == dest_stat.st_mtime_ns
+
+    @staticmethod
+    def _transfer_file(source, dest, strategy):
+        """ Copy source to a temporary file next to dest with strategy and then replace dest with it. """
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        temp_path = f"{dest}.{os.getpid()}.tmp"
+        try:
+            if not (strategy == BackupManager.HARDLINK and BackupManager._hardlink(source, temp_path) or
+                    strategy == BackupManager.REFLINK and BackupManager._reflink(source, temp_path)):
+                shutil.copy2(source, temp_path)
+            os.replace(temp_path, dest)
+        except BaseException:
+            if os.path.lexists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def _hardlink(source, dest):
+        """ Make dest a hard link to source, returning False if this is not possible. """
+        try:
+            os.link(source, dest)
+            return True
+        except (OSError, NotImplementedError):
+            return False
+
+    @staticmethod
+    def _reflink(source, dest):
+        """ Make dest a copy of source that shares its data blocks, returning False if this is not possible. """
+        if fcntl is None:
+            return False
+        try:
+            with open(source, 'rb') as source_file, open(dest, 'wb') as dest_file:
+                fcntl.ioctl(dest_file.fileno(), FICLONE, source_file.fileno())
+            shutil.copystat(source, dest)
+            return True
+        except OSError:
+            if os.path.exists(dest):
+                os.remove(dest)
+            return False
 
     def _get_backups(self):
         """ Set the manager's backup-dictionary based on backup directory contents.
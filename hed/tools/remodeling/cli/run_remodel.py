@@ -3,11 +3,14 @@
 import os
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from hed.errors.exceptions import HedFileError
+from hed.schema import schema_pickler
 from hed.tools.util.io_util import get_file_list, get_task_from_file
 from hed.tools.bids.bids_dataset import BidsDataset
 from hed.tools.remodeling.dispatcher import Dispatcher
 from hed.tools.remodeling.backup_manager import BackupManager
+from hed.tools.remodeling.remodel_manifest import RemodelManifest
 
 
 def get_parser():
@@ -29,8 +32,13 @@ def get_parser():
     parser.add_argument("-i", "--individual-summaries", dest="individual_summaries", default="separate",
                         choices=["separate", "consolidated", "none"],
                         help="Controls individual file summaries ('none', 'separate', 'consolidated')")
+    parser.add_argument("-in", "--incremental", action='store_true', dest="incremental",
+                        help="If present, files whose inputs have not changed since the last run are not remodeled " +
+                             "again, and their summaries are taken from the manifest in the remodel directory.")
     parser.add_argument("-j", "--json-sidecar", dest="json_sidecar", nargs="?",
                         help="Optional path to JSON sidecar with HED information")
+    parser.add_argument("-p", "--jobs", type=int, default=1, dest="jobs",
+                        help="Number of worker processes used to remodel the files (1 by default).")
     parser.add_argument("-n", "--backup-name", default=BackupManager.DEFAULT_BACKUP_NAME, dest="backup_name",
                         help="Name of the default backup for remodeling")
     parser.add_argument("-nb", "--no-backup", action='store_true', dest="no_backup",
@@ -65,6 +73,10 @@ def handle_backup(args):
     Returns:
         str or None:  backup name if there was a backup done.
 
+    Notes:
+        - With the incremental option, the backup is not restored all at once.  Instead, run_file_ops
+          restores the files that are remodeled again and are not updated.
+
     """
     if args.no_backup:
         backup_name = None
@@ -73,7 +85,8 @@ def handle_backup(args):
         if not backup_man.get_backup(args.backup_name):
             raise HedFileError("BackupDoesNotExist", f"Backup {args.backup_name} does not exist. "
                                f"Please run_remodel_backup first", "")
-        backup_man.restore_backup(args.backup_name, args.task_names, verbose=args.verbose)
+        if not getattr(args, 'incremental', False):
+            backup_man.restore_backup(args.backup_name, args.task_names, verbose=args.verbose)
         backup_name = args.backup_name
     return backup_name
 
@@ -129,13 +142,14 @@ def parse_tasks(files, task_args):
     return task_dict
 
 
-def run_bids_ops(dispatch, args, tabular_files):
+def run_bids_ops(dispatch, args, tabular_files, manifest=None):
     """ Run the remodeler on a BIDS dataset.
 
     Parameters:
         dispatch (Dispatcher): Manages the execution of the operations.
         args (Object): The command-line arguments as an object.
         tabular_files (list): List of tabular files to run the ops on.
+        manifest (RemodelManifest or None): If given, files that have not changed are skipped.
 
     """
     bids = BidsDataset(dispatch.data_root, tabular_types=['events'], exclude_dirs=args.exclude_dirs)
@@ -146,6 +160,7 @@ def run_bids_ops(dispatch, args, tabular_files):
     if args.verbose:
         print(f"Processing {dispatch.data_root}")
     filtered_events = [events.datafile_dict[key] for key in tabular_files]
+    file_list = []
     for events_obj in filtered_events:
         sidecar_list = events.get_sidecars_from_path(events_obj)
         if sidecar_list:
@@ -154,18 +169,18 @@ def run_bids_ops(dispatch, args, tabular_files):
             sidecar = None
         if args.verbose:
             print(f"Events {events_obj.file_path}  sidecar {sidecar}")
-        df = dispatch.run_operations(events_obj.file_path, sidecar=sidecar, verbose=args.verbose)
-        if not args.no_update:
-            df.to_csv(events_obj.file_path, sep='\t', index=False, header=True)
+        file_list.append((events_obj.file_path, sidecar))
+    run_file_ops(dispatch, args, file_list, manifest=manifest)
 
 
-def run_direct_ops(dispatch, args, tabular_files):
+def run_direct_ops(dispatch, args, tabular_files, manifest=None):
     """ Run the remodeler on files of a specified form in a directory tree.
 
     Parameters:
         dispatch (Dispatcher):  Controls the application of the operations and backup.
         args (argparse.Namespace): Dictionary of arguments and their values.
         tabular_files (list): List of files to include in this run.
+        manifest (RemodelManifest or None): If given, files that have not changed are skipped.
 
     """
 
@@ -175,10 +190,170 @@ def run_direct_ops(dispatch, args, tabular_files):
         sidecar = args.json_sidecar
     else:
         sidecar = None
-    for file_path in tabular_files:
-        df = dispatch.run_operations(file_path, verbose=args.verbose, sidecar=sidecar)
-        if not args.no_update:
-            df.to_csv(file_path, sep='\t', index=False, header=True)
+    run_file_ops(dispatch, args, [(file_path, sidecar) for file_path in tabular_files], manifest=manifest)
+
+
+def run_file_ops(dispatch, args, file_list, manifest=None):
+    """ Run the remodeler on a list of files, in worker processes if more than one job is requested.
+
+    Parameters:
+        dispatch (Dispatcher):  Controls the application of the operations and backup.
+        args (argparse.Namespace): Dictionary of arguments and their values.
+        file_list (list): A (file path, sidecar) tuple for each file to remodel.
+        manifest (RemodelManifest or None): If given, files that have not changed are skipped.
+
+    Notes:
+        - With args.jobs greater than 1, each worker process remodels and writes whole files.
+          The summaries of each file are merged back into dispatch in the original file order,
+          so the saved summaries are the same as for a serial run.
+        - With a manifest, a file is skipped if the remodeling file, schema version, input file, sidecar,
+          and the file in the dataset are all the same as when it was last remodeled.  The summaries
+          saved in the manifest for a skipped file are merged in its place.
+
+    """
+    jobs = getattr(args, 'jobs', 1) or 1
+    if manifest is None and (jobs <= 1 or len(file_list) < 2):
+        for file_path, sidecar in file_list:
+            remodel_file(dispatch, args, file_path, sidecar)
+        return
+
+    file_summaries = [None] * len(file_list)
+    file_states = [None] * len(file_list)
+    if manifest is not None:
+        settings = RemodelManifest.get_settings_hash(args.model_path, dispatch.hed_schema)
+        for index, (file_path, sidecar) in enumerate(file_list):
+            file_states[index] = get_file_state(dispatch, file_path, sidecar, settings)
+            file_summaries[index] = manifest.get_summaries(get_file_key(dispatch, file_path),
+                                                           file_states[index], dispatch)
+    to_run = [index for index, summaries in enumerate(file_summaries) if summaries is None]
+    if args.verbose and manifest is not None:
+        print(f"Skipping {len(file_list) - len(to_run)} unchanged files")
+
+    for index, summaries in zip(to_run, remodel_files(dispatch, args, [file_list[index] for index in to_run])):
+        file_summaries[index] = summaries
+        if manifest is not None:
+            file_path = file_list[index][0]
+            if args.no_update and dispatch.backup_man:
+                dispatch.backup_man.transfer_files(
+                    [(dispatch.backup_man.get_backup_path(dispatch.backup_name, file_path), file_path)])
+            file_state = dict(file_states[index], output=RemodelManifest.get_file_hash(file_path))
+            manifest.update(get_file_key(dispatch, file_path), file_state, summaries)
+    for summaries in file_summaries:
+        dispatch.merge_summaries(summaries)
+
+
+def remodel_files(dispatch, args, file_list):
+    """ Remodel files one at a time or in worker processes, yielding the summaries of each file.
+
+    Parameters:
+        dispatch (Dispatcher):  Controls the application of the operations and backup.
+        args (argparse.Namespace): Dictionary of arguments and their values.
+        file_list (list): A (file path, sidecar) tuple for each file to remodel.
+
+    Yields:
+        dict: The summaries of each file alone keyed by summary name, in the order of file_list.
+
+    """
+    jobs = getattr(args, 'jobs', 1) or 1
+    if jobs <= 1 or len(file_list) < 2:
+        for file_path, sidecar in file_list:
+            yield remodel_file_summaries(dispatch, args, file_path, sidecar)
+        return
+
+    tasks = [schema_pickler.dumps(file_info, dispatch.hed_schema) for file_info in file_list]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(file_list)), initializer=_init_remodel_worker,
+                             initargs=(dispatch, args)) as pool:
+        for result in pool.map(_remodel_file_in_worker, tasks):
+            yield schema_pickler.loads(result, dispatch.hed_schema)
+
+
+def get_file_key(dispatch, file_path):
+    """ Return the path of a file relative to the dataset root, with / separators. """
+    return os.path.relpath(file_path, dispatch.data_root).replace(os.sep, '/')
+
+
+def get_file_state(dispatch, file_path, sidecar, settings):
+    """ Return the hashes that decide whether a file must be remodeled again.
+
+    Parameters:
+        dispatch (Dispatcher):  Controls the application of the operations and backup.
+        file_path (str): The full path of the file in the dataset.
+        sidecar (Sidecar, str, or None): The sidecar to use for HED operations.
+        settings (str or None): The hash of the remodeling file and schema version.
+
+    Returns:
+        dict: The settings, input, sidecar, and output hashes.  A hash is None if it cannot be computed.
+
+    """
+    input_path = file_path
+    if dispatch.backup_man:
+        input_path = dispatch.backup_man.get_backup_path(dispatch.backup_name, file_path)
+    return {"settings": settings, "input": RemodelManifest.get_file_hash(input_path),
+            "sidecar": RemodelManifest.get_sidecar_hash(sidecar), "output": RemodelManifest.get_file_hash(file_path)}
+
+
+def remodel_file(dispatch, args, file_path, sidecar):
+    """ Run the operations on one file and write the result unless updates are turned off.
+
+    Parameters:
+        dispatch (Dispatcher):  Controls the application of the operations and backup.
+        args (argparse.Namespace): Dictionary of arguments and their values.
+        file_path (str): The full path of the file in the dataset.
+        sidecar (Sidecar, str, or None): The sidecar to use for HED operations.
+
+    """
+    df = dispatch.run_operations(file_path, sidecar=sidecar, verbose=args.verbose)
+    if not args.no_update:
+        # Replace the file rather than rewriting it, so that a backup hard-linked to it is not changed.
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        df.to_csv(temp_path, sep='\t', index=False, header=True)
+        os.replace(temp_path, file_path)
+
+
+def remodel_file_summaries(dispatch, args, file_path, sidecar):
+    """ Remodel one file and return its summaries without adding them to those of dispatch.
+
+    Parameters:
+        dispatch (Dispatcher):  Controls the application of the operations and backup.
+        args (argparse.Namespace): Dictionary of arguments and their values.
+        file_path (str): The full path of the file in the dataset.
+        sidecar (Sidecar, str, or None): The sidecar to use for HED operations.
+
+    Returns:
+        dict: The summaries of this file alone keyed by summary name.
+
+    """
+    summary_dicts = dispatch.summary_dicts
+    dispatch.summary_dicts = {}
+    try:
+        remodel_file(dispatch, args, file_path, sidecar)
+        return dispatch.summary_dicts
+    finally:
+        dispatch.summary_dicts = summary_dicts
+
+
+_worker_state = {}
+
+
+def _init_remodel_worker(dispatch, args):
+    """ Keep a copy of the dispatcher in this worker process so it is only transferred once. """
+    _worker_state["dispatch"] = dispatch
+    _worker_state["args"] = args
+
+
+def _remodel_file_in_worker(task):
+    """ Remodel one file in a worker process.
+
+    Parameters:
+        task (bytes): The (file path, sidecar) tuple, pickled with schema_pickler.
+
+    Returns:
+        bytes: The summaries of this file keyed by summary name, pickled with schema_pickler.
+    """
+    dispatch = _worker_state["dispatch"]
+    file_path, sidecar = schema_pickler.loads(task, dispatch.hed_schema)
+    summaries = remodel_file_summaries(dispatch, _worker_state["args"], file_path, sidecar)
+    return schema_pickler.dumps(summaries, dispatch.hed_schema)
 
 
 def main(arg_list=None):
@@ -203,13 +378,18 @@ def main(arg_list=None):
     files = get_file_list(args.data_dir, name_suffix=args.file_suffix, extensions=args.extensions,
                           exclude_dirs=args.exclude_dirs)
     task_dict = parse_tasks(files, args.task_names)
+    manifest = None
+    if args.incremental:
+        manifest = RemodelManifest(RemodelManifest.get_manifest_path(args.data_dir, args.model_path, args.work_dir))
     for task, files in task_dict.items():
         dispatch = Dispatcher(operations, data_root=args.data_dir, backup_name=backup_name,
                               hed_versions=args.hed_versions)
         if args.use_bids:
-            run_bids_ops(dispatch, args, files)
+            run_bids_ops(dispatch, args, files, manifest=manifest)
         else:
-            run_direct_ops(dispatch, args, files)
+            run_direct_ops(dispatch, args, files, manifest=manifest)
+        if manifest is not None:
+            manifest.save()
         if not args.no_summaries:
             dispatch.save_summaries(args.save_formats, individual_summaries=args.individual_summaries, 
                                     summary_dir=save_dir, task_name=task)
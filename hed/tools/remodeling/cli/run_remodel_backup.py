@@ -24,6 +24,10 @@ def get_parser():
     parser.add_argument("-p", "--path-work", default="", dest="path_work",
                         help="The root path for remodeling work if given, " +
                              "otherwise [data_root]/derivatives/remodel is used.")
+    parser.add_argument("-s", "--strategy", default=BackupManager.COPY, dest="strategy",
+                        choices=list(BackupManager.STRATEGIES),
+                        help="How files are copied: 'copy' (the default), 'reflink' (shares data blocks where the " +
+                             "filesystem supports it), or 'hardlink' (no data is copied).")
     parser.add_argument("-t", "--task-names", dest="task_names", nargs="*", default=[], help="The name of the task.")
     parser.add_argument("-v", "--verbose", action='store_true',
                         help="If present, output informative messages as computation progresses.")
@@ -68,7 +72,8 @@ def main(arg_list=None):
     if backup_man.get_backup(args.backup_name):
         raise HedFileError("BackupExists", f"Backup {args.backup_name} already exists", "")
     else:
-        backup_man.create_backup(file_list, backup_name=args.backup_name, verbose=args.verbose)
+        backup_man.create_backup(file_list, backup_name=args.backup_name, verbose=args.verbose,
+                                 strategy=args.strategy)
 
 
 if __name__ == '__main__':
@@ -17,6 +17,10 @@ def get_parser():
     parser.add_argument("-n", "--backup_name", default=BackupManager.DEFAULT_BACKUP_NAME, dest="backup_name",
                         help="Name of the default backup for remodeling")
 
+    parser.add_argument("-s", "--strategy", default=BackupManager.COPY, dest="strategy",
+                        choices=list(BackupManager.STRATEGIES),
+                        help="How files are copied: 'copy' (the default), 'reflink' (shares data blocks where the " +
+                             "filesystem supports it), or 'hardlink' (no data is copied).")
     parser.add_argument("-t", "--task-names", dest="task_names", nargs="*", default=[], help="The names of the task.")
     parser.add_argument("-v", "--verbose", action='store_true',
                         help="If present, output informative messages as computation progresses.")
@@ -46,7 +50,8 @@ def main(arg_list=None):
     backup_man = BackupManager(args.data_dir, backups_root=backups_root)
     if not backup_man.get_backup(args.backup_name):
         raise HedFileError("BackupDoesNotExist", f"{args.backup_name}", "")
-    backup_man.restore_backup(args.backup_name, task_names=args.task_names, verbose=args.verbose)
+    backup_man.restore_backup(args.backup_name, task_names=args.task_names, verbose=args.verbose,
+                              strategy=args.strategy)
 
 
 if __name__ == '__main__':
@@ -8,6 +8,7 @@ from hed.errors.exceptions import HedFileError
 from hed.schema.hed_schema_io import load_schema_version
 from hed.schema import HedSchema, HedSchemaGroup
 from hed.tools.remodeling.backup_manager import BackupManager
+from hed.tools.remodeling.hed_context import HedContext
 from hed.tools.remodeling.operations.valid_operations import valid_operations
 from hed.tools.util.io_util import clean_filename, extract_suffix_path, get_timestamp
 
@@ -49,6 +50,9 @@ class Dispatcher:
         self.parsed_ops = op_list
         self.hed_schema = self.get_schema(hed_versions)
         self.summary_dicts = {}
+        self._bids_data = None
+        self._hed_context = None
+        self._share_data = False
 
     def get_summaries(self, file_formats=['.txt', '.json']):
         """ Return the summaries in a dictionary of strings suitable for saving or archiving.
@@ -142,17 +146,94 @@ class Dispatcher:
         Returns:
             DataFrame:  The processed dataframe.
 
+        Notes:
+            - The operations all work on one frame with missing values as np.NaN, which is converted
+              to BIDS form ('n/a') once at the end.  Read-only operations (summaries) share a single
+              BIDS form of the frame rather than each making their own copies.
+            - The HED operations share one HedContext, which is kept until an operation changes
+              the rows or the HED-relevant columns.
+
         """
 
         # string to functions
         if verbose:
             print(f"Reading {file_path}...")
-        df = self.get_data_file(file_path)
-        for operation in self.parsed_ops:
-            df = self.prep_data(df)
-            df = operation.do_op(self, df, file_path, sidecar=sidecar)
-            df = self.post_proc_data(df)
-        return df
+        df = self.normalize_data(self.get_data_file(file_path))
+        self._share_data = True
+        try:
+            for operation in self.parsed_ops:
+                df = operation.do_op(self, df, file_path, sidecar=sidecar)
+                if not operation.READ_ONLY:
+                    self._bids_data = None
+                    df = self.normalize_data(df)
+                    if self._hed_context is not None and not self._hed_context.is_current(df):
+                        self._hed_context = None
+            return self.get_bids_data(df)
+        finally:
+            self._share_data = False
+            self._bids_data = None
+            self._hed_context = None
+
+    def get_bids_data(self, df):
+        """ Return the data in BIDS form, with missing values as 'n/a', for operations that only read it.
+
+        Parameters:
+            df (DataFrame): The DataFrame being remodeled, with missing values as np.NaN.
+
+        Returns:
+            DataFrame: A DataFrame with the missing values replaced by 'n/a'.
+
+        Notes:
+            - While run_operations is running, consecutive calls for the same df return the same DataFrame,
+              so it must not be modified.
+
+        """
+        if self._bids_data is not None and self._bids_data[0] is df:
+            return self._bids_data[1]
+        bids_df = self.post_proc_data(df)
+        if self._share_data:
+            self._bids_data = (df, bids_df)
+        return bids_df
+
+    def get_hed_context(self, df, name, sidecar=None):
+        """ Return the HED information for the data, computing it only when first needed.
+
+        Parameters:
+            df (DataFrame): The DataFrame being remodeled, with missing values as np.NaN.
+            name (str): Unique identifier for the dataframe -- often the original file path.
+            sidecar (Sidecar or file-like): The sidecar for the data.
+
+        Returns:
+            HedContext: The HED information for the data in BIDS form.
+
+        Notes:
+            - While run_operations is running, the same HedContext is returned to every HED operation
+              on a file until an operation changes the rows or the HED-relevant columns.
+
+        """
+        if self._hed_context is not None:
+            return self._hed_context
+        hed_context = HedContext(self.get_bids_data(df), name, sidecar, self.hed_schema, source_df=df)
+        if self._share_data:
+            self._hed_context = hed_context
+        return hed_context
+
+    def merge_summaries(self, summary_dicts):
+        """ Add summaries computed by another dispatcher with the same operations.
+
+        Parameters:
+            summary_dicts (dict): The summary_dicts of the other dispatcher, keyed by summary name.
+
+        Notes:
+            - This is used to combine the summaries of files remodeled in worker processes.
+
+        """
+        for summary_name, summary_item in summary_dicts.items():
+            existing = self.summary_dicts.get(summary_name)
+            if existing is None:
+                self.summary_dicts[summary_name] = summary_item
+            else:
+                existing.merge_summary(summary_item)
 
     def save_summaries(self, save_formats=['.json', '.txt'], individual_summaries="separate",
                        summary_dir=None, task_name=""):
@@ -219,6 +300,36 @@ class Dispatcher:
         """
         return df.replace('n/a', np.NaN)
 
+    @staticmethod
+    def normalize_data(df):
+        """ Convert categorical columns to strings and replace 'n/a' entries by np.NaN, copying only changed columns.
+
+        Parameters:
+            df (DataFrame): The DataFrame to be processed.
+
+        Returns:
+            DataFrame: df itself if nothing needed to change, otherwise a new DataFrame.
+
+        Notes:
+            - This gives the same values as post_proc_data followed by prep_data, without copying the whole frame.
+
+        """
+        changed = {}
+        for index, typ in enumerate(df.dtypes):
+            column = df.iloc[:, index]
+            new_column = column
+            if typ == 'category':
+                new_column = column.astype(str)
+            if new_column.dtype == object:
+                na_mask = new_column.to_numpy() == 'n/a'
+                if na_mask.any():
+                    new_column = new_column.mask(na_mask)
+            if new_column is not column:
+                changed[index] = new_column
+        if not changed:
+            return df
+        return Dispatcher._replace_columns(df, changed)
+
     @staticmethod
     def post_proc_data(df):
         """ Replace all nan entries with 'n/a' for BIDS compliance
@@ -227,15 +338,34 @@ class Dispatcher:
             df (DataFrame): The DataFrame to be processed.
 
         Returns:
-            DataFrame: DataFrame with the 'np.NAN replaced by 'n/a'
+            DataFrame: A new DataFrame with the np.NAN replaced by 'n/a'
 
         """
-        dtypes = df.dtypes.to_dict()
-        for col_name, typ in dtypes.items():
-            if typ == 'category':
-                df[col_name] = df[col_name].astype(str)
+        changed = {index: df.iloc[:, index].astype(str) for index, typ in enumerate(df.dtypes) if typ == 'category'}
+        if changed:
+            df = Dispatcher._replace_columns(df, changed)
         return df.fillna('n/a')
 
+    @staticmethod
+    def _replace_columns(df, changed):
+        """ Return a new DataFrame with the columns at some positions replaced, leaving df unchanged.
+
+        Parameters:
+            df (DataFrame): The DataFrame whose columns are replaced.
+            changed (dict): The new columns (Series with the index of df) keyed by column position.
+
+        Returns:
+            DataFrame: A new DataFrame sharing the unchanged columns of df.
+
+        Notes:
+            - Columns are matched by position, so this works when df has duplicate column names.
+
+        """
+        columns = [changed.get(index, df.iloc[:, index]) for index in range(len(df.columns))]
+        new_df = pd.concat(columns, axis=1, copy=False)
+        new_df.columns = df.columns
+        return new_df
+
     @staticmethod
     def errors_to_str(messages, title="", sep='\n'):
         error_list = [0]*len(messages)
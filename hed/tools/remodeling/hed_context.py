@@ -0,0 +1,114 @@
+""" The HED information about one tabular file that is shared by the remodeling operations. """
+
+import os
+from hed.models.sidecar import Sidecar
+from hed.models.tabular_input import TabularInput
+from hed.models.df_util import get_assembled
+from hed.tools.analysis.event_manager import EventManager
+
+
+class HedContext:
+    """ The HED information about one tabular file, computed only when first needed.
+
+    The remodeling operations that use HED get this from the Dispatcher, so that a file is only
+    assembled and parsed once no matter how many HED operations are run on it.  None of the objects
+    returned should be modified.
+
+    """
+
+    def __init__(self, df, name, sidecar, hed_schema, source_df=None):
+        """ Create the HED context for a tabular file.
+
+        Parameters:
+            df (DataFrame): The data in BIDS form with missing values as 'n/a'.
+            name (str): Unique identifier for the dataframe -- often the original file path.
+            sidecar (Sidecar, str, file-like, or None): The sidecar for the file.
+            hed_schema (HedSchema or HedSchemaGroup): The schema used to parse the HED strings.
+            source_df (DataFrame or None): The frame df was derived from, used by is_current (defaults to df).
+
+        """
+        if sidecar and not isinstance(sidecar, Sidecar):
+            sidecar_name = os.path.basename(sidecar) if isinstance(sidecar, str) else None
+            sidecar = Sidecar(files=sidecar, name=sidecar_name)
+        self.df = df
+        self.name = name
+        self.sidecar = sidecar
+        self.hed_schema = hed_schema
+        self._source_df = df if source_df is None else source_df
+        self._hed_columns = self.get_hed_columns(self._source_df)
+        self._input_data = None
+        self._def_dict = None
+        self._hed_strings = None
+        self._event_manager = None
+
+    @property
+    def input_data(self):
+        """ The TabularInput for the file. """
+        if self._input_data is None:
+            self._input_data = TabularInput(self.df, sidecar=self.sidecar, name=self.name)
+        return self._input_data
+
+    @property
+    def def_dict(self):
+        """ The DefinitionDict with the definitions for the file. """
+        if self._def_dict is None:
+            self._def_dict = self.input_data.get_def_dict(self.hed_schema)
+        return self._def_dict
+
+    @property
+    def assembled_strings(self):
+        """ The assembled HED string of each row as a list of str. """
+        return self.input_data.series_a.tolist()
+
+    @property
+    def hed_strings(self):
+        """ The assembled HedString of each row with the definitions expanded. """
+        if self._hed_strings is None:
+            self._hed_strings, _ = get_assembled(self.input_data, self.sidecar, self.hed_schema, extra_def_dicts=None,
+                                                 join_columns=True, shrink_defs=False, expand_defs=True)
+        return self._hed_strings
+
+    @property
+    def event_manager(self):
+        """ The EventManager for the file.
+
+        :raises HedFileError:
+            - If there are any unmatched offsets.
+        """
+        if self._event_manager is None:
+            self._event_manager = EventManager(self.input_data, self.hed_schema)
+        return self._event_manager
+
+    def get_hed_columns(self, df):
+        """ Return the columns of df that contribute to the HED annotations or the event timing.
+
+        Parameters:
+            df (DataFrame): The data being remodeled.
+
+        Returns:
+            list: The names of the HED column, the onset column, and the columns described by the sidecar, in df order.
+
+        """
+        hed_names = {TabularInput.HED_COLUMN_NAME, "onset"}
+        if self.sidecar:
+            hed_names.update(self.sidecar.loaded_dict.keys())
+        return [column for column in df.columns if column in hed_names]
+
+    def is_current(self, df):
+        """ Return True if df has the same HED information as the frame this context was created from.
+
+        Parameters:
+            df (DataFrame): The data being remodeled.
+
+        Returns:
+            bool: True if df has the same rows and the same values in the HED-relevant columns.
+
+        Notes:
+            - Operations that only add or change other columns, such as the factor operations, keep the context.
+
+        """
+        if df is self._source_df:
+            return True
+        if not df.index.equals(self._source_df.index) or self.get_hed_columns(df) != self._hed_columns:
+            return False
+        return all(df[column].equals(self._source_df[column]) for column in self._hed_columns)
@@ -6,8 +6,13 @@ class BaseOp:
 
     The base class holds the parameters and does basic parameter checking against the operation's specification.
 
+    Operations that only read the data (such as summaries) set READ_ONLY to True and return the DataFrame
+    they were given without copying it.
+
     """
 
+    READ_ONLY = False
+
     def __init__(self, op_spec, parameters):
         """ Base class constructor for operations.
 
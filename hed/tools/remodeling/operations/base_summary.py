@@ -247,6 +247,67 @@ class BaseSummary(ABC):
         """
         raise NotImplementedError
 
+    def merge_summary(self, other):
+        """ Add the information for the files summarized by another summary of the same operation.
+
+        Parameters:
+            other (BaseSummary): A summary of other files, for example one computed in a worker process.
+
+        Notes:
+            - The files in other are added after the files already in this summary.
+
+        """
+        self.summary_dict.update(other.summary_dict)
+
+    def to_json_dict(self):
+        """ Return the information for each file in a form that can be saved as JSON.
+
+        Returns:
+            dict: The information for each file keyed by file name.
+
+        :raises NotImplementedError:
+            - If this summary does not implement info_to_json.
+
+        """
+        return {name: self.info_to_json(info) for name, info in self.summary_dict.items()}
+
+    def update_from_json_dict(self, json_dict):
+        """ Add the information for the files in a dictionary returned by to_json_dict.
+
+        Parameters:
+            json_dict (dict): The information for each file keyed by file name.
+
+        """
+        for name, info in json_dict.items():
+            self.summary_dict[name] = self.info_from_json(info)
+
+    def info_to_json(self, info):
+        """ Return the information for one file in a form that can be saved as JSON.
+
+        Parameters:
+            info (object):  A value of summary_dict.
+
+        Returns:
+            object: The information as JSON-compatible dicts, lists, and values.
+
+        Notes:
+            Summaries whose files can be skipped by incremental remodeling implement this and info_from_json.
+
+        """
+        raise NotImplementedError
+
+    def info_from_json(self, json_info):
+        """ Return the information for one file from the value returned by info_to_json.
+
+        Parameters:
+            json_info (object):  The information as returned by info_to_json.
+
+        Returns:
+            object: The value to put in summary_dict.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def update_summary(self, summary_dict):
         """ Method to update summary for a given tabular input.
@@ -4,11 +4,7 @@
 import pandas as pd
 import numpy as np
 from hed.tools.remodeling.operations.base_op import BaseOp
-from hed.models.tabular_input import TabularInput
-from hed.models.sidecar import Sidecar
-from hed.models.df_util import get_assembled
 from hed.tools.analysis.analysis_util import get_expression_parsers, search_strings
-from hed.tools.analysis.event_manager import EventManager
 
 
 class FactorHedTagsOp(BaseOp):
@@ -81,19 +77,14 @@ class FactorHedTagsOp(BaseOp):
 
         """
 
-        if sidecar and not isinstance(sidecar, Sidecar):
-            sidecar = Sidecar(sidecar)
-        input_data = TabularInput(df.copy(), sidecar=sidecar, name=name)
         column_names = list(df.columns)
         for query_name in self.query_names:
             if query_name in column_names:
                 raise ValueError("QueryNameAlreadyColumn",
                                  f"Query [{query_name}]: is already a column name of the data frame")
-        df_list = [input_data.dataframe]
-        event_man = EventManager(input_data, dispatcher.hed_schema)
-        hed_strings, _ = get_assembled(input_data, sidecar, dispatcher.hed_schema, extra_def_dicts=None,
-                                       join_columns=True, shrink_defs=False, expand_defs=True)
-        df_factors = search_strings(hed_strings, self.expression_parsers, query_names=self.query_names)
+        df_list = [df]
+        hed_context = dispatcher.get_hed_context(df, name, sidecar=sidecar)
+        df_factors = search_strings(hed_context.hed_strings, self.expression_parsers, query_names=self.query_names)
         if len(df_factors.columns) > 0:
             df_list.append(df_factors)
         df_new = pd.concat(df_list, axis=1)
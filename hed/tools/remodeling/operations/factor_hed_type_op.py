@@ -3,8 +3,6 @@
 import pandas as pd
 import numpy as np
 from hed.tools.remodeling.operations.base_op import BaseOp
-from hed.models.tabular_input import TabularInput
-from hed.tools.analysis.event_manager import EventManager
 from hed.tools.analysis.hed_type_manager import HedTypeManager
 
 # TODO: restricted factor values are not implemented yet.
@@ -66,9 +64,8 @@ class FactorHedTypeOp(BaseOp):
 
         """
 
-        input_data = TabularInput(df, sidecar=sidecar, name=name)
-        df_list = [input_data.dataframe.copy()]
-        var_manager = HedTypeManager(EventManager(input_data, dispatcher.hed_schema))
+        df_list = [df]
+        var_manager = HedTypeManager(dispatcher.get_hed_context(df, name, sidecar=sidecar).event_manager)
         var_manager.add_type(self.type_tag.lower())
 
         df_factors = var_manager.get_factor_vectors(self.type_tag, self.type_values, factor_encoding="one-hot")
@@ -58,10 +58,9 @@ class RemoveColumnsOp(BaseOp):
             - If ignore_missing is False and a column not in the data is to be removed.
 
         """
-        df_new = df.copy()
         try:
-            return df_new.drop(self.column_names, axis=1, errors=self.error_handling)
+            return df.drop(self.column_names, axis=1, errors=self.error_handling)
         except KeyError:
             raise KeyError("MissingColumnCannotBeRemoved",
                            f"{name}: Ignore missing is False but a column in {str(self.column_names)} is "
-                           f"not in the data columns [{str(df_new.columns)}]")
+                           f"not in the data columns [{str(df.columns)}]")
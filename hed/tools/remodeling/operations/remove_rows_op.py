@@ -1,5 +1,6 @@
 """ Remove rows from a tabular file. """
 
+import numpy as np
 from hed.tools.remodeling.operations.base_op import BaseOp
 
 
@@ -52,9 +53,9 @@ class RemoveRowsOp(BaseOp):
             Dataframe: A new dataframe after processing.
 
         """
-        df_new = df.copy()
-        if self.column_name not in df_new.columns:
-            return df_new
+        if self.column_name not in df.columns:
+            return df.copy()
+        keep_mask = np.ones(len(df), dtype=bool)
         for value in self.remove_values:
-            df_new = df_new.loc[df_new[self.column_name] != value, :]
-        return df_new
+            keep_mask &= (df[self.column_name] != value).to_numpy()
+        return df.loc[keep_mask, :]
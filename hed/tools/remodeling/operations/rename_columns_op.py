@@ -58,9 +58,8 @@ class RenameColumnsOp (BaseOp):
             - When ignore_missing is false and column_mapping has columns not in the data.
 
         """
-        df_new = df.copy()
         try:
-            return df_new.rename(columns=self.column_mapping, errors=self.error_handling)
+            return df.rename(columns=self.column_mapping, errors=self.error_handling)
         except KeyError:
             raise KeyError("MappedColumnsMissingFromData",
                            f"{name}: ignore_missing is False, mapping columns [{self.column_mapping}]"
@@ -57,17 +57,16 @@ class ReorderColumnsOp(BaseOp):
             - When ignore_missing is false and column_order has columns not in the data.
 
         """
-        df_new = df.copy()
-        current_columns = list(df_new.columns)
-        missing_columns = set(self.column_order).difference(set(df_new.columns))
+        current_columns = list(df.columns)
+        missing_columns = set(self.column_order).difference(set(df.columns))
         ordered = self.column_order
         if missing_columns and not self.ignore_missing:
             raise ValueError("MissingReorderedColumns",
                              f"{str(missing_columns)} are not in dataframe columns "
-                             f" [{str(df_new.columns)}] and not ignored.")
+                             f" [{str(df.columns)}] and not ignored.")
         elif missing_columns:
             ordered = [elem for elem in self.column_order if elem not in list(missing_columns)]
         if self.keep_others:
             ordered += [elem for elem in current_columns if elem not in ordered]
-        df_new = df_new.loc[:, ordered]
+        df_new = df.loc[:, ordered]
         return df_new
@@ -16,6 +16,8 @@ class SummarizeColumnNamesOp(BaseOp):
 
     """
 
+    READ_ONLY = True
+
     PARAMS = {
         "operation": "summarize_column_names",
         "required_parameters": {
@@ -48,6 +50,18 @@ class SummarizeColumnNamesOp(BaseOp):
         self.summary_filename = parameters['summary_filename']
         self.append_timecode = parameters.get('append_timecode', False)
 
+    def make_summary(self, dispatcher):
+        """ Return an empty summary for this operation.
+
+        Parameters:
+            dispatcher (Dispatcher): Manages the operation I/O.
+
+        Returns:
+            ColumnNamesSummary: A summary without any files.
+
+        """
+        return ColumnNamesSummary(self)
+
     def do_op(self, dispatcher, df, name, sidecar=None):
         """ Create a column name summary for df.
 
@@ -58,19 +72,18 @@ class SummarizeColumnNamesOp(BaseOp):
             sidecar (Sidecar or file-like):  Not needed for this operation.
 
         Returns:
-            DataFrame: A copy of df.
+            DataFrame: The unchanged df.
 
         Side-effect:
             Updates the relevant summary.
 
         """
-        df_new = df.copy()
         summary = dispatcher.summary_dicts.get(self.summary_name, None)
         if not summary:
-            summary = ColumnNamesSummary(self)
+            summary = self.make_summary(dispatcher)
             dispatcher.summary_dicts[self.summary_name] = summary
-        summary.update_summary({"name": name, "column_names": list(df_new.columns)})
-        return df_new
+        summary.update_summary({"name": name, "column_names": list(df.columns)})
+        return df
 
 
 class ColumnNamesSummary(BaseSummary):
@@ -110,6 +123,30 @@ class ColumnNamesSummary(BaseSummary):
                 "Files": [name for name in column_summary.file_dict.keys()],
                 "Specifics": {"Columns": summary['Columns']}}
 
+    def info_to_json(self, info):
+        """ Return the column names for one file in a form that can be saved as JSON.
+
+        Parameters:
+            info (ColumnNameSummary):  The column names for one file.
+
+        Returns:
+            dict: The column names as returned by ColumnNameSummary.to_dict.
+
+        """
+        return info.to_dict()
+
+    def info_from_json(self, json_info):
+        """ Return the column names for one file from the value returned by info_to_json.
+
+        Parameters:
+            json_info (dict):  The column names as returned by ColumnNameSummary.to_dict.
+
+        Returns:
+            ColumnNameSummary: The column names for the file.
+
+        """
+        return ColumnNameSummary.from_dict(json_info)
+
     def merge_all_info(self):
         """ Create a ColumnNameSummary containing the overall dataset summary.
 
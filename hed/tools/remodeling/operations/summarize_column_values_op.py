@@ -21,6 +21,8 @@ class SummarizeColumnValuesOp(BaseOp):
 
     """
 
+    READ_ONLY = True
+
     PARAMS = {
         "operation": "summarize_column_values",
         "required_parameters": {
@@ -64,6 +66,18 @@ class SummarizeColumnValuesOp(BaseOp):
         self.max_categorical = parameters.get('max_categorical', float('inf'))
         self.values_per_line = parameters.get('values_per_line', self.VALUES_PER_LINE)
 
+    def make_summary(self, dispatcher):
+        """ Return an empty summary for this operation.
+
+        Parameters:
+            dispatcher (Dispatcher): Manages the operation I/O.
+
+        Returns:
+            ColumnValueSummary: A summary without any files.
+
+        """
+        return ColumnValueSummary(self)
+
     def do_op(self, dispatcher, df, name, sidecar=None):
         """ Create a summary of the column values in df.
 
@@ -74,20 +88,18 @@ class SummarizeColumnValuesOp(BaseOp):
             sidecar (Sidecar or file-like): Not needed for this operation.
 
         Returns:
-            DataFrame: A copy of df.
+            DataFrame: The unchanged df.
 
         Side effect:
             Updates the relevant summary.
 
         """
-
-        df_new = df.copy()
         summary = dispatcher.summary_dicts.get(self.summary_name, None)
         if not summary:
-            summary = ColumnValueSummary(self)
+            summary = self.make_summary(dispatcher)
             dispatcher.summary_dicts[self.summary_name] = summary
-        summary.update_summary({'df': dispatcher.post_proc_data(df_new), 'name': name})
-        return df_new
+        summary.update_summary({'df': dispatcher.get_bids_data(df), 'name': name})
+        return df
 
 
 class ColumnValueSummary(BaseSummary):
@@ -137,6 +149,30 @@ class ColumnValueSummary(BaseSummary):
                               "Categorical column summaries": this_summary['Categorical columns'],
                               "Categorical counts": this_summary['Categorical counts']}}
 
+    def info_to_json(self, info):
+        """ Return the column values for one file in a form that can be saved as JSON.
+
+        Parameters:
+            info (TabularSummary):  The column values for one file.
+
+        Returns:
+            dict: The column values as returned by TabularSummary.to_dict.
+
+        """
+        return info.to_dict()
+
+    def info_from_json(self, json_info):
+        """ Return the column values for one file from the value returned by info_to_json.
+
+        Parameters:
+            json_info (dict):  The column values as returned by TabularSummary.to_dict.
+
+        Returns:
+            TabularSummary: The column values for the file.
+
+        """
+        return TabularSummary.from_dict(json_info)
+
     def merge_all_info(self):
         """ Create a TabularSummary containing the overall dataset summary.
 
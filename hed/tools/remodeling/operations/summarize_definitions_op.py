@@ -4,6 +4,7 @@ from hed import TabularInput
 from hed.tools.remodeling.operations.base_op import BaseOp
 from hed.tools.remodeling.operations.base_summary import BaseSummary
 from hed.models.def_expand_gather import DefExpandGatherer
+from hed.models.definition_dict import DefinitionDict
 
 
 class SummarizeDefinitionsOp(BaseOp):
@@ -17,6 +18,8 @@ class SummarizeDefinitionsOp(BaseOp):
 
     """
 
+    READ_ONLY = True
+
     PARAMS = {
         "operation": "summarize_definitions",
         "required_parameters": {
@@ -48,6 +51,18 @@ class SummarizeDefinitionsOp(BaseOp):
         self.summary_filename = parameters['summary_filename']
         self.append_timecode = parameters.get('append_timecode', False)
 
+    def make_summary(self, dispatcher):
+        """ Return an empty summary for this operation.
+
+        Parameters:
+            dispatcher (Dispatcher): Manages the operation I/O.
+
+        Returns:
+            DefinitionSummary: A summary without any files.
+
+        """
+        return DefinitionSummary(self, dispatcher.hed_schema)
+
     def do_op(self, dispatcher, df, name, sidecar=None):
         """ Create summaries of type_defs
 
@@ -58,24 +73,34 @@ class SummarizeDefinitionsOp(BaseOp):
             sidecar (Sidecar or file-like): Only needed for HED operations.
 
         Returns:
-            DataFrame: a copy of df
+            DataFrame: The unchanged df.
 
         Side-effect:
             Updates the relevant summary.
 
         """
-        df_new = df.copy()
-        summary = dispatcher.summary_dicts.setdefault(self.summary_name,
-                                                      DefinitionSummary(self, dispatcher.hed_schema))
-        summary.update_summary({'df': dispatcher.post_proc_data(df_new), 'name': name, 'sidecar': sidecar,
+        summary = dispatcher.summary_dicts.setdefault(self.summary_name, self.make_summary(dispatcher))
+        summary.update_summary({'df': dispatcher.get_bids_data(df), 'name': name, 'sidecar': sidecar,
                                 'schema': dispatcher.hed_schema})
-        return df_new
+        return df
 
 
 class DefinitionSummary(BaseSummary):
     def __init__(self, sum_op, hed_schema, known_defs=None):
         super().__init__(sum_op)
-        self.def_gatherer = DefExpandGatherer(hed_schema, known_defs=known_defs)
+        self.hed_schema = hed_schema
+        self.known_defs = known_defs
+        self.def_expand_inputs = []
+        self._def_gatherer = None
+
+    @property
+    def def_gatherer(self):
+        """ The DefExpandGatherer with the definitions gathered from all the files in order. """
+        if self._def_gatherer is None:
+            self._def_gatherer = DefExpandGatherer(self.hed_schema, known_defs=self.known_defs)
+            for hed_strings, def_dict in self.def_expand_inputs:
+                self._def_gatherer.process_def_expands(hed_strings, def_dict)
+        return self._def_gatherer
 
     def update_summary(self, new_info):
         """ Update the summary for a given tabular input file.
@@ -85,11 +110,55 @@ class DefinitionSummary(BaseSummary):
 
         Notes:
             - The summary needs a "name" str, a "schema" and a "Sidecar".
+            - Only the HED strings with Def-expand tags are kept.  The definitions are gathered when needed,
+              since the results depend on the order in which the files are processed.
 
         """
         data_input = TabularInput(new_info['df'], sidecar=new_info['sidecar'], name=new_info['name'])
         series, def_dict = data_input.series_a, data_input.get_def_dict(new_info['schema'])
-        self.def_gatherer.process_def_expands(series, def_dict)
+        def_expands = list(series[series.str.contains('Def-Expand/', case=False)])
+        self.def_expand_inputs.append((def_expands, def_dict))
+        self._def_gatherer = None
+
+    def merge_summary(self, other):
+        """ Add the files summarized by another DefinitionSummary of the same operation.
+
+        Parameters:
+            other (DefinitionSummary): A summary of other files, for example one computed in a worker process.
+
+        """
+        self.def_expand_inputs += other.def_expand_inputs
+        self._def_gatherer = None
+
+    def to_json_dict(self):
+        """ Return the HED strings and definitions of the files in a form that can be saved as JSON.
+
+        Returns:
+            dict: The Def-expand strings and the definition strings of each file in the order processed.
+
+        """
+        inputs = [[hed_strings, [self._get_definition_string(entry) for entry in def_dict.defs.values()]]
+                  for hed_strings, def_dict in self.def_expand_inputs]
+        return {"def_expand_inputs": inputs}
+
+    def update_from_json_dict(self, json_dict):
+        """ Add the files in a dictionary returned by to_json_dict.
+
+        Parameters:
+            json_dict (dict): The Def-expand strings and the definition strings of each file.
+
+        """
+        for hed_strings, definitions in json_dict["def_expand_inputs"]:
+            self.def_expand_inputs.append((list(hed_strings), DefinitionDict(list(definitions), self.hed_schema)))
+        self._def_gatherer = None
+
+    @staticmethod
+    def _get_definition_string(entry):
+        """ Return the text of a Definition group with the name and contents of a DefinitionEntry. """
+        def_tag = f"Definition/{entry.name}/#" if entry.takes_value else f"Definition/{entry.name}"
+        if entry.contents:
+            return f"({def_tag},{str(entry.contents)})"
+        return f"({def_tag})"
 
     @staticmethod
     def _build_summary_dict(items_dict, title, process_func, display_description=False):
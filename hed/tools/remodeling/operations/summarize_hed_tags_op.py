@@ -1,8 +1,6 @@
 """ Summarize the HED tags in collection of tabular files.  """
 
-from hed.models.tabular_input import TabularInput
 from hed.tools.analysis.hed_tag_counts import HedTagCounts
-from hed.tools.analysis.event_manager import EventManager
 from hed.tools.analysis.hed_tag_manager import HedTagManager
 from hed.tools.remodeling.operations.base_op import BaseOp
 from hed.tools.remodeling.operations.base_summary import BaseSummary
@@ -26,6 +24,8 @@ class SummarizeHedTagsOp(BaseOp):
 
     """
 
+    READ_ONLY = True
+
     PARAMS = {
         "operation": "summarize_hed_tags",
         "required_parameters": {
@@ -66,6 +66,18 @@ class SummarizeHedTagsOp(BaseOp):
         self.replace_defs = parameters.get("replace_defs", True)
         self.remove_types = parameters.get("remove_types", ["Condition-variable", "Task"])
 
+    def make_summary(self, dispatcher):
+        """ Return an empty summary for this operation.
+
+        Parameters:
+            dispatcher (Dispatcher): Manages the operation I/O.
+
+        Returns:
+            HedTagSummary: A summary without any files.
+
+        """
+        return HedTagSummary(self)
+
     def do_op(self, dispatcher, df, name, sidecar=None):
         """ Summarize the HED tags present in the dataset.
 
@@ -76,20 +88,20 @@ class SummarizeHedTagsOp(BaseOp):
             sidecar (Sidecar or file-like):  Only needed for HED operations.
 
         Returns:
-            DataFrame: A copy of df.
+            DataFrame: The unchanged df.
 
         Side effect:
             Updates the context.
 
         """
-        df_new = df.copy()
         summary = dispatcher.summary_dicts.get(self.summary_name, None)
         if not summary:
-            summary = HedTagSummary(self)
+            summary = self.make_summary(dispatcher)
             dispatcher.summary_dicts[self.summary_name] = summary
-        summary.update_summary({'df': dispatcher.post_proc_data(df_new), 'name': name,
-                                'schema': dispatcher.hed_schema, 'sidecar': sidecar})
-        return df_new
+        hed_context = dispatcher.get_hed_context(df, name, sidecar=sidecar)
+        summary.update_summary({'df': dispatcher.get_bids_data(df), 'name': name, 'schema': dispatcher.hed_schema,
+                                'sidecar': hed_context.sidecar, 'hed_context': hed_context})
+        return df
 
 
 class HedTagSummary(BaseSummary):
@@ -105,17 +117,14 @@ class HedTagSummary(BaseSummary):
             new_info (dict):  A dictionary with the parameters needed to update a summary.
 
         Notes:
-            - The summary needs a "name" str, a "schema", a "df, and a "Sidecar".
+            - The summary needs a "name" str, a "df", and a "hed_context" HedContext.
 
         """
         counts = HedTagCounts(new_info['name'], total_events=len(new_info['df']))
-        input_data = TabularInput(new_info['df'], sidecar=new_info['sidecar'], name=new_info['name'])
-        tag_man = HedTagManager(EventManager(input_data, new_info['schema']), 
-                                remove_types=self.sum_op.remove_types)
+        tag_man = HedTagManager(new_info['hed_context'].event_manager, remove_types=self.sum_op.remove_types)
         hed_objs = tag_man.get_hed_objs(include_context=self.sum_op.include_context, 
                                         replace_defs=self.sum_op.replace_defs)
-        for hed in hed_objs:
-            counts.update_event_counts(hed, new_info['name'])
+        counts.update_counts(hed_objs, new_info['name'])
         self.summary_dict[new_info["name"]] = counts
 
     def get_details_dict(self, tag_counts):
@@ -158,6 +167,30 @@ class HedTagSummary(BaseSummary):
             return self._get_dataset_string(result, indent=indent)
         return self._get_individual_string(result, indent=indent)
 
+    def info_to_json(self, info):
+        """ Return the tag counts for one file in a form that can be saved as JSON.
+
+        Parameters:
+            info (HedTagCounts):  The tag counts for one file.
+
+        Returns:
+            dict: The tag counts as returned by HedTagCounts.to_dict.
+
+        """
+        return info.to_dict()
+
+    def info_from_json(self, json_info):
+        """ Return the tag counts for one file from the value returned by info_to_json.
+
+        Parameters:
+            json_info (dict):  The tag counts as returned by HedTagCounts.to_dict.
+
+        Returns:
+            HedTagCounts: The tag counts for the file.
+
+        """
+        return HedTagCounts.from_dict(json_info)
+
     def merge_all_info(self):
         """ Create a HedTagCounts containing the overall dataset HED tag  summary.
 
@@ -168,10 +201,7 @@ class HedTagSummary(BaseSummary):
 
         all_counts = HedTagCounts('Dataset')
         for key, counts in self.summary_dict.items():
-            all_counts.merge_tag_dicts(counts.tag_dict)
-            for file_name in counts.files.keys():
-                all_counts.files[file_name] = ""
-            all_counts.total_events = all_counts.total_events + counts.total_events
+            all_counts.merge(counts)
         return all_counts
 
     @staticmethod
@@ -1,10 +1,7 @@
 """ Summarize a HED type tag in a collection of tabular files. """
 
-from hed.models.tabular_input import TabularInput
-from hed.models.sidecar import Sidecar
 from hed.tools.analysis.hed_type import HedType
 from hed.tools.analysis.hed_type_counts import HedTypeCounts
-from hed.tools.analysis.event_manager import EventManager
 from hed.tools.remodeling.operations.base_op import BaseOp
 from hed.tools.remodeling.operations.base_summary import BaseSummary
 
@@ -22,6 +19,8 @@ class SummarizeHedTypeOp(BaseOp):
 
     """
 
+    READ_ONLY = True
+
     PARAMS = {
         "operation": "summarize_hed_type",
         "required_parameters": {
@@ -56,6 +55,18 @@ class SummarizeHedTypeOp(BaseOp):
         self.type_tag = parameters['type_tag'].lower()
         self.append_timecode = parameters.get('append_timecode', False)
 
+    def make_summary(self, dispatcher):
+        """ Return an empty summary for this operation.
+
+        Parameters:
+            dispatcher (Dispatcher): Manages the operation I/O.
+
+        Returns:
+            HedTypeSummary: A summary without any files.
+
+        """
+        return HedTypeSummary(self)
+
     def do_op(self, dispatcher, df, name, sidecar=None):
         """ Summarize a specified HED type variable such as Condition-variable .
 
@@ -66,20 +77,20 @@ class SummarizeHedTypeOp(BaseOp):
             sidecar (Sidecar or file-like): Usually required unless event file has a HED column.
 
         Returns:
-            DataFrame: A copy of df
+            DataFrame: The unchanged df.
 
         Side effect:
             Updates the relevant summary.
 
         """
-        df_new = df.copy()
         summary = dispatcher.summary_dicts.get(self.summary_name, None)
         if not summary:
-            summary = HedTypeSummary(self)
+            summary = self.make_summary(dispatcher)
             dispatcher.summary_dicts[self.summary_name] = summary
-        summary.update_summary({'df': dispatcher.post_proc_data(df_new), 'name': name,
-                                'schema': dispatcher.hed_schema, 'sidecar': sidecar})
-        return df_new
+        hed_context = dispatcher.get_hed_context(df, name, sidecar=sidecar)
+        summary.update_summary({'df': dispatcher.get_bids_data(df), 'name': name, 'schema': dispatcher.hed_schema,
+                                'sidecar': hed_context.sidecar, 'hed_context': hed_context})
+        return df
 
 
 class HedTypeSummary(BaseSummary):
@@ -95,15 +106,11 @@ class HedTypeSummary(BaseSummary):
             new_info (dict):  A dictionary with the parameters needed to update a summary.
 
         Notes:
-            - The summary needs a "name" str, a "schema", a "df, and a "Sidecar".
+            - The summary needs a "name" str and a "hed_context" HedContext.
 
         """
 
-        sidecar = new_info['sidecar']
-        if sidecar and not isinstance(sidecar, Sidecar):
-            sidecar = Sidecar(sidecar)
-        input_data = TabularInput(new_info['df'], sidecar=sidecar, name=new_info['name'])
-        type_values = HedType(EventManager(input_data, new_info['schema']), new_info['name'], type_tag=self.type_tag)
+        type_values = HedType(new_info['hed_context'].event_manager, new_info['name'], type_tag=self.type_tag)
         counts = HedTypeCounts(new_info['name'], self.type_tag)
         counts.update_summary(type_values.get_summary(), type_values.total_events, new_info['name'])
         counts.add_descriptions(type_values.type_defs)
@@ -126,6 +133,30 @@ class HedTypeSummary(BaseSummary):
                 "Specifics": {"Type tag": summary.get('type_tag', 'condition-variable'),
                               "Type info": summary.get('details', {})}}
 
+    def info_to_json(self, info):
+        """ Return the type counts for one file in a form that can be saved as JSON.
+
+        Parameters:
+            info (HedTypeCounts):  The type counts for one file.
+
+        Returns:
+            dict: The type counts as returned by HedTypeCounts.to_dict.
+
+        """
+        return info.to_dict()
+
+    def info_from_json(self, json_info):
+        """ Return the type counts for one file from the value returned by info_to_json.
+
+        Parameters:
+            json_info (dict):  The type counts as returned by HedTypeCounts.to_dict.
+
+        Returns:
+            HedTypeCounts: The type counts for the file.
+
+        """
+        return HedTypeCounts.from_dict(json_info)
+
     def merge_all_info(self):
         """ Create a HedTypeCounts containing the overall dataset HED type summary.
 
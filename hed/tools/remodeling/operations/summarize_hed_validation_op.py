@@ -1,8 +1,7 @@
 """ Validate the HED tags in a dataset and report errors. """
 
-import os
+import json
 from hed.errors import ErrorSeverity, ErrorHandler
-from hed.models.sidecar import Sidecar
 from hed.models.tabular_input import TabularInput
 from hed.tools.remodeling.operations.base_op import BaseOp
 from hed.tools.remodeling.operations.base_summary import BaseSummary
@@ -20,6 +19,8 @@ class SummarizeHedValidationOp(BaseOp):
 
     """
 
+    READ_ONLY = True
+
     PARAMS = {
         "operation": "summarize_hed_validation",
         "required_parameters": {
@@ -54,6 +55,18 @@ class SummarizeHedValidationOp(BaseOp):
         self.append_timecode = parameters.get('append_timecode', False)
         self.check_for_warnings = parameters.get('check_for_warnings', False)
 
+    def make_summary(self, dispatcher):
+        """ Return an empty summary for this operation.
+
+        Parameters:
+            dispatcher (Dispatcher): Manages the operation I/O.
+
+        Returns:
+            HedValidationSummary: A summary without any files.
+
+        """
+        return HedValidationSummary(self)
+
     def do_op(self, dispatcher, df, name, sidecar=None):
         """ Validate the dataframe with the accompanying sidecar, if any.
 
@@ -64,20 +77,20 @@ class SummarizeHedValidationOp(BaseOp):
             sidecar (Sidecar or file-like): Usually needed unless only HED tags in HED column of event file.
 
         Returns:
-            DataFrame: A copy of df
+            DataFrame: The unchanged df.
 
         Side effect:
             Updates the relevant summary.
 
         """
-        df_new = df.copy()
         summary = dispatcher.summary_dicts.get(self.summary_name, None)
         if not summary:
-            summary = HedValidationSummary(self)
+            summary = self.make_summary(dispatcher)
             dispatcher.summary_dicts[self.summary_name] = summary
-        summary.update_summary({'df': dispatcher.post_proc_data(df_new), 'name': name,
-                                'schema': dispatcher.hed_schema, 'sidecar': sidecar})
-        return df_new
+        hed_context = dispatcher.get_hed_context(df, name, sidecar=sidecar)
+        summary.update_summary({'df': dispatcher.get_bids_data(df), 'name': name, 'schema': dispatcher.hed_schema,
+                                'sidecar': hed_context.sidecar, 'hed_context': hed_context})
+        return df
 
 
 class HedValidationSummary(BaseSummary):
@@ -122,12 +135,10 @@ class HedValidationSummary(BaseSummary):
             new_info (dict):  A dictionary with the parameters needed to update a summary.
 
         Notes:
-            - The summary needs a "name" str, a schema, a "df", and a "Sidecar".
+            - The summary needs a "name" str, a schema, a "df", and a "sidecar" Sidecar or None.
         """
 
         sidecar = new_info.get('sidecar', None)
-        if sidecar and not isinstance(sidecar, Sidecar):
-            sidecar = Sidecar(files=new_info['sidecar'], name=os.path.basename(sidecar))
         results = self._get_sidecar_results(sidecar, new_info, self.check_for_warnings)
         if not results['sidecar_had_issues']:
             input_data = TabularInput(new_info['df'], sidecar=sidecar)
@@ -154,6 +165,30 @@ class HedValidationSummary(BaseSummary):
                 "Files": summary_info.get("event_files", []),
                 "Specifics": summary_info}
 
+    def info_to_json(self, info):
+        """ Return the validation results for one file in a form that can be saved as JSON.
+
+        Parameters:
+            info (dict):  The validation results for one file.
+
+        Returns:
+            dict: A copy of the results with the tags and strings referenced by the issues replaced by their text.
+
+        """
+        return json.loads(json.dumps(info, default=str))
+
+    def info_from_json(self, json_info):
+        """ Return the validation results for one file from the value returned by info_to_json.
+
+        Parameters:
+            json_info (dict):  The validation results as returned by info_to_json.
+
+        Returns:
+            dict: The validation results for the file.
+
+        """
+        return json_info
+
     def merge_all_info(self):
         """ Create a dictionary containing all the errors in the dataset.
 
@@ -19,6 +19,8 @@ class SummarizeSidecarFromEventsOp(BaseOp):
 
     """
 
+    READ_ONLY = True
+
     PARAMS = {
         "operation": "summarize_sidecar_from_events",
         "required_parameters": {
@@ -56,6 +58,18 @@ class SummarizeSidecarFromEventsOp(BaseOp):
         self.value_columns = parameters['value_columns']
         self.append_timecode = parameters.get('append_timecode', False)
 
+    def make_summary(self, dispatcher):
+        """ Return an empty summary for this operation.
+
+        Parameters:
+            dispatcher (Dispatcher): Manages the operation I/O.
+
+        Returns:
+            EventsToSidecarSummary: A summary without any files.
+
+        """
+        return EventsToSidecarSummary(self)
+
     def do_op(self, dispatcher, df, name, sidecar=None):
         """ Extract a sidecar from events file.
 
@@ -66,20 +80,18 @@ class SummarizeSidecarFromEventsOp(BaseOp):
             sidecar (Sidecar or file-like): Not needed for this operation.
 
         Returns:
-            DataFrame: A copy of df.
+            DataFrame: The unchanged df.
 
         Side effect:
             Updates the associated summary if applicable.
 
         """
-
-        df_new = df.copy()
         summary = dispatcher.summary_dicts.get(self.summary_name, None)
         if not summary:
-            summary = EventsToSidecarSummary(self)
+            summary = self.make_summary(dispatcher)
             dispatcher.summary_dicts[self.summary_name] = summary
-        summary.update_summary({'df': dispatcher.post_proc_data(df_new), 'name': name})
-        return df_new
+        summary.update_summary({'df': dispatcher.get_bids_data(df), 'name': name})
+        return df
 
 
 class EventsToSidecarSummary(BaseSummary):
@@ -123,6 +135,30 @@ class EventsToSidecarSummary(BaseSummary):
                               "Skip columns": summary_info.skip_cols,
                               "Sidecar": summary_info.extract_sidecar_template()}}
 
+    def info_to_json(self, info):
+        """ Return the column values for one file in a form that can be saved as JSON.
+
+        Parameters:
+            info (TabularSummary):  The column values for one file.
+
+        Returns:
+            dict: The column values as returned by TabularSummary.to_dict.
+
+        """
+        return info.to_dict()
+
+    def info_from_json(self, json_info):
+        """ Return the column values for one file from the value returned by info_to_json.
+
+        Parameters:
+            json_info (dict):  The column values as returned by TabularSummary.to_dict.
+
+        Returns:
+            TabularSummary: The column values for the file.
+
+        """
+        return TabularSummary.from_dict(json_info)
+
     def merge_all_info(self):
         """ Merge summary information from all the files.
 
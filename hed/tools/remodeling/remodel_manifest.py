@@ -0,0 +1,206 @@
+""" Record of the inputs and summaries of remodeled files, used to skip files that have not changed. """
+
+import os
+import json
+from hashlib import sha1
+from hed.errors.exceptions import HedFileError
+from hed.models.sidecar import Sidecar
+
+MANIFEST_FORMAT_VERSION = 2
+
+
+class RemodelManifest:
+    """ The content hashes and per-file summaries of the files remodeled with one remodeling file.
+
+    Each entry is keyed by the path of the file relative to the dataset root and records:
+        - **settings**: A hash of the remodeling file, the HED schema version, and the version of this package.
+        - **input**: A hash of the file the operations read (the backup copy if there is a backup).
+        - **sidecar**: A hash of the sidecar used for the file.
+        - **output**: A hash of the file in the dataset after it was remodeled.
+        - **summaries**: The summaries of this file alone, as returned by the to_json_dict of each summary.
+
+    Notes:
+        - The manifest lives in the dataset, so it only holds JSON and the summaries are rebuilt from it
+          by the summary operations of the dispatcher rather than unpickled.
+
+    """
+
+    MANIFEST_PATH = 'remodel/manifests'
+    MANIFEST_SUFFIX = '_manifest.json'
+
+    def __init__(self, manifest_path):
+        """ Load the manifest from manifest_path, or start an empty one if it does not exist or cannot be read.
+
+        Parameters:
+            manifest_path (str): Full path of the manifest file.
+
+        """
+        self.manifest_path = manifest_path
+        self.entries = {}
+        try:
+            with open(manifest_path, 'r') as fp:
+                manifest = json.load(fp)
+            if manifest.get("version") == MANIFEST_FORMAT_VERSION and isinstance(manifest.get("files"), dict):
+                self.entries = manifest["files"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    @staticmethod
+    def get_manifest_path(data_root, model_path, work_dir=None):
+        """ Return the path of the manifest for a remodeling file.
+
+        Parameters:
+            data_root (str): Full path of the root of the dataset.
+            model_path (str): Full path of the file with the remodeling instructions.
+            work_dir (str or None): The working directory, if not the derivatives directory of the dataset.
+
+        Returns:
+            str: The full path of the manifest file.
+
+        """
+        base_dir = work_dir if work_dir else os.path.join(data_root, 'derivatives')
+        model_name = os.path.splitext(os.path.basename(model_path))[0]
+        return os.path.realpath(os.path.join(base_dir, RemodelManifest.MANIFEST_PATH,
+                                             model_name + RemodelManifest.MANIFEST_SUFFIX))
+
+    @staticmethod
+    def get_settings_hash(model_path, hed_schema):
+        """ Return a hash of everything other than the file and its sidecar that the results depend on.
+
+        Parameters:
+            model_path (str): Full path of the file with the remodeling instructions.
+            hed_schema (HedSchema, HedSchemaGroup, or None): The schema used by the operations.
+
+        Returns:
+            str or None: The hash or None if the remodeling file cannot be read.
+
+        """
+        from hed import __version__
+        model_hash = RemodelManifest.get_file_hash(model_path)
+        if model_hash is None:
+            return None
+        schema_version = hed_schema.get_formatted_version() if hed_schema else ""
+        settings = json.dumps([model_hash, schema_version, __version__])
+        return sha1(settings.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def get_file_hash(file_path):
+        """ Return a hash of the contents of a file or None if it cannot be read.
+
+        Parameters:
+            file_path (str): Full path of the file.
+
+        Returns:
+            str or None: The hash.
+
+        """
+        try:
+            with open(file_path, 'rb') as fp:
+                return sha1(fp.read()).hexdigest()
+        except OSError:
+            return None
+
+    @staticmethod
+    def get_sidecar_hash(sidecar):
+        """ Return a hash of the contents of a sidecar.
+
+        Parameters:
+            sidecar (Sidecar, str, or None): The sidecar or the path of its file.
+
+        Returns:
+            str or None: The hash or None if the sidecar is of a type whose contents cannot be hashed.
+
+        """
+        if sidecar is None:
+            return ""
+        if isinstance(sidecar, Sidecar):
+            return sha1(json.dumps(sidecar.loaded_dict, sort_keys=True).encode('utf-8')).hexdigest()
+        if isinstance(sidecar, str):
+            return RemodelManifest.get_file_hash(sidecar)
+        return None
+
+    def get_summaries(self, file_key, file_state, dispatch):
+        """ Return the cached summaries of a file if it has not changed since it was last remodeled.
+
+        Parameters:
+            file_key (str): The path of the file relative to the dataset root.
+            file_state (dict): The settings, input, sidecar, and output hashes of the file as it is now.
+            dispatch (Dispatcher): The dispatcher whose summary operations rebuild the summaries.
+
+        Returns:
+            dict or None: The summaries of the file keyed by summary name or None if the file must be remodeled.
+
+        """
+        entry = self.entries.get(file_key)
+        if not entry or None in file_state.values() or \
+                any(entry.get(key) != value for key, value in file_state.items()):
+            return None
+        try:
+            return self._load_summaries(entry["summaries"], dispatch)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            # Summaries that do not match the operations just mean remodeling again.
+            return None
+
+    def update(self, file_key, file_state, summaries):
+        """ Record the state and summaries of a file that was just remodeled.
+
+        Parameters:
+            file_key (str): The path of the file relative to the dataset root.
+            file_state (dict): The settings, input, sidecar, and output hashes of the file.
+            summaries (dict): The summaries of the file alone keyed by summary name.
+
+        Notes:
+            - A file with a summary that cannot be saved as JSON is not recorded, so it is remodeled on each run.
+
+        """
+        if None in file_state.values():
+            self.entries.pop(file_key, None)
+            return
+        try:
+            json_summaries = {name: summary.to_json_dict() for name, summary in summaries.items()}
+        except NotImplementedError:
+            self.entries.pop(file_key, None)
+            return
+        self.entries[file_key] = dict(file_state, summaries=json_summaries)
+
+    @staticmethod
+    def _load_summaries(json_summaries, dispatch):
+        """ Return the summaries of a file rebuilt from the value saved by update.
+
+        Parameters:
+            json_summaries (dict): The to_json_dict of each summary keyed by summary name.
+            dispatch (Dispatcher): The dispatcher whose summary operations rebuild the summaries.
+
+        Returns:
+            dict: The summaries of the file keyed by summary name.
+
+        :raises KeyError:
+            - If a summary is not produced by any operation of the dispatcher.
+
+        """
+        summary_ops = {op.summary_name: op for op in dispatch.parsed_ops if hasattr(op, 'make_summary')}
+        summaries = {}
+        for summary_name, json_dict in json_summaries.items():
+            summary = summary_ops[summary_name].make_summary(dispatch)
+            summary.update_from_json_dict(json_dict)
+            summaries[summary_name] = summary
+        return summaries
+
+    def save(self):
+        """ Write the manifest.
+
+        :raises HedFileError:
+            - If the manifest cannot be written.
+
+        """
+        temp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            with open(temp_path, 'w') as fp:
+                json.dump({"version": MANIFEST_FORMAT_VERSION, "files": self.entries}, fp, indent=4)
+            os.replace(temp_path, self.manifest_path)
+        except OSError as ex:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise HedFileError("ManifestNotSaved", f"Cannot write remodel manifest: {str(ex)}",
+                               self.manifest_path) from ex
@@ -125,18 +125,15 @@ def get_dir_dictionary(dir_path, name_prefix=None, name_suffix=None, extensions=
 
     """
 
-    if not exclude_dirs:
-        exclude_dirs = []
     dir_dict = {}
-    for root, dirs, files in os.walk(dir_path, topdown=True):
-        dirs[:] = [d for d in dirs if d not in exclude_dirs]
+    for root, files in walk_directory(dir_path, exclude_dirs=exclude_dirs):
         file_list = []
-        for r_file in files:
+        for r_file, _ in files:
             if check_filename(r_file, name_prefix, name_suffix, extensions):
-                file_list.append(os.path.join(os.path.realpath(root), r_file))
+                file_list.append(os.path.join(root, r_file))
         if skip_empty and not file_list:
             continue
-        dir_dict[os.path.realpath(root)] = file_list
+        dir_dict[root] = file_list
     return dir_dict
 
 
@@ -189,16 +186,70 @@ def get_file_list(root_path, name_prefix=None, name_suffix=None, extensions=None
         list:   The full paths.
     """
     file_list = []
-    if not exclude_dirs:
-        exclude_dirs = []
-    for root, dirs, files in os.walk(root_path, topdown=True):
-        dirs[:] = [d for d in dirs if d not in exclude_dirs]
-        for r_file in files:
+    for _, files in walk_directory(root_path, exclude_dirs=exclude_dirs):
+        for r_file, real_path in files:
             if check_filename(r_file, name_prefix, name_suffix, extensions):
-                file_list.append(os.path.realpath(os.path.join(root, r_file)))
+                file_list.append(real_path)
     return file_list
 
 
+def scan_directory(dir_path):
+    """ Return the files of a directory and the subdirectories to descend into, in the order os.walk lists them.
+
+    Parameters:
+        dir_path (str):  Real path of the directory.
+
+    Returns:
+        tuple or None:  A list of (name, real path) tuples for the files and a list of subdirectory names,
+            or None if the directory cannot be read.
+
+    Notes:
+        - As with os.walk, symbolic links to directories are not descended into.
+        - Only the files that are symbolic links need os.path.realpath to find their real paths.
+
+    """
+    files = []
+    dirs = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append((entry.name, os.path.realpath(entry.path) if entry.is_symlink() else entry.path))
+                elif not entry.is_symlink():
+                    dirs.append(entry.name)
+    except OSError:
+        return None
+    return files, dirs
+
+
+def walk_directory(root_path, exclude_dirs=None):
+    """ Generator for the files in a directory tree, visiting the directories in the same order as os.walk.
+
+    Parameters:
+        root_path (str):            Path of the directory tree to be traversed.
+        exclude_dirs (list, None):  Names of the directories to skip.
+
+    Yields:
+        tuple:  The real path of a directory and the list of (name, real path) tuples of its files.
+
+    """
+    if not exclude_dirs:
+        exclude_dirs = []
+    stack = [os.path.realpath(root_path)]
+    while stack:
+        dir_path = stack.pop()
+        scanned = scan_directory(dir_path)
+        if scanned is None:
+            continue
+        files, dirs = scanned
+        yield dir_path, files
+        stack.extend(os.path.join(dir_path, sub_dir) for sub_dir in reversed(dirs) if sub_dir not in exclude_dirs)
+
+
 def get_path_components(root_path, this_path):
     """ Get a list of the remaining components after root path.
 
@@ -5,4 +5,5 @@ from .tag_validator import TagValidator
 from .sidecar_validator import SidecarValidator
 from .def_validator import DefValidator
 from .onset_validator import OnsetValidator
-from .spreadsheet_validator import SpreadsheetValidator
\ No newline at end of file
+from .spreadsheet_validator import SpreadsheetValidator
+from .sidecar_validation_cache import SidecarValidationCache, clear_sidecar_cache, sidecar_cache_info
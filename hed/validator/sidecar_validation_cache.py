@@ -0,0 +1,115 @@
+"""
+A bounded cache of sidecar validation results.
+
+The same sidecar is often validated many times in one run, for example once for the dataset and again for each
+events file that uses it.  The cache keeps the issues found for each sidecar, keyed by a hash of its contents and
+the schema, so identical sidecars are only validated once.
+"""
+import json
+from collections import OrderedDict
+from hashlib import sha1
+
+DEFAULT_MAX_SIZE = 100
+
+
+class SidecarValidationCache:
+    """ Least recently used cache of the issues found when validating sidecars. """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """ Create an empty cache.
+
+        Parameters:
+            max_size (int): The maximum number of validation results to keep.  If 0, nothing is cached.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def get_content_hash(sidecar):
+        """ Return a hash of the contents of a sidecar.
+
+        Parameters:
+            sidecar (Sidecar): The sidecar to hash.
+
+        Returns:
+            str: The hash of the loaded dictionary, with the columns in their original order.
+        """
+        return sha1(json.dumps(sidecar.loaded_dict, default=str).encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """ Return the cached issues for a key.
+
+        Parameters:
+            key (tuple): The key the issues were stored under.
+
+        Returns:
+            list or None: A copy of the issues or None if they are not cached.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return [dict(issue) for issue in entry[0]]
+
+    def put(self, key, issues, hed_schema=None):
+        """ Store the issues found for a key.
+
+        Parameters:
+            key (tuple): The key to store the issues under.
+            issues (list): The issues found.  A copy is stored, so the caller may modify them.
+            hed_schema (HedSchema or None): The schema used, if the key includes its id.
+        """
+        if self.max_size <= 0:
+            return
+        # Keep a reference to the schema so its id stays unique while cached.
+        self._entries[key] = ([dict(issue) for issue in issues], hed_schema)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """ Remove all entries and reset the hit and miss counters. """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def cache_info(self):
+        """ Return the statistics of this cache.
+
+        Returns:
+            dict: The hits, misses, max_size and current size of the cache.
+        """
+        return {"hits": self.hits, "misses": self.misses, "max_size": self.max_size, "size": len(self._entries)}
+
+
+_default_cache = SidecarValidationCache()
+
+
+def get_sidecar_cache():
+    """ Return the shared sidecar validation cache.
+
+    Returns:
+        SidecarValidationCache: The cache used by SidecarValidator.
+    """
+    return _default_cache
+
+
+def clear_sidecar_cache():
+    """ Empty the shared sidecar validation cache. """
+    _default_cache.clear()
+
+
+def sidecar_cache_info():
+    """ Return the statistics of the shared sidecar validation cache.
+
+    Returns:
+        dict: The hits, misses, max_size and current size of the cache.
+    """
+    return _default_cache.cache_info()
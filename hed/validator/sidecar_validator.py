@@ -1,5 +1,6 @@
 import copy
 import re
+from concurrent.futures import ThreadPoolExecutor
 from hed.errors import ErrorHandler, ErrorContext, SidecarErrors, DefinitionErrors, ColumnErrors
 from hed.models import ColumnType
 from hed import HedString
@@ -8,6 +9,8 @@ from hed.models.column_metadata import ColumnMetadata
 from hed.errors.error_reporter import sort_issues
 from hed.models.model_constants import DefTagNames
 from hed.errors.error_reporter import check_for_any_errors
+from hed.models.definition_dict import DefinitionDict
+from hed.validator.sidecar_validation_cache import get_sidecar_cache
 
 
 # todo: Add/improve validation for definitions being in known columns(right now it just assumes they aren't)
@@ -24,7 +27,7 @@ class SidecarValidator:
         """
         self._schema = hed_schema
 
-    def validate(self, sidecar, extra_def_dicts=None, name=None, error_handler=None):
+    def validate(self, sidecar, extra_def_dicts=None, name=None, error_handler=None, workers=None, use_cache=True):
         """Validate the input data using the schema
 
         Parameters:
@@ -32,14 +35,35 @@ class SidecarValidator:
             extra_def_dicts(list or DefinitionDict): extra def dicts in addition to sidecar
             name(str): The name to report this sidecar as
             error_handler (ErrorHandler): Error context to use.  Creates a new one if None
+            workers (int or None): If greater than 1, validate the columns in this many threads.
+            use_cache (bool): If True, reuse the issues found for an identical sidecar validated earlier.
         Returns:
             issues (list of dict): A list of issues associated with each level in the HED string.
+
+        Notes:
+            - The cached issues are keyed by the contents of the sidecar, the schema and its version, the extra
+              definitions, the name and whether warnings are reported.  They are only used if error_handler
+              has no context.
         """
-        from hed.validator import HedValidator
-        issues = []
         if error_handler is None:
             error_handler = ErrorHandler()
 
+        cache_key = self._get_cache_key(sidecar, extra_def_dicts, name, error_handler) if use_cache else None
+        if cache_key is not None:
+            issues = get_sidecar_cache().get(cache_key)
+            if issues is not None:
+                return issues
+
+        issues = self._validate(sidecar, extra_def_dicts, name, error_handler, workers)
+        if cache_key is not None:
+            get_sidecar_cache().put(cache_key, issues, self._schema)
+        return issues
+
+    def _validate(self, sidecar, extra_def_dicts, name, error_handler, workers):
+        """ Validate the sidecar without using the cache.  See validate for the parameters. """
+        from hed.validator import HedValidator
+        issues = []
+
         error_handler.push_error_context(ErrorContext.FILE_NAME, name)
         issues += self.validate_structure(sidecar, error_handler=error_handler)
         issues += self._validate_refs(sidecar, error_handler)
@@ -57,38 +81,112 @@ class SidecarValidator:
         issues += sidecar_def_dict.issues
 
         definition_checks = {}
-        for column_data in sidecar:
-            column_name = column_data.column_name
-            hed_strings = column_data.get_hed_strings()
-            error_handler.push_error_context(ErrorContext.SIDECAR_COLUMN_NAME, column_name)
-            for key_name, hed_string in hed_strings.items():
-                new_issues = []
-                if len(hed_strings) > 1:
-                    error_handler.push_error_context(ErrorContext.SIDECAR_KEY_NAME, key_name)
-                hed_string_obj = HedString(hed_string, hed_schema=self._schema, def_dict=sidecar_def_dict)
-                hed_string_obj.remove_refs()
+        column_results = self._validate_columns(sidecar, hed_validator, sidecar_def_dict, error_handler, workers)
+        for column_data, (column_issues, def_check_list) in column_results:
+            issues += column_issues
+            if def_check_list:
+                definition_checks[column_data.column_name] = def_check_list
+        error_handler.pop_error_context()
+        issues += self._check_definitions_bad_spot(definition_checks, error_handler)
+        issues = sort_issues(issues)
 
-                error_handler.push_error_context(ErrorContext.HED_STRING, hed_string_obj)
-                new_issues += hed_validator.run_basic_checks(hed_string_obj, allow_placeholders=True)
-                new_issues += hed_validator.run_full_string_checks(hed_string_obj)
+        return issues
 
-                def_check_list = definition_checks.setdefault(column_name, [])
-                def_check_list.append(hed_string_obj.find_tags({DefTagNames.DEFINITION_KEY}, recursive=True,
-                                                               include_groups=0))
-                # Might refine this later - for now just skip checking placeholder counts in definition columns.
-                if not def_check_list[-1]:
-                    new_issues += self._validate_pound_sign_count(hed_string_obj, column_type=column_data.column_type)
+    def _validate_columns(self, sidecar, hed_validator, sidecar_def_dict, error_handler, workers):
+        """ Validate the HED strings of each column of the sidecar.
 
-                if len(hed_strings) > 1:
-                    error_handler.pop_error_context()
-                error_handler.add_context_and_filter(new_issues)
-                issues += new_issues
+        Parameters:
+            sidecar (Sidecar): The sidecar being validated.
+            hed_validator (HedValidator): The validator for the HED strings.
+            sidecar_def_dict (DefinitionDict): The definitions of the sidecar and the extra definitions.
+            error_handler (ErrorHandler): The error handler to use for error context.
+            workers (int or None): If greater than 1, validate the columns in this many threads.
+
+        Returns:
+            list: A (ColumnMetadata, (issues, definition checks)) tuple for each column in sidecar order.
+        """
+        columns = list(sidecar)
+        if not workers or workers < 2 or len(columns) < 2:
+            return [(column_data, self._validate_column(column_data, hed_validator, sidecar_def_dict,
+                                                        error_handler)) for column_data in columns]
+
+        def validate_column(column_data):
+            # Each thread has its own error handler, so the error contexts of the columns do not mix.
+            column_handler = ErrorHandler(error_handler._check_for_warnings)
+            column_handler.error_context = list(error_handler.error_context)
+            return self._validate_column(column_data, hed_validator, sidecar_def_dict, column_handler)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(zip(columns, pool.map(validate_column, columns)))
+
+    def _validate_column(self, column_data, hed_validator, sidecar_def_dict, error_handler):
+        """ Validate the HED strings of one column of the sidecar.
+
+        Parameters:
+            column_data (ColumnMetadata): The column to validate.
+            hed_validator (HedValidator): The validator for the HED strings.
+            sidecar_def_dict (DefinitionDict): The definitions of the sidecar and the extra definitions.
+            error_handler (ErrorHandler): The error handler to use for error context.
+
+        Returns:
+            tuple: The list of issues and the list of definition tags found in each HED string of the column.
+        """
+        issues = []
+        def_check_list = []
+        hed_strings = column_data.get_hed_strings()
+        error_handler.push_error_context(ErrorContext.SIDECAR_COLUMN_NAME, column_data.column_name)
+        for key_name, hed_string in hed_strings.items():
+            new_issues = []
+            if len(hed_strings) > 1:
+                error_handler.push_error_context(ErrorContext.SIDECAR_KEY_NAME, key_name)
+            hed_string_obj = HedString(hed_string, hed_schema=self._schema, def_dict=sidecar_def_dict)
+            hed_string_obj.remove_refs()
+
+            error_handler.push_error_context(ErrorContext.HED_STRING, hed_string_obj)
+            new_issues += hed_validator.run_basic_checks(hed_string_obj, allow_placeholders=True)
+            new_issues += hed_validator.run_full_string_checks(hed_string_obj)
+
+            def_check_list.append(hed_string_obj.find_tags({DefTagNames.DEFINITION_KEY}, recursive=True,
+                                                           include_groups=0))
+            # Might refine this later - for now just skip checking placeholder counts in definition columns.
+            if not def_check_list[-1]:
+                new_issues += self._validate_pound_sign_count(hed_string_obj, column_type=column_data.column_type)
+
+            # Issues in a column with several keys are reported with the key name rather than the HED string.
+            if len(hed_strings) > 1:
+                error_handler.pop_error_context()
+            error_handler.add_context_and_filter(new_issues)
             error_handler.pop_error_context()
+            issues += new_issues
         error_handler.pop_error_context()
-        issues += self._check_definitions_bad_spot(definition_checks, error_handler)
-        issues = sort_issues(issues)
+        return issues, def_check_list
 
-        return issues
+    def _get_cache_key(self, sidecar, extra_def_dicts, name, error_handler):
+        """ Return the key of the validation results of a sidecar in the cache.
+
+        Parameters:
+            sidecar (Sidecar): The sidecar to validate.
+            extra_def_dicts (list or DefinitionDict): Extra def dicts in addition to the sidecar.
+            name (str): The name to report this sidecar as.
+            error_handler (ErrorHandler): The error handler to use for error context.
+
+        Returns:
+            tuple or None: The key or None if the results cannot be cached.
+        """
+        if error_handler.error_context or not hasattr(sidecar, "loaded_dict"):
+            return None
+        if extra_def_dicts is None:
+            extra_def_dicts = []
+        elif not isinstance(extra_def_dicts, list):
+            extra_def_dicts = [extra_def_dicts]
+        defs_key = []
+        for def_dict in extra_def_dicts:
+            if not isinstance(def_dict, DefinitionDict):
+                return None
+            defs_key.append(tuple((def_name, entry.takes_value, str(entry.contents), str(entry.source_context))
+                                  for def_name, entry in def_dict.defs.items()))
+        return (get_sidecar_cache().get_content_hash(sidecar), self._schema.get_formatted_version(), id(self._schema),
+                tuple(defs_key), name, error_handler._check_for_warnings)
 
     def validate_structure(self, sidecar, error_handler):
         """ Validate the raw structure of this sidecar.
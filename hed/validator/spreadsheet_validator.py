@@ -3,7 +3,8 @@ from hed import BaseInput
 from hed.errors import ErrorHandler, ValidationErrors, ErrorContext
 from hed.errors.error_types import ColumnErrors
 from hed.models import ColumnType
-from hed import HedString
+from hed.models.hed_string import HedString
+from hed.models.hed_string_cache import get_hed_string
 from hed.errors.error_reporter import sort_issues, check_for_any_errors
 from hed.validator.onset_validator import OnsetValidator
 from hed.validator.hed_validator import HedValidator
@@ -12,16 +13,19 @@ PANDAS_COLUMN_PREFIX_TO_IGNORE = "Unnamed: "
 
 
 class SpreadsheetValidator:
-    def __init__(self, hed_schema):
+    def __init__(self, hed_schema, deduplicate=True):
         """
         Constructor for the HedValidator class.
 
         Parameters:
             hed_schema (HedSchema): HED schema object to use for validation.
+            deduplicate (bool): If True, run the per-cell checks once for each unique value in a column
+                                and reuse the resulting issues for the other rows with the same value.
         """
         self._schema = hed_schema
         self._hed_validator = None
         self._onset_validator = None
+        self._deduplicate = deduplicate
 
     def validate(self, data, def_dicts=None, name=None, error_handler=None):
         """
@@ -37,6 +41,25 @@ class SpreadsheetValidator:
             issues (list of dict): A list of issues for hed string
         """
 
+        return self.validate_chunks([data], def_dicts=def_dicts, name=name, error_handler=error_handler)
+
+    def validate_chunks(self, chunks, def_dicts=None, name=None, error_handler=None):
+        """
+        Validate input data that is split into consecutive chunks of rows, such as from TabularInput.iter_chunks.
+
+        Parameters:
+            chunks (iterable of BaseInput or pd.DataFrame): The consecutive parts of the input data.
+                Rows are numbered from each chunk's row_offset.
+            def_dicts(list of DefDict or DefDict): all definitions to use for validation
+            name(str): The name to report errors from this file as
+            error_handler (ErrorHandler): Error context to use.  Creates a new one if None
+        Returns:
+            issues (list of dict): A list of issues for hed string
+
+        Notes:
+            - Onset and offset state is kept from one chunk to the next, so the issues are the same as if the
+              whole file was validated at once.  Only one chunk is assembled at a time.
+        """
         issues = []
         if error_handler is None:
             error_handler = ErrorHandler()
@@ -44,24 +67,28 @@ class SpreadsheetValidator:
         error_handler.push_error_context(ErrorContext.FILE_NAME, name)
         self._hed_validator = HedValidator(self._schema, def_dicts=def_dicts)
         self._onset_validator = OnsetValidator()
-        onset_filtered = None
-        if isinstance(data, BaseInput):
-            issues += self._validate_column_structure(data, error_handler)
-            onset_filtered = data.series_filtered
-            data = data.dataframe_a
-
-        # Check the rows of the input data
-        issues += self._run_checks(data, onset_filtered, error_handler=error_handler)
+        for chunk_number, data in enumerate(chunks):
+            onset_filtered = None
+            row_offset = 0
+            if isinstance(data, BaseInput):
+                issues += self._validate_column_structure(data, error_handler, check_columns=chunk_number == 0)
+                onset_filtered = data.series_filtered
+                row_offset = data.row_offset
+                data = data.dataframe_a
+
+            # Check the rows of the input data
+            issues += self._run_checks(data, onset_filtered, error_handler=error_handler, row_offset=row_offset)
         error_handler.pop_error_context()
 
         issues = sort_issues(issues)
         return issues
 
-    def _run_checks(self, hed_df, onset_filtered, error_handler):
+    def _run_checks(self, hed_df, onset_filtered, error_handler, row_offset=0):
         issues = []
         columns = list(hed_df.columns)
+        checked_cells = {}
         for row_number, text_file_row in enumerate(hed_df.itertuples(index=False)):
-            error_handler.push_error_context(ErrorContext.ROW, row_number)
+            error_handler.push_error_context(ErrorContext.ROW, row_number + row_offset)
             row_strings = []
             new_column_issues = []
             for column_number, cell in enumerate(text_file_row):
@@ -70,11 +97,10 @@ class SpreadsheetValidator:
 
                 error_handler.push_error_context(ErrorContext.COLUMN, columns[column_number])
 
-                column_hed_string = HedString(cell, self._schema)
-                row_strings.append(column_hed_string)
+                column_hed_string, new_column_issues = self._check_cell(cell, column_number, checked_cells)
+                # Checked strings are shared between rows when deduplicating, so the row gets its own copy.
+                row_strings.append(column_hed_string._clone({}) if self._deduplicate else column_hed_string)
                 error_handler.push_error_context(ErrorContext.HED_STRING, column_hed_string)
-                new_column_issues = self._hed_validator.run_basic_checks(column_hed_string, allow_placeholders=False)
-
                 error_handler.add_context_and_filter(new_column_issues)
                 error_handler.pop_error_context()
                 error_handler.pop_error_context()
@@ -86,7 +112,8 @@ class SpreadsheetValidator:
 
             row_string = None
             if onset_filtered is not None:
-                row_string = HedString(onset_filtered[row_number], self._schema, self._hed_validator._def_validator)
+                row_string = get_hed_string(onset_filtered[row_number], self._schema,
+                                            self._hed_validator._def_validator)
             elif row_strings:
                 row_string = HedString.from_hed_strings(row_strings)
 
@@ -100,33 +127,64 @@ class SpreadsheetValidator:
             error_handler.pop_error_context()
         return issues
 
-    def _validate_column_structure(self, base_input, error_handler):
+    def _check_cell(self, cell, column_number, checked_cells):
+        """ Run the basic checks on a single cell, reusing earlier results for repeated values if deduplicating.
+
+        Parameters:
+            cell (str): The HED string in this cell.
+            column_number (int): The position of the column containing the cell.
+            checked_cells (dict): Results of cells already checked, keyed by (column_number, cell).
+
+        Returns:
+            HedString: The checked string for this cell.  This is shared by all cells with the same value.
+            list: The issues found in this cell, without any context added.
+        """
+        if not self._deduplicate:
+            column_hed_string = get_hed_string(cell, self._schema)
+            return column_hed_string, self._hed_validator.run_basic_checks(column_hed_string,
+                                                                           allow_placeholders=False)
+
+        key = (column_number, cell)
+        if key not in checked_cells:
+            column_hed_string = get_hed_string(cell, self._schema)
+            cell_issues = self._hed_validator.run_basic_checks(column_hed_string, allow_placeholders=False)
+            checked_cells[key] = (column_hed_string, cell_issues)
+        column_hed_string, cell_issues = checked_cells[key]
+        # Context is added to the issues in place, so each row needs its own copies.
+        return column_hed_string, [issue.copy() for issue in cell_issues]
+
+    def _validate_column_structure(self, base_input, error_handler, check_columns=True):
         """
         Validate that each column in the input data has valid values.
 
         Parameters:
             base_input (BaseInput): The input data to be validated.
             error_handler (ErrorHandler): Holds context
+            check_columns (bool): If True, also check the column mapping and column refs.
+                                  These are the same for every chunk of a file, so are only checked for the first.
         Returns:
             List of issues associated with each invalid value. Each issue is a dictionary.
         """
         issues = []
-        col_issues = base_input._mapper.check_for_mapping_issues(base_input)
-        error_handler.add_context_and_filter(col_issues)
-        issues += col_issues
+        if check_columns:
+            col_issues = base_input._mapper.check_for_mapping_issues(base_input)
+            error_handler.add_context_and_filter(col_issues)
+            issues += col_issues
         for column in base_input.column_metadata().values():
             if column.column_type == ColumnType.Categorical:
                 error_handler.push_error_context(ErrorContext.COLUMN, column.column_name)
                 valid_keys = column.hed_dict.keys()
                 for row_number, value in enumerate(base_input.dataframe[column.column_name]):
                     if value != "n/a" and value not in valid_keys:
-                        error_handler.push_error_context(ErrorContext.ROW, row_number)
+                        error_handler.push_error_context(ErrorContext.ROW, row_number + base_input.row_offset)
                         issues += error_handler.format_error_with_context(ValidationErrors.SIDECAR_KEY_MISSING,
                                                                           invalid_key=value,
                                                                           category_keys=list(valid_keys))
                         error_handler.pop_error_context()
                 error_handler.pop_error_context()
 
+        if not check_columns:
+            return issues
         column_refs = base_input.get_column_refs()
         columns = base_input.columns
         for ref in column_refs:
@@ -214,6 +214,19 @@ class TestInsertColumns(unittest.TestCase):
         result = BaseInput._handle_curly_braces_refs(df, refs=["column2"], column_names=df.columns)
         pd.testing.assert_frame_equal(result, expected_df)
 
+    def test_insert_columns_repeated_templates(self):
+        df = pd.DataFrame({
+            "column1": ["({column2}, {column3}), Event"] * 5 + ["Event"],
+            "column2": ["Item", "n/a", "(Def/X, Onset)", "Item", "", "Item"],
+            "column3": ["Data", "Data", "n/a", "n/a", "n/a", "Data"]
+        })
+        expected_df = pd.DataFrame({
+            "column1": ["(Item, Data), Event", "(Data), Event", "((Def/X, Onset)), Event", "(Item), Event",
+                        "(), Event", "Event"]
+        })
+        result = BaseInput._handle_curly_braces_refs(df, refs=["column2", "column3"], column_names=df.columns)
+        pd.testing.assert_frame_equal(result, expected_df)
+
 
 class TestCombineDataframe(unittest.TestCase):
     def test_combine_dataframe_with_strings(self):
@@ -272,6 +285,33 @@ class TestCombineDataframe(unittest.TestCase):
         expected = pd.Series(['apple, guitar', 'elephant, harmonica', 'cherry, fox', '', ''])
         self.assertTrue(result.equals(expected))
 
+    def test_combine_dataframe_keeps_index(self):
+        df = pd.DataFrame({'A': ['apple', 'n/a'], 'B': ['dog', 'fox']}, index=[5, 7])
+        result = BaseInput.combine_dataframe(df)
+        expected = pd.Series(['apple, dog', 'fox'], index=[5, 7])
+        self.assertTrue(result.equals(expected))
+
+
+class TestHandleTransforms(unittest.TestCase):
+    def test_transforms_repeated_values(self):
+        sidecar = Sidecar(io.StringIO(
+            '{"trial_type": {"HED": {"go": "Sensory-event", "stop": "Agent-action"}},'
+            ' "rt": {"HED": "Delay/# s, (Duration/# s)"}}'))
+        df = pd.DataFrame({'onset': ['1', '2', '3', '4'],
+                           'trial_type': ['go', 'stop', 'go', 'other'],
+                           'rt': ['0.5', 'n/a', '0.5', '1.25']}, index=[3, 2, 1, 0])
+        tabular = TabularInput(df, sidecar)
+        assembled = tabular.assemble()
+        self.assertEqual(set(assembled.columns), {'trial_type', 'rt'})
+        self.assertEqual(list(assembled.index), [3, 2, 1, 0])
+        self.assertEqual(list(assembled['trial_type']), ['Sensory-event', 'Agent-action', 'Sensory-event', ''])
+        self.assertEqual(list(assembled['rt']), ['Delay/0.5 s, (Duration/0.5 s)', 'n/a',
+                                                 'Delay/0.5 s, (Duration/0.5 s)', 'Delay/1.25 s, (Duration/1.25 s)'])
+        self.assertEqual(list(tabular.series_a), ['Delay/0.5 s, (Duration/0.5 s), Sensory-event', 'Agent-action',
+                                                  'Delay/0.5 s, (Duration/0.5 s), Sensory-event',
+                                                  'Delay/1.25 s, (Duration/1.25 s)'])
+        self.assertEqual(list(tabular.dataframe['trial_type']), ['go', 'stop', 'go', 'other'])
+
 
 class TestOnsetDict(unittest.TestCase):
     def test_empty_and_single_onset(self):
@@ -1,5 +1,8 @@
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
+from hed.models.definition_dict import DefinitionDict
 from hed.models.definition_entry import DefinitionEntry
 from hed.models.hed_string import HedString
 from hed.schema.hed_schema_io import load_schema_version
@@ -9,7 +12,51 @@ class Test(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        pass
+        cls.schema = load_schema_version("8.2.0")
+        cls.def_dict = DefinitionDict()
+        cls.def_dict.check_for_definitions(
+            HedString("(Definition/Cond/#, (Label/#, Red, (Blue, Circle)))", cls.schema))
+
+    def test_get_definition_lazy_and_memoized(self):
+        def_entry = self.def_dict.defs["cond"]
+        hed = HedString("Def/Cond/4, (Def/Cond/4, Green)", self.schema, self.def_dict)
+        tags = hed.find_def_tags(recursive=True, include_groups=0)
+        self.assertEqual(len(tags), 2)
+        self.assertIsNone(tags[0]._expandable)
+        self.assertFalse(def_entry._expansions)
+        expanded1 = tags[0].expandable
+        expanded2 = tags[1].expandable
+        self.assertEqual(str(expanded1), "(Def/Cond/4,(Label/4,Red,(Blue,Circle)))")
+        self.assertEqual(str(expanded2), str(expanded1))
+        self.assertIs(tags[1]._parent, hed.children[1])
+        self.assertEqual(list(def_entry._expansions), ["4"])
+        self.assertIsNot(expanded1.children[1], expanded2.children[1])
+        expanded1.children[1].remove([expanded1.children[1].children[1]])
+        self.assertEqual(str(tags[1].expandable), "(Def/Cond/4,(Label/4,Red,(Blue,Circle)))")
+        hed2 = HedString("Def/Cond/4, (Def/Cond/4, Green)", self.schema, self.def_dict)
+        self.assertEqual(str(hed2.expand_defs()),
+                         "(Def-expand/Cond/4,(Label/4,Red,(Blue,Circle))),"
+                         "((Def-expand/Cond/4,(Label/4,Red,(Blue,Circle))),Green)")
+
+    def test_get_definition_no_match(self):
+        def_entry = self.def_dict.defs["cond"]
+        hed = HedString("Def/Cond", self.schema, self.def_dict)
+        self.assertIsNone(hed.children[0].expandable)
+        self.assertIsNone(def_entry.get_definition(hed.children[0]))
+
+    def test_get_definition_eviction_threads(self):
+        def_entry = DefinitionEntry("Cond", self.def_dict.defs["cond"].contents, True, None)
+        def_entry.MAX_EXPANSIONS = 5
+        values = [str(value % 50) for value in range(5000)]
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                expanded = list(pool.map(def_entry._get_expanded_contents, values))
+        finally:
+            sys.setswitchinterval(switch_interval)
+        self.assertEqual(str(expanded[-1]), "(Label/49,Red,(Blue,Circle))")
+        self.assertLessEqual(len(def_entry._expansions), 5 + 8)
 
 
 if __name__ == '__main__':
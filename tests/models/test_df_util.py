@@ -5,6 +5,7 @@ import pandas as pd
 from hed import load_schema_version
 from hed.models.df_util import shrink_defs, expand_defs, convert_to_form, process_def_expands
 from hed import DefinitionDict
+from hed.models.def_expand_gather import DefExpandGatherer
 
 
 class TestShrinkDefs(unittest.TestCase):
@@ -286,3 +287,22 @@ class TestConvertToForm(unittest.TestCase):
         self.assertEqual(len(ambiguous), 0)
         self.assertEqual(len(errors), 0)
 
+    def test_repeated_def_expands(self):
+        test_strings = [
+            "(Def-expand/A1/1, (Action/1, Age/5, Item-count/1))",
+            "(Def-expand/B2/3, (Action/3, Acceleration/3))",
+            "(Def-expand/A1/1, (Action/1, Age/5, Item-count/1))",
+        ] * 3
+        gatherer = DefExpandGatherer(self.schema)
+        _, ambiguous, errors = gatherer.process_def_expands(test_strings)
+        self.assertEqual(len(ambiguous), 2)
+        self.assertEqual(ambiguous["a1"].counts, [6])
+        self.assertEqual(len(ambiguous["a1"].actual_defs), 1)
+        self.assertFalse(errors)
+
+        test_strings.append("(Def-expand/A1/2, (Action/2, Age/6, Item-count/1))")
+        gatherer2 = DefExpandGatherer(self.schema)
+        _, ambiguous, errors = gatherer2.process_def_expands(test_strings, workers=2)
+        self.assertEqual(list(ambiguous), ["b2"])
+        self.assertEqual(len(errors["a1"]), 7)
+        self.assertEqual(str(errors["a1"][0]), "(Action/#,Age/5,Item-count/#)")
@@ -1,6 +1,6 @@
 import unittest
 from hed.models.hed_string import HedString
-from hed.models.expression_parser import QueryParser
+from hed.models.expression_parser import QueryParser, SearchIndex
 import os
 from hed import schema
 from hed import HedTag
@@ -31,11 +31,24 @@ class TestParser(unittest.TestCase):
         for string, expected_result in search_strings.items():
             hed_string = HedString(string, self.hed_schema)
             result2 = expression.search(hed_string)
+            index_result = expression.search(SearchIndex(hed_string))
+            self.assertEqual([str(r) for r in index_result], [str(r) for r in result2])
             # print(f"\tSearching string '{str(hed_string)}'")
             # if result2:
             #    print(f"\t\tFound as group(s) {str([str(r) for r in result2])}")
             self.assertEqual(bool(result2), expected_result)
 
+    def test_required_terms(self):
+        self.assertEqual(QueryParser("Event and (Action or Agent) and ~Red")._required, {("term", "event")})
+        self.assertEqual(QueryParser('[[{"Def/Face" : ???}, Item]]')._required,
+                         {("exact", "def/face"), ("term", "item")})
+        self.assertEqual(QueryParser("Eve* or @Event")._required, set())
+
+        search_index = SearchIndex(HedString("(Item, Def/Face), Red", self.hed_schema))
+        self.assertTrue(search_index.has_required({("exact", "def/face"), ("term", "item")}))
+        self.assertFalse(search_index.has_required({("term", "event")}))
+        self.assertEqual(QueryParser("Event and Item").search(search_index), [])
+
     def test_broken_search_strings(self):
         test_search_strings = [
             "A and",
@@ -0,0 +1,57 @@
+import unittest
+
+from hed import load_schema_version
+from hed.models import HedString, DefinitionDict
+from hed.models.hed_string_cache import HedStringCache
+
+
+class TestHedStringCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.schema = load_schema_version("8.2.0")
+        cls.def_dict = DefinitionDict(["(Definition/Def1, (Blue))", "(Definition/Def2/#, (Label/#))"], cls.schema)
+        cls.test_string = "Sensory-event, Def/Def1, (Def/Def2/3, Onset), (Def-expand/Def1, (Blue)), Red"
+
+    def test_hits_and_misses(self):
+        cache = HedStringCache()
+        cache.get(self.test_string, self.schema, self.def_dict)
+        cache.get(self.test_string, self.schema, self.def_dict)
+        cache.get(self.test_string, self.schema)
+        self.assertEqual(cache.cache_info(), {"hits": 1, "misses": 2, "max_size": 10000, "size": 2})
+        cache.clear()
+        self.assertEqual(cache.cache_info(), {"hits": 0, "misses": 0, "max_size": 10000, "size": 0})
+
+    def test_max_size(self):
+        cache = HedStringCache(max_size=2)
+        for test_str in ["Red", "Blue", "Green", "Red"]:
+            cache.get(test_str, self.schema)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.misses, 4)
+        no_cache = HedStringCache(max_size=0)
+        no_cache.get("Red", self.schema)
+        self.assertEqual(len(no_cache), 0)
+
+    def test_matches_parsed_string(self):
+        cache = HedStringCache()
+        for _ in range(2):
+            cached = cache.get(self.test_string, self.schema, self.def_dict)
+            parsed = HedString(self.test_string, self.schema, self.def_dict)
+            self.assertEqual(str(cached), str(parsed))
+            self.assertEqual(cached.get_as_long(), parsed.get_as_long())
+            self.assertEqual(str(cached.copy().expand_defs()), str(parsed.copy().expand_defs()))
+            self.assertEqual(str(cached.shrink_defs()), str(parsed.shrink_defs()))
+
+    def test_copies_are_independent(self):
+        cache = HedStringCache()
+        first = cache.get(self.test_string, self.schema, self.def_dict)
+        first.expand_defs()
+        first.remove(first.find_tags({"red"}, include_groups=0))
+        second = cache.get(self.test_string, self.schema, self.def_dict)
+        self.assertEqual(str(second), str(HedString(self.test_string, self.schema, self.def_dict)))
+        first_ids = {id(tag) for tag in first.get_all_tags()}
+        self.assertFalse(any(id(tag) in first_ids for tag in second.get_all_tags()))
+        self.assertIs(second.children[0]._parent, second)
+
+
+if __name__ == '__main__':
+    unittest.main()
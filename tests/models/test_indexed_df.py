@@ -0,0 +1,90 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hed import load_schema_version, TabularInput, Sidecar
+from hed.errors import HedFileError
+from hed.models import QueryParser, df_util
+from hed.models.indexed_df import IndexedDF
+
+
+class TestIndexedDF(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        bids_root_path = os.path.realpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                       '../data/bids_tests/eeg_ds003645s_hed'))
+        cls.events_path = os.path.join(bids_root_path,
+                                       'sub-002/eeg/sub-002_task-FacePerception_run-1_events.tsv')
+        cls.sidecar = Sidecar(os.path.join(bids_root_path, 'task-FacePerception_events.json'))
+        cls.schema = load_schema_version("8.2.0")
+        cls.input_data = TabularInput(cls.events_path, cls.sidecar)
+        cls.indexed = IndexedDF([cls.input_data, cls.input_data], cls.sidecar, cls.schema)
+        cls.temp_dir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
+
+    def full_search(self, query):
+        hed_strings, _ = df_util.get_assembled(self.input_data, self.sidecar, self.schema, expand_defs=True)
+        rows = [row for row, hed_string in enumerate(hed_strings) if QueryParser(query).search(hed_string)]
+        return rows + [row + len(hed_strings) for row in rows]
+
+    def test_find_rows(self):
+        self.assertEqual(len(self.indexed), 2 * len(self.input_data.dataframe))
+        rows = self.indexed.find_rows("Sensory-event")
+        self.assertTrue(len(rows))
+        self.assertTrue(np.array_equal(rows, self.indexed.find_rows("event/sensory-event")))
+        self.assertTrue(all("Sensory-event" in str(self.indexed.get_hed_string(row)) for row in rows))
+        self.assertFalse(len(self.indexed.find_rows("Animal")))
+        self.assertEqual(list(self.indexed.find_rows_for_strings(["Animal", "Event"])), ["Animal", "Event"])
+        self.assertIsNone(self.indexed.find_rows_with_all([]))
+
+    def test_find_rows_placeholder_def(self):
+        sidecar = Sidecar(io.StringIO(json.dumps(
+            {"defs": {"HED": {"acc": "(Definition/Acc/#, (Acceleration/# m-per-s^2, Red))"}}})))
+        df = pd.DataFrame({"onset": [1, 2, 3], "HED": ["Def/Acc/3, Blue", "Green", "Def-expand/Acc/4.5, Red"]})
+        indexed = IndexedDF([TabularInput(df, sidecar)], sidecar, self.schema)
+        self.assertEqual(list(indexed.find_rows("def/acc")), [0, 2])
+        self.assertFalse(len(indexed.find_rows("def/acc/3")))
+
+    def test_search_matches_full_search(self):
+        queries = ["Sensory-event and Face", "Def-expand/Cross-only", "Press and Task", "~Image", "Animal",
+                   "[[Def/Face-image]]", "{Sensory-event: Def/Cross-only}", "Event and ~Agent-action"]
+        for query in queries:
+            self.assertEqual(list(self.indexed.search(query)), self.full_search(query), query)
+
+    def test_get_row_locations(self):
+        file_rows = len(self.input_data.dataframe)
+        self.assertEqual(self.indexed.get_row_locations([0, file_rows - 1, file_rows]),
+                         [(self.events_path, 0), (self.events_path, file_rows - 1), (self.events_path, 0)])
+
+    def test_save_load(self):
+        filename = os.path.join(self.temp_dir, "index.npz")
+        self.indexed.save(filename)
+        loaded = IndexedDF.load(filename, self.schema)
+        self.assertEqual(len(loaded), len(self.indexed))
+        self.assertEqual(set(loaded.keys), set(self.indexed.keys))
+        self.assertEqual(loaded.names, self.indexed.names)
+        self.assertTrue(np.array_equal(loaded.search("Sensory-event and Face"),
+                                       self.indexed.search("Sensory-event and Face")))
+        self.assertEqual(str(loaded.get_hed_string(5)), str(self.indexed.get_hed_string(5)))
+
+    def test_load_bad_file(self):
+        filename = os.path.join(self.temp_dir, "bad.npz")
+        with open(filename, "wb") as fp:
+            fp.write(b"not an index")
+        with self.assertRaises(HedFileError):
+            IndexedDF.load(filename, self.schema)
+        with self.assertRaises(HedFileError):
+            IndexedDF.load(os.path.join(self.temp_dir, "missing.npz"), self.schema)
+
+
+if __name__ == '__main__':
+    unittest.main()
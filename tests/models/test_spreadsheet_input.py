@@ -205,6 +205,15 @@ class Test(unittest.TestCase):
         hed_input = TabularInput(events_path, sidecar=sidecar_path)
         self.assertTrue(hed_input.dataframe_a.loc[1, 'Value'] == 'n/a')
 
+    def test_missing_cells_in_prefix_column(self):
+        # Excel input keeps the empty cells as None.
+        excel_file = io.BytesIO()
+        pd.DataFrame({'HED': ['Red', 'Blue', 'Green'], 'Other': ['a', None, 'c']}).to_excel(excel_file, index=False)
+        excel_file.seek(0)
+        spreadsheet = SpreadsheetInput(excel_file, file_type='.xlsx', tag_columns=[0],
+                                       column_prefix_dictionary={1: 'Label/'})
+        self.assertEqual(spreadsheet.series_a.tolist(), ['Red, Label/a', 'Blue, Label/None', 'Green, Label/c'])
+
     def test_to_excel_workbook(self):
         excel_book = SpreadsheetInput(self.default_test_file_name, worksheet_name="LKT 8HED3",
                                       tag_columns=["HED tags"])
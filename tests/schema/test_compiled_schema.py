@@ -0,0 +1,64 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from hed import HedString
+from hed.errors import HedFileError, HedExceptions
+from hed.schema import load_schema
+from hed.schema import hed_schema_io
+from hed.schema.schema_io import compiled_schema
+
+
+class TestCompiledSchema(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.schema_path = os.path.realpath(os.path.join(os.path.dirname(__file__),
+                                                        '../../hed/schema/schema_data/HED8.2.0.xml'))
+        cls.schema = load_schema(cls.schema_path)
+        cls.temp_dir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
+
+    def test_round_trip(self):
+        filename = os.path.join(self.temp_dir, "round_trip" + compiled_schema.COMPILED_EXTENSION)
+        compiled_schema.save_compiled(self.schema, filename)
+        loaded = compiled_schema.load_compiled(filename)
+        self.assertEqual(loaded, self.schema)
+        self.assertIs(loaded.get_tag_entry("Red"), loaded.tags["Red"])
+        hed_string = "Sensory-event, (Red, Duration/3 s), Invalidtag"
+        self.assertEqual(HedString(hed_string, loaded).get_as_long(),
+                         HedString(hed_string, self.schema).get_as_long())
+
+    def test_bad_file(self):
+        filename = os.path.join(self.temp_dir, "bad" + compiled_schema.COMPILED_EXTENSION)
+        with open(filename, "wb") as fp:
+            fp.write(b"not a compiled schema")
+        with self.assertRaises(HedFileError) as context:
+            compiled_schema.load_compiled(filename)
+        self.assertEqual(context.exception.code, HedExceptions.CANNOT_PARSE_COMPILED)
+
+        with self.assertRaises(HedFileError):
+            compiled_schema.load_compiled(os.path.join(self.temp_dir, "missing.hedc"))
+
+    def test_load_schema_file_uses_compiled(self):
+        cache_folder = os.path.join(self.temp_dir, "cache")
+        compiled_path = hed_schema_io._get_compiled_path(self.schema_path, cache_folder)
+        first = hed_schema_io._load_schema_file(self.schema_path, cache_folder)
+        self.assertTrue(os.path.exists(compiled_path))
+        second = hed_schema_io._load_schema_file(self.schema_path, cache_folder)
+        self.assertEqual(first, second)
+        self.assertEqual(second.filename, self.schema_path)
+
+        # A corrupt compiled file falls back to the source and is rewritten.
+        with open(compiled_path, "wb") as fp:
+            fp.write(b"corrupt")
+        third = hed_schema_io._load_schema_file(self.schema_path, cache_folder)
+        self.assertEqual(third, self.schema)
+        compiled_schema.load_compiled(compiled_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -166,3 +166,28 @@ class TestHedSchema(unittest.TestCase):
         self.assertFalse(schema.get_tag_entry("Event", schema_namespace=''))
         self.assertFalse(schema.get_tag_entry("Event", schema_namespace='unknown'))
 
+    def test_tag_cache(self):
+        schema = load_schema(self.hed_xml_3g)
+        tags = ["Item/Object/Geometric-object/2D-shape/Rectangle", "Label/My-Label", "LABEL/my-label",
+                "Event/Sensory-event/Extension", "Event/Sensory-event/Extension", "Notatag/Event",
+                "Notatag/Event", "Item/Agent-action", "Item/Agent-action", "Duration/#"]
+        first = [schema.find_tag_entry(tag) for tag in tags]
+        info = schema.tag_cache_info()
+        self.assertEqual(info["hits"], 4)
+        self.assertEqual(info["size"], len({tag.lower() for tag in tags}))
+        self.assertEqual(first[1][0], first[2][0])
+        self.assertEqual(first[1][1], "/My-Label")
+        self.assertEqual(first[2][1], "/my-label")
+        self.assertEqual(first[9][1], "/#")
+        self.assertEqual(first[5][2], first[6][2])
+        self.assertEqual(first[7][2], first[8][2])
+        self.assertTrue(first[7][2])
+
+        schema.clear_tag_cache()
+        self.assertEqual([schema.find_tag_entry(tag) for tag in tags], first)
+
+        for _ in range(2):
+            entry, remainder, issues = self.hed_schema_group.find_tag_entry("tl:Notatag/Event", "tl:")
+            self.assertEqual(issues[0]["index_in_tag"], 3)
+            self.assertEqual(issues[0]["index_in_tag_end"], 10)
+        self.assertEqual(self.hed_schema_group.tag_cache_info()["hits"], 1)
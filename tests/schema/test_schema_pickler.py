@@ -0,0 +1,35 @@
+import pickle
+import unittest
+
+from hed import load_schema_version, HedString
+from hed.schema import schema_pickler
+
+
+class TestSchemaPickler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.schema = load_schema_version("8.2.0")
+        cls.schema_copy = pickle.loads(pickle.dumps(cls.schema))
+
+    def test_round_trip_uses_target_schema(self):
+        hed_string = HedString("Sensory-event, (Red, Duration/3 s), Invalidtag", self.schema)
+        data = schema_pickler.dumps(hed_string, self.schema)
+        self.assertLess(len(data), len(pickle.dumps(self.schema)) // 10)
+        loaded = schema_pickler.loads(data, self.schema_copy)
+        self.assertEqual(str(loaded), str(hed_string))
+        self.assertEqual(loaded.get_as_long(), hed_string.get_as_long())
+        self.assertIs(loaded._schema, self.schema_copy)
+        tag = loaded.find_tags({"red"}, recursive=True, include_groups=0)[0]
+        self.assertIs(tag._schema_entry, self.schema_copy.get_tag_entry("Red"))
+
+    def test_schema_group(self):
+        schema_group = load_schema_version(["8.2.0", "sc:score_1.0.0"])
+        group_copy = pickle.loads(pickle.dumps(schema_group))
+        hed_string = HedString("Red, sc:Sleep-modulator", schema_group)
+        loaded = schema_pickler.loads(schema_pickler.dumps(hed_string, schema_group), group_copy)
+        self.assertEqual(loaded.get_as_long(), hed_string.get_as_long())
+        self.assertIs(loaded._schema, group_copy)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import os
 import unittest
+from pandas import DataFrame
 
+from hed.models.definition_dict import DefinitionDict
 from hed.models.sidecar import Sidecar, HedString
 from hed.models.tabular_input import TabularInput
 from hed.schema.hed_schema_io import load_schema_version
@@ -57,6 +59,21 @@ class Test(unittest.TestCase):
             self.assertIsInstance(base[index], str)
         # ToDo  finish tests
 
+    def test_expand_context_overlapping(self):
+        def_dict = DefinitionDict()
+        for definition in ['(Definition/Cond1, (Circle, Square))', '(Definition/Cond2, (Triangle, Sphere))']:
+            def_dict.check_for_definitions(HedString(definition, hed_schema=self.schema))
+        df = DataFrame({'onset': [0.0, 1.0, 2.0, 3.0, 4.0, 5.0],
+                        'HED': ['(Def/Cond1, Onset)', 'Red', '(Def/Cond2, Onset)', 'Blue',
+                                '(Def/Cond1, Offset)', 'Green']})
+        manager = EventManager(TabularInput(df), self.schema, extra_defs=def_dict)
+        base, contexts = manager._expand_context()
+        self.assertEqual(base, ['Def/Cond1', '', 'Def/Cond2', '', '', ''])
+        self.assertEqual(contexts, ['', 'Def/Cond1', 'Def/Cond1', 'Def/Cond1,Def/Cond2', 'Def/Cond2', 'Def/Cond2'])
+        self.assertIs(contexts[4], contexts[5])
+        hed, base, context = manager.unfold_context()
+        self.assertEqual(context, contexts)
+
     def test_str_list_to_hed(self):
         manager = EventManager(self.input_data, self.schema)
         hed_obj1 = manager.str_list_to_hed(['', '', ''])
@@ -1,4 +1,6 @@
 import os
+import json
+import pickle
 import unittest
 from hed import schema as hedschema
 from hed.models import Sidecar, TabularInput, HedString
@@ -66,6 +68,39 @@ class Test(unittest.TestCase):
         self.assertEqual(14, len(counts3.tag_dict))
         self.assertEqual(2, counts3.tag_dict['experiment-structure'].events)
 
+    def test_merge(self):
+        counts1 = HedTagCounts('Base_name1', 6)
+        counts1.update_counts([HedString(self.input_df.iloc[k]['HED_assembled'], self.hed_schema)
+                               for k in range(6)], 'Base_name1')
+        counts2 = HedTagCounts('Base_name2', 3)
+        counts2.update_counts([HedString("Red, Label/A, (Label/B, Label/A)", self.hed_schema), None,
+                               HedString("Label/A, Blue", self.hed_schema)], 'Base_name2')
+        self.assertEqual(counts2.tag_dict['label'].events, 2)
+        self.assertEqual(counts2.value_counts[counts2.tag_ids['label']], {'A': 3, 'B': 1})
+        counts3 = pickle.loads(pickle.dumps(counts1))
+        counts3.merge(counts2)
+        self.assertEqual(list(counts3.files), ['Base_name1', 'Base_name2'])
+        self.assertEqual(counts3.total_events, 9)
+        self.assertEqual(len(counts3.tag_dict), len(counts1.tag_dict) + 3)
+        self.assertEqual(counts3.tag_dict['label'].files, {'Base_name2': 2})
+        counts4 = HedTagCounts("All", 0)
+        counts4.merge_tag_dicts(counts1.tag_dict)
+        counts4.merge_tag_dicts(counts2.tag_dict)
+        for tag, count in counts3.tag_dict.items():
+            self.assertEqual(count.get_summary(), counts4.tag_dict[tag].get_summary())
+
+    def test_to_dict(self):
+        counts1 = HedTagCounts('Base_name1', 3)
+        counts1.update_counts([HedString("Red, Label/A, (Label/B, Label/A)", self.hed_schema), None,
+                               HedString("Label, Blue", self.hed_schema)], 'Base_name1')
+        counts2 = HedTagCounts.from_dict(json.loads(json.dumps(counts1.to_dict())))
+        self.assertEqual(counts2.get_summary(), counts1.get_summary())
+        self.assertEqual(counts2.value_counts[counts2.tag_ids['label']], {'A': 2, 'B': 1, None: 1})
+        self.assertEqual(counts2.tags, counts1.tags)
+        counts2.merge(counts1)
+        self.assertEqual(counts2.tag_dict['label'].files, {'Base_name1': 4})
+        self.assertEqual(HedTagCounts.from_dict(HedTagCounts('Empty').to_dict()).event_counts.shape, (0, 0))
+
     def test_hed_tag_count(self):
         name = 'Base_name1'
         counts1 = HedTagCounts(name, 0)
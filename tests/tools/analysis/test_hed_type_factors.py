@@ -1,6 +1,6 @@
 import os
 import unittest
-from pandas import DataFrame
+from pandas import DataFrame, SparseDtype
 from hed.models import DefinitionDict
 from hed.models.hed_string import HedString
 from hed.models.tabular_input import TabularInput
@@ -145,6 +145,22 @@ class Test(unittest.TestCase):
                 self.assertEqual(len(factors.columns), summary["levels"], 'get_factors has factors levels')
                 self.assertEqual(len(factors.columns), len(var_manager._type_map[variable].levels))
 
+    def test_get_factors_encodings(self):
+        factors = HedTypeFactors('condition-variable', 'var1', 6)
+        factors.levels = {'a': {4: 0, 0: 0}, 'b': {2: 0}}
+        one_hot = factors.get_factors()
+        self.assertEqual(list(one_hot.columns), ['var1.a', 'var1.b'])
+        self.assertEqual(list(one_hot['var1.a']), [1, 0, 0, 0, 1, 0])
+        self.assertEqual(list(one_hot['var1.b']), [0, 0, 1, 0, 0, 0])
+        sparse = factors.get_factors(sparse=True)
+        self.assertTrue(all(isinstance(dtype, SparseDtype) for dtype in sparse.dtypes))
+        self.assertTrue(sparse.sparse.to_dense().equals(one_hot))
+        categorical = factors.get_factors(factor_encoding="categorical")
+        self.assertEqual(list(categorical['var1']), ['a', 'n/a', 'b', 'n/a', 'a', 'n/a'])
+        direct = HedTypeFactors('condition-variable', 'var2', 3)
+        direct.direct_indices = {1: ''}
+        self.assertEqual(list(direct.get_factors(sparse=True)['var2']), [0, 1, 0])
+
     def test_count_events(self):
         list1 = [0, 2, 6, 1, 2, 0, 0]
         number_events1, number_multiple1, max_multiple1 = HedTypeFactors._count_level_events(list1)
@@ -112,6 +112,28 @@ class Test(unittest.TestCase):
         self.assertEqual(df_new.iloc[3]["event_type"], 'n/a',
                          "remap should have n/a in the targets when key is missing")
 
+    def test_remap_mixed_keys(self):
+        key_map = KeyMap(['a', 'b'], ['c'])
+        map_df = pd.DataFrame({'a': ['x', 'y', 'x', 'n/a'], 'b': [1, 2, 1, 3], 'c': ['c1', 'c2', 'c1', 'c3']})
+        key_map.update(map_df)
+        self.assertEqual(len(key_map.col_map), 3)
+        self.assertEqual(key_map._get_counts(), [2, 1, 1])
+        self.assertEqual(key_map.col_map.iloc[2]['c'], 'c3')
+        data_df = pd.DataFrame({'a': ['y', 'z', 'n/a', 'x'], 'b': [2, 1, 3, 1], 'd': [0.5, 1.5, 2.5, 3.5]})
+        df_new, missing = key_map.remap(data_df)
+        self.assertEqual(missing, [1])
+        self.assertEqual(list(df_new['c']), ['c2', 'n/a', 'c3', 'c1'])
+        self.assertEqual(list(df_new['d']), [0.5, 1.5, 2.5, 3.5])
+        key_map.update(data_df)
+        self.assertEqual(len(key_map.col_map), 4)
+        self.assertEqual(key_map._get_counts(), [3, 2, 2, 1])
+        key_map.resort()
+        self.assertEqual(list(key_map.col_map['a']), ['n/a', 'x', 'y', 'z'])
+        self.assertEqual(key_map._get_counts(), [2, 3, 2, 1])
+        df_new, missing = key_map.remap(data_df)
+        self.assertEqual(list(df_new['c']), ['c2', 'n/a', 'c3', 'c1'])
+        self.assertIn("['z', 1, 'n/a']:\t1", str(key_map))
+
     def test_remap_files(self):
         key_cols = ['type']
         target_cols = ['event_type', 'task_role', 'letter']
@@ -115,6 +115,25 @@ class Test(unittest.TestCase):
         self.assertEqual(dict2.value_info['letter'], [2*len(stern_df), 2],
                          "TabularSummary value counts should update by column length each time update is called")
 
+    def test_update_file_list(self):
+        file_list = [self.stern_test1_path, self.stern_test2_path, self.attention_shift_path, self.stern_test3_path]
+        serial = TabularSummary(value_cols=['latency'], skip_cols=['stimulus'])
+        for file_path in file_list:
+            serial.update(file_path)
+        concurrent = TabularSummary(value_cols=['latency'], skip_cols=['stimulus'])
+        concurrent.update(file_list, max_workers=3)
+        self.assertEqual(concurrent.get_summary(), serial.get_summary())
+        self.assertEqual(list(concurrent.categorical_info.keys()), list(serial.categorical_info.keys()))
+        self.assertEqual(concurrent.value_info['latency'][1], 3)
+        partials = list(TabularSummary.summarize_files(file_list, value_cols=['latency'], skip_cols=['stimulus']))
+        self.assertEqual(len(partials), len(file_list))
+        left = TabularSummary(value_cols=['latency'], skip_cols=['stimulus'])
+        left.update_summary(partials[0])
+        left.update_summary(partials[1])
+        partials[2].update_summary(partials[3])
+        left.update_summary(partials[2])
+        self.assertEqual(left.get_summary(), serial.get_summary())
+
     def test_update_dict(self):
         dict1 = TabularSummary()
         dict2 = TabularSummary()
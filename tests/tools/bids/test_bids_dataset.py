@@ -1,5 +1,6 @@
 import os
 import unittest
+from hed.errors import get_printable_issue_string
 from hed.schema.hed_schema_io import load_schema, load_schema_version
 from hed.schema.hed_schema import HedSchema
 from hed.schema.hed_schema_group import HedSchemaGroup
@@ -76,6 +77,13 @@ class Test(unittest.TestCase):
         issues = bids.validate(check_for_warnings=False)
         self.assertFalse(issues, "BidsDataset with libraries should validate")
 
+    def test_validator_workers(self):
+        for path in [self.root_path, self.library_path]:
+            bids = BidsDataset(path)
+            serial_issues = bids.validate(check_for_warnings=True)
+            parallel_issues = bids.validate(check_for_warnings=True, workers=2)
+            self.assertEqual(get_printable_issue_string(parallel_issues), get_printable_issue_string(serial_issues))
+
     def test_validator_types(self):
         bids = BidsDataset(self.root_path, tabular_types=None)
         issues = bids.validate(check_for_warnings=False)
@@ -1,6 +1,9 @@
 import os
+import json
 import unittest
-from hed.schema.hed_schema_io import load_schema
+from hed.errors import get_printable_issue_string
+from hed.models import TabularInput
+from hed.schema.hed_schema_io import load_schema, load_schema_version
 from hed.tools.analysis.tabular_summary import TabularSummary
 from hed.tools.bids.bids_file_group import BidsFileGroup
 
@@ -40,6 +43,19 @@ class Test(unittest.TestCase):
         self.assertEqual(len(validation_issues), 6,
                          "BidsFileGroup should have 2 validation warnings for missing columns")
 
+    def test_validator_workers(self):
+        events = BidsFileGroup(self.root_path)
+        hed_schema = load_schema_version("8.2.0")
+        serial_issues = events.validate_datafiles(hed_schema, check_for_warnings=True)
+        parallel_issues = events.validate_datafiles(hed_schema, check_for_warnings=True, workers=2)
+        self.assertEqual(len(parallel_issues), 6)
+        self.assertEqual(get_printable_issue_string(parallel_issues), get_printable_issue_string(serial_issues))
+        parallel_issues = events.validate_datafiles(hed_schema, check_for_warnings=True, keep_contents=True,
+                                                    workers=2)
+        self.assertEqual(get_printable_issue_string(parallel_issues), get_printable_issue_string(serial_issues))
+        for data_obj in events.datafile_dict.values():
+            self.assertIsInstance(data_obj.contents, TabularInput)
+
     def test_summarize(self):
         events = BidsFileGroup(self.root_path)
         info = events.summarize()
@@ -49,6 +65,26 @@ class Test(unittest.TestCase):
         self.assertEqual(len(info2.categorical_info), len(info.categorical_info)-2,
                          "get_summary info has two less entries if two columns are skipped")
 
+    def test_get_sidecars_from_path_inheritance(self):
+        root_path = os.path.realpath(os.path.join(os.path.dirname(__file__),
+                                                  '../../data/bids_tests/eeg_ds003645s_hed_inheritance'))
+        events = BidsFileGroup(root_path)
+        top_sidecar = os.path.join(root_path, 'task-FacePerception_events.json')
+        sub_sidecar = os.path.join(root_path, 'sub-003', 'sub-003_task-FacePerception_events.json')
+        data_obj = events.datafile_dict[os.path.join(root_path, 'sub-003', 'eeg',
+                                                     'sub-003_task-FacePerception_run-1_events.tsv')]
+        self.assertEqual(events.get_sidecars_from_path(data_obj), [top_sidecar, sub_sidecar])
+        self.assertIs(data_obj.sidecar, events.sidecar_dict[sub_sidecar])
+        self.assertEqual(events.get_sidecars_from_path(events.sidecar_dict[top_sidecar]), [top_sidecar])
+
+        # The merged sidecar has the top-level columns overridden by the subject-level ones.
+        merged = events.sidecar_dict[sub_sidecar].contents.loaded_dict
+        expected = events.sidecar_dict[top_sidecar].contents.loaded_dict.copy()
+        with open(sub_sidecar, 'r') as fp:
+            expected.update(json.load(fp))
+        self.assertEqual(merged, expected)
+        self.assertIsNot(merged, events.sidecar_dict[top_sidecar].contents.loaded_dict)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,64 @@
+import os
+import shutil
+import tempfile
+import unittest
+from hed.tools.bids.bids_file_group import BidsFileGroup
+from hed.tools.bids.bids_file_index import BidsFileIndex
+from hed.tools.util.io_util import get_dir_dictionary, get_file_list
+
+
+class Test(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.root_path = os.path.realpath(os.path.join(os.path.dirname(__file__),
+                                                      '../../data/bids_tests/eeg_ds003645s_hed_inheritance'))
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_constructor(self):
+        file_index = BidsFileIndex(self.root_path, exclude_dirs=['derivatives'])
+        self.assertEqual(file_index.get_file_list(name_suffix='events', extensions=['.tsv']),
+                         get_file_list(self.root_path, name_suffix='events', extensions=['.tsv'],
+                                       exclude_dirs=['derivatives']))
+        self.assertEqual(file_index.get_dir_dictionary(extensions=['.json'], exclude_dirs=['derivatives', 'eeg']),
+                         get_dir_dictionary(self.root_path, extensions=['.json'], exclude_dirs=['derivatives', 'eeg']))
+        with self.assertRaises(ValueError) as context:
+            file_index.get_file_list(exclude_dirs=[])
+        self.assertEqual(context.exception.args[0], "IndexMissingDirectories")
+
+    def test_shared_by_file_groups(self):
+        file_index = BidsFileIndex(self.root_path)
+        events = BidsFileGroup(self.root_path, suffix='events', file_index=file_index)
+        self.assertEqual(list(events.datafile_dict), list(BidsFileGroup(self.root_path).datafile_dict))
+        self.assertEqual(len(events.sidecar_dict), 3)
+        with self.assertRaises(ValueError) as context:
+            BidsFileGroup(os.path.join(self.root_path, 'sub-002'), file_index=file_index)
+        self.assertEqual(context.exception.args[0], "IndexRootMismatch")
+
+    def test_index_path(self):
+        root_path = os.path.join(self.temp_dir, 'dataset')
+        shutil.copytree(self.root_path, root_path)
+        index_path = os.path.join(self.temp_dir, 'index', 'files.json')
+        file_index = BidsFileIndex(root_path, index_path=index_path)
+        self.assertTrue(os.path.isfile(index_path))
+        saved_time = os.stat(index_path).st_mtime_ns
+
+        # Nothing changed, so the saved index is used and not written again.
+        reused_index = BidsFileIndex(root_path, index_path=index_path)
+        self.assertEqual(reused_index.dirs, file_index.dirs)
+        self.assertEqual(os.stat(index_path).st_mtime_ns, saved_time)
+
+        new_file = os.path.join(os.path.realpath(root_path), 'sub-002', 'sub-002_task-FacePerception_run-4_events.tsv')
+        shutil.copy(os.path.join(root_path, 'sub-002', 'sub-002_task-FacePerception_run-1_events.tsv'), new_file)
+        updated_index = BidsFileIndex(root_path, index_path=index_path)
+        self.assertIn(new_file, updated_index.get_file_list(name_suffix='events'))
+        self.assertEqual(updated_index.get_file_list(), get_file_list(root_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
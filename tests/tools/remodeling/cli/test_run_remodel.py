@@ -1,5 +1,7 @@
 import os
 import io
+import json
+import re
 import shutil
 import unittest
 from unittest.mock import patch
@@ -162,6 +164,139 @@ class Test(unittest.TestCase):
             main(arg_list)
             self.assertFalse(fp.getvalue())
 
+    def test_main_jobs(self):
+        operations = [
+            {"operation": "remove_columns", "description": "",
+             "parameters": {"column_names": ["sample"], "ignore_missing": True}},
+            {"operation": "summarize_column_values", "description": "",
+             "parameters": {"summary_name": "values", "summary_filename": "values",
+                            "skip_columns": ["onset", "duration"], "value_columns": ["trial", "response_time"]}},
+            {"operation": "summarize_hed_tags", "description": "",
+             "parameters": {"summary_name": "tags", "summary_filename": "tags",
+                            "tags": {"Sensory events": ["Sensory-event"], "Objects": ["Item"]}}},
+            {"operation": "summarize_hed_type", "description": "",
+             "parameters": {"summary_name": "types", "summary_filename": "types",
+                            "type_tag": "condition-variable"}},
+            {"operation": "summarize_definitions", "description": "",
+             "parameters": {"summary_name": "definitions", "summary_filename": "definitions"}}
+        ]
+        model_path = os.path.join(self.extract_path, 'jobs_rmdl.json')
+        with open(model_path, 'w') as fp:
+            json.dump(operations, fp)
+        results = []
+        try:
+            for jobs in ['1', '2']:
+                work_path = os.path.realpath(os.path.join(self.extract_path, 'temp', jobs))
+                main([self.data_root, model_path, '-x', 'derivatives', 'stimuli', '-r', '8.1.0',
+                      '-j', self.sidecar_path, '-w', work_path, '-s', '.json', '-p', jobs])
+                summaries = {}
+                for dir_path, _, file_names in os.walk(work_path):
+                    for file_name in file_names:
+                        with open(os.path.join(dir_path, file_name), 'r') as fp:
+                            summaries[re.sub(r'_\d{4}_\d{2}_\d{2}_T_[\d_]+', '', file_name)] = fp.read()
+                events_path = os.path.join(self.data_root, 'sub-002/eeg/sub-002_task-FacePerception_run-1_events.tsv')
+                with open(events_path, 'r') as fp:
+                    results.append((summaries, fp.read()))
+        finally:
+            os.remove(model_path)
+        self.assertTrue(results[0][0])
+        self.assertEqual(results[0], results[1])
+        self.assertNotIn("sample", results[1][1])
+
+    def test_main_incremental(self):
+        work_path = os.path.realpath(os.path.join(self.extract_path, 'temp'))
+        arg_list = [self.data_root, self.summary_model_path, '-x', 'derivatives', 'stimuli', '-r', '8.1.0',
+                    '-j', self.sidecar_path, '-w', work_path, '-s', '.json', '-in', '-v']
+        events_path = os.path.join(self.data_root, 'sub-002/eeg/sub-002_task-FacePerception_run-1_events.tsv')
+
+        def run_remodel():
+            shutil.rmtree(os.path.join(work_path, 'remodel', 'summaries'), ignore_errors=True)
+            with patch('sys.stdout', new=io.StringIO()) as fp:
+                main(arg_list)
+            summaries = {}
+            for dir_path, _, file_names in os.walk(os.path.join(work_path, 'remodel', 'summaries')):
+                for file_name in file_names:
+                    with open(os.path.join(dir_path, file_name), 'r') as sp:
+                        summaries[re.sub(r'_\d{4}_\d{2}_\d{2}_T_[\d_]+', '', file_name)] = sp.read()
+            with open(events_path, 'r') as ep:
+                return re.search(r'Skipping (\d+) unchanged files', fp.getvalue()).group(1), summaries, ep.read()
+
+        skipped1, summaries1, events1 = run_remodel()
+        self.assertEqual(skipped1, '0')
+        self.assertTrue(summaries1)
+        manifest_path = os.path.join(work_path, 'remodel', 'manifests', 'summarize_hed_types_rmdl_manifest.json')
+        self.assertTrue(os.path.exists(manifest_path))
+        with open(manifest_path, 'r') as fp:
+            file_count = len(json.load(fp)["files"])
+        self.assertGreater(file_count, 1)
+
+        skipped2, summaries2, events2 = run_remodel()
+        self.assertEqual(int(skipped2), file_count)
+        self.assertEqual(summaries2, summaries1)
+        self.assertEqual(events2, events1)
+
+        with open(events_path, 'a') as fp:
+            fp.write("changed\n")
+        skipped3, summaries3, events3 = run_remodel()
+        self.assertEqual(int(skipped3), file_count - 1)
+        self.assertEqual(summaries3, summaries1)
+        self.assertEqual(events3, events1)
+
+    def test_main_incremental_all_summaries(self):
+        operations = [
+            {"operation": "summarize_column_names", "description": "",
+             "parameters": {"summary_name": "names", "summary_filename": "names"}},
+            {"operation": "summarize_column_values", "description": "",
+             "parameters": {"summary_name": "values", "summary_filename": "values",
+                            "skip_columns": ["onset", "duration"], "value_columns": ["trial", "response_time"]}},
+            {"operation": "summarize_definitions", "description": "",
+             "parameters": {"summary_name": "definitions", "summary_filename": "definitions"}},
+            {"operation": "summarize_hed_tags", "description": "",
+             "parameters": {"summary_name": "tags", "summary_filename": "tags",
+                            "tags": {"Sensory events": ["Sensory-event"], "Objects": ["Item"]}}},
+            {"operation": "summarize_hed_type", "description": "",
+             "parameters": {"summary_name": "types", "summary_filename": "types",
+                            "type_tag": "condition-variable"}},
+            {"operation": "summarize_hed_validation", "description": "",
+             "parameters": {"summary_name": "validation", "summary_filename": "validation"}},
+            {"operation": "summarize_sidecar_from_events", "description": "",
+             "parameters": {"summary_name": "sidecar", "summary_filename": "sidecar",
+                            "skip_columns": ["onset", "duration"], "value_columns": ["trial", "response_time"]}}
+        ]
+        model_path = os.path.join(self.extract_path, 'all_summaries_rmdl.json')
+        with open(model_path, 'w') as fp:
+            json.dump(operations, fp)
+        work_path = os.path.realpath(os.path.join(self.extract_path, 'temp'))
+        arg_list = [self.data_root, model_path, '-x', 'derivatives', 'stimuli', '-r', '8.1.0',
+                    '-j', self.sidecar_path, '-w', work_path, '-in', '-v']
+
+        def run_remodel():
+            shutil.rmtree(os.path.join(work_path, 'remodel', 'summaries'), ignore_errors=True)
+            with patch('sys.stdout', new=io.StringIO()) as fp:
+                main(arg_list)
+            summaries = {}
+            for dir_path, _, file_names in os.walk(os.path.join(work_path, 'remodel', 'summaries')):
+                for file_name in file_names:
+                    with open(os.path.join(dir_path, file_name), 'r') as sp:
+                        summaries[re.sub(r'_\d{4}_\d{2}_\d{2}_T_[\d_]+', '', file_name)] = sp.read()
+            return re.search(r'Skipping (\d+) unchanged files', fp.getvalue()).group(1), summaries
+
+        try:
+            skipped1, summaries1 = run_remodel()
+            skipped2, summaries2 = run_remodel()
+        finally:
+            os.remove(model_path)
+        manifest_path = os.path.join(work_path, 'remodel', 'manifests', 'all_summaries_rmdl_manifest.json')
+        with open(manifest_path, 'r') as fp:
+            entries = json.load(fp)["files"]
+        self.assertEqual(skipped1, '0')
+        self.assertEqual(int(skipped2), len(entries))
+        self.assertGreater(len(summaries1), 2 * len(operations))
+        self.assertEqual(summaries2, summaries1)
+        for entry in entries.values():
+            self.assertEqual(set(entry["summaries"]), {op["parameters"]["summary_name"] for op in operations})
+            self.assertIsInstance(entry["summaries"]["tags"], dict)
+
     def test_main_errors(self):
         # Test bad data directory
         arg_list = ['junk/junk', self.model_path, '-x', 'derivatives', '-n', 'back1']
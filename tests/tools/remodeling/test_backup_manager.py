@@ -133,6 +133,38 @@ class Test(unittest.TestCase):
         return_val2 = test_man.create_backup(file_list, backup_name="test_back1", verbose=False)
         self.assertTrue(return_val2, "create_backup returns true when it has created a backup.")
 
+    def test_create_restore_backup_strategies(self):
+        file_list = get_file_list(self.test_root, exclude_dirs=['derivatives'])
+        with open(self.test_paths[0], 'r') as fp:
+            original = fp.read()
+        for strategy in BackupManager.STRATEGIES:
+            test_man = BackupManager(self.test_root)
+            backup_name = "back_" + strategy
+            self.assertTrue(test_man.create_backup(file_list, backup_name=backup_name, strategy=strategy))
+            backup_path = test_man.get_backup_path(backup_name, self.test_paths[0])
+            with open(backup_path, 'r') as fp:
+                self.assertEqual(fp.read(), original)
+            self.assertEqual(os.stat(backup_path).st_mtime_ns, os.stat(self.test_paths[0]).st_mtime_ns)
+            if strategy == BackupManager.HARDLINK:
+                self.assertTrue(os.path.samefile(backup_path, self.test_paths[0]))
+
+            # Unchanged files are skipped and changed files are replaced without changing the backup.
+            pairs = [(test_man.get_backup_path(backup_name, file), file) for file in file_list]
+            self.assertEqual(BackupManager.transfer_files(pairs, strategy=strategy), 0)
+            os.remove(self.test_paths[0])
+            with open(self.test_paths[0], 'w') as fp:
+                fp.write("changed")
+            test_man.restore_backup(backup_name, verbose=False, strategy=strategy)
+            with open(self.test_paths[0], 'r') as fp:
+                self.assertEqual(fp.read(), original)
+            with open(backup_path, 'r') as fp:
+                self.assertEqual(fp.read(), original)
+            self.assertFalse([file for file in os.listdir(os.path.dirname(backup_path)) if file.endswith('.tmp')])
+
+        with self.assertRaises(ValueError) as context:
+            BackupManager.transfer_files([], strategy="junk")
+        self.assertEqual(context.exception.args[0], "InvalidCopyStrategy")
+
     def test_get_task(self):
         task1 = BackupManager.get_task(['abc', 'def'], 'temp/myabc.txt')
         self.assertFalse(task1)
@@ -185,6 +185,88 @@ class Test(unittest.TestCase):
         self.assertEqual(len(df.columns), 17)
         self.assertIn('key-assignment.right-sym-cond', df.columns)
 
+    def test_normalize_data(self):
+        df = pd.DataFrame(self.sample_data, columns=self.sample_columns)
+        df['sex'] = df['sex'].astype('category')
+        df_new = Dispatcher.normalize_data(df)
+        expected = Dispatcher.prep_data(Dispatcher.post_proc_data(df.copy()))
+        self.assertTrue(df_new.astype(str).equals(expected.astype(str)))
+        self.assertEqual(df_new['sex'].dtype, object)
+        self.assertTrue(np.isnan(df_new.loc[0, 'stop_signal_delay']))
+        self.assertEqual(df.loc[0, 'stop_signal_delay'], 'n/a')
+        self.assertEqual(df['sex'].dtype, 'category')
+        self.assertIs(Dispatcher.normalize_data(df_new), df_new)
+
+    def test_normalize_data_duplicate_columns(self):
+        df = pd.concat([pd.Series(['a', 'n/a'], dtype='category'), pd.Series(['n/a', 'b']), pd.Series([1, 2])],
+                       axis=1)
+        df.columns = ['x', 'x', 'y']
+        df_new = Dispatcher.normalize_data(df)
+        self.assertEqual(list(df_new.columns), ['x', 'x', 'y'])
+        self.assertTrue(df_new.iloc[:, :2].isna().equals(pd.DataFrame([[False, True], [True, False]],
+                                                                      columns=['x', 'x'])))
+        self.assertEqual(df.iloc[0, 1], 'n/a')
+        self.assertEqual(df.iloc[:, 0].dtype, 'category')
+        self.assertEqual(df_new.iloc[:, 0].dtype, object)
+        df_bids = Dispatcher.post_proc_data(df_new)
+        self.assertEqual(df_bids.iloc[:, 0].tolist(), ['a', 'n/a'])
+        self.assertEqual(df_bids.iloc[:, 2].tolist(), [1, 2])
+
+    def test_run_operations_shares_bids_data(self):
+        summary_op = {"operation": "summarize_column_values", "description": "",
+                      "parameters": {"summary_name": "values", "summary_filename": "values",
+                                     "skip_columns": ["onset"], "value_columns": ["response_time"]}}
+        ops = [summary_op, dict(summary_op, parameters=dict(summary_op["parameters"], summary_name="values2"))]
+        dispatch = Dispatcher(ops)
+        seen = []
+        get_bids_data = dispatch.get_bids_data
+
+        def record_bids_data(df):
+            seen.append(get_bids_data(df))
+            return seen[-1]
+        dispatch.get_bids_data = record_bids_data
+        df_new = dispatch.run_operations(self.file_path)
+        self.assertEqual(len(seen), 3)
+        self.assertIs(seen[0], seen[1])
+        self.assertIs(df_new, seen[2])
+        self.assertIsNone(dispatch._bids_data)
+        self.assertIsNot(dispatch.get_bids_data(df_new), dispatch.get_bids_data(df_new))
+        self.assertEqual(dispatch.summary_dicts["values"].summary_dict.keys(),
+                         dispatch.summary_dicts["values2"].summary_dict.keys())
+        self.assertEqual(list(df_new.columns), self.sample_columns)
+        self.assertFalse(df_new.isna().any().any())
+
+    def test_run_operations_shares_hed_context(self):
+        sidecar_path = os.path.join(self.data_path, 'aomic_sub-0013_events.json')
+        ops = [{"operation": "factor_hed_tags", "description": "",
+                "parameters": {"queries": ["Sensory-event"], "query_names": ["sensory"], "remove_types": []}},
+               {"operation": "summarize_hed_tags", "description": "",
+                "parameters": {"summary_name": "tags", "summary_filename": "tags",
+                               "tags": {"Sensory events": ["Sensory-event"]}}},
+               {"operation": "rename_columns", "description": "",
+                "parameters": {"column_mapping": {"trial_type": "event_kind"}, "ignore_missing": True}},
+               {"operation": "summarize_hed_validation", "description": "",
+                "parameters": {"summary_name": "validation", "summary_filename": "validation",
+                               "check_for_warnings": False}}]
+        dispatch = Dispatcher(ops, hed_versions='8.2.0')
+        seen = []
+        get_hed_context = dispatch.get_hed_context
+
+        def record_hed_context(df, name, sidecar=None):
+            seen.append(get_hed_context(df, name, sidecar=sidecar))
+            return seen[-1]
+        dispatch.get_hed_context = record_hed_context
+        df_new = dispatch.run_operations(self.file_path, sidecar=sidecar_path)
+        self.assertEqual(len(seen), 3)
+        self.assertIs(seen[0], seen[1])
+        self.assertIsNot(seen[1], seen[2])
+        self.assertNotIn('trial_type', seen[2].get_hed_columns(df_new))
+        self.assertEqual(seen[0].sidecar.name, 'aomic_sub-0013_events.json')
+        self.assertIsNone(dispatch._hed_context)
+        self.assertNotIn('sensory', seen[0].df.columns)
+        self.assertTrue(seen[0].is_current(dispatch.normalize_data(dispatch.get_data_file(self.file_path))))
+        self.assertFalse(seen[0].is_current(dispatch.get_data_file(self.file_path).iloc[1:]))
+
     def test_save_summaries(self):
         with open(self.summarize_model) as fp:
             model1 = json.load(fp)
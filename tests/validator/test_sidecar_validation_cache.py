@@ -0,0 +1,60 @@
+import os
+import unittest
+
+from hed import load_schema_version
+from hed.errors import ErrorHandler
+from hed.models import Sidecar
+from hed.validator.sidecar_validator import SidecarValidator
+from hed.validator.sidecar_validation_cache import SidecarValidationCache, clear_sidecar_cache, \
+    sidecar_cache_info
+
+
+class TestSidecarValidationCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.schema = load_schema_version("8.2.0")
+        cls.sidecar_path = os.path.realpath(os.path.join(os.path.dirname(__file__),
+                                                         '../data/validator_tests/bids_events_bad_defs.json'))
+
+    def setUp(self):
+        clear_sidecar_cache()
+
+    def tearDown(self):
+        clear_sidecar_cache()
+
+    def test_identical_sidecars_validated_once(self):
+        validator = SidecarValidator(self.schema)
+        error_handler = ErrorHandler()
+        issues1 = validator.validate(Sidecar(self.sidecar_path), name="events.json", error_handler=error_handler)
+        self.assertTrue(issues1)
+        self.assertFalse(error_handler.error_context)
+        issues2 = validator.validate(Sidecar(self.sidecar_path), name="events.json", error_handler=error_handler)
+        self.assertEqual(sidecar_cache_info()["hits"], 1)
+        self.assertEqual(issues1, issues2)
+        self.assertIsNot(issues1[0], issues2[0])
+
+        validator.validate(Sidecar(self.sidecar_path), name="other.json")
+        validator.validate(Sidecar(self.sidecar_path), name="events.json", error_handler=ErrorHandler(False))
+        validator.validate(Sidecar(self.sidecar_path), name="events.json", use_cache=False)
+        self.assertEqual(sidecar_cache_info(), {"hits": 1, "misses": 3, "max_size": 100, "size": 3})
+
+    def test_workers(self):
+        sidecar = Sidecar(self.sidecar_path)
+        issues = SidecarValidator(self.schema).validate(sidecar, use_cache=False)
+        threaded_issues = SidecarValidator(self.schema).validate(sidecar, workers=4, use_cache=False)
+        self.assertEqual(issues, threaded_issues)
+
+    def test_max_size(self):
+        cache = SidecarValidationCache(max_size=2)
+        for key in ["a", "b", "c", "a"]:
+            if cache.get(key) is None:
+                cache.put(key, [{"code": key}])
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.misses, 4)
+        no_cache = SidecarValidationCache(max_size=0)
+        no_cache.put("a", [])
+        self.assertEqual(len(no_cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,14 @@
+import io
 import pandas as pd
+import numpy as np
 import os
 import shutil
 
 import unittest
 from hed import load_schema_version, load_schema
 from hed.validator import SpreadsheetValidator
-from hed import SpreadsheetInput
+from hed import SpreadsheetInput, TabularInput, Sidecar
+from hed.errors import get_printable_issue_string, ErrorContext, ValidationErrors
 
 class TestSpreadsheetValidation(unittest.TestCase):
     @classmethod
@@ -45,3 +48,49 @@ class TestSpreadsheetValidation(unittest.TestCase):
         issues = file_input.validate(self.schema)
         self.assertTrue(len(issues), 1)
 
+    def test_deduplicate_matches_full_validation(self):
+        df = pd.DataFrame({
+            "HED1": ["Red, Blue", "Red, Blue", "Invalidtag, Red", "n/a", "Invalidtag, Red", "(Red, Blue"],
+            "HED2": ["Square", "Square, Square", "Square", "Green", "Square", "Square"]
+        })
+        dedup_issues = SpreadsheetValidator(self.schema).validate(df, name="test")
+        full_issues = SpreadsheetValidator(self.schema, deduplicate=False).validate(df, name="test")
+        self.assertTrue(dedup_issues)
+        self.assertEqual(get_printable_issue_string(dedup_issues), get_printable_issue_string(full_issues))
+        self.assertEqual([(issue.get(ErrorContext.ROW), issue.get(ErrorContext.COLUMN)) for issue in dedup_issues],
+                         [(issue.get(ErrorContext.ROW), issue.get(ErrorContext.COLUMN)) for issue in full_issues])
+        self.assertEqual(len([issue for issue in dedup_issues if issue["code"] == ValidationErrors.TAG_INVALID]), 2)
+
+    def test_validate_chunks_matches_full_validation(self):
+        sidecar = Sidecar(io.StringIO(
+            '{"event_type": {"HED": {"start": "(Def/Trial, Onset)", "end": "(Def/Trial, Offset)",'
+            ' "bad": "Invalidtag"}}, "defs": {"HED": {"trial": "(Definition/Trial, (Red))"}}}'))
+        df = pd.DataFrame({
+            "onset": ["1", "2", "2", "3", "4", "5", "5", "6", "7", "8"],
+            "event_type": ["start", "bad", "n/a", "end", "end", "start", "missing", "n/a", "end", "bad"],
+            "HED": ["n/a", "Blue", "n/a", "n/a", "n/a", "n/a", "Green", "n/a", "n/a", "(Def/Trial, Offset)"]
+        })
+        tabular = TabularInput(df, sidecar, name="test")
+        def_dict = tabular.get_def_dict(self.schema)
+        full_issues = SpreadsheetValidator(self.schema).validate(tabular, def_dict, name="test")
+        self.assertEqual([issue.get(ErrorContext.ROW) for issue in full_issues
+                          if issue["code"] == ValidationErrors.ONSET_OFFSET_INSET_ERROR], [4])
+        for rows in [1, 2, 3, 20]:
+            chunks = list(TabularInput.iter_chunks(df, sidecar, name="test", rows=rows))
+            self.assertEqual(sum(len(chunk.dataframe) for chunk in chunks), len(df))
+            self.assertTrue(all(previous.dataframe["onset"].iloc[-1] != chunk.dataframe["onset"].iloc[0]
+                                for previous, chunk in zip(chunks, chunks[1:])))
+            chunk_issues = SpreadsheetValidator(self.schema).validate_chunks(chunks, def_dict, name="test")
+            self.assertEqual(get_printable_issue_string(chunk_issues), get_printable_issue_string(full_issues))
+
+    def test_iter_chunks_file(self):
+        events_path = os.path.join(self.base_data_dir, 'bids_tests/eeg_ds003645s_hed/sub-002/eeg/',
+                                   'sub-002_task-FacePerception_run-1_events.tsv')
+        sidecar_path = os.path.join(self.base_data_dir, 'bids_tests/eeg_ds003645s_hed/task-FacePerception_events.json')
+        tabular = TabularInput(events_path, sidecar_path)
+        chunks = list(TabularInput.iter_chunks(events_path, sidecar_path, rows=50))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual([chunk.row_offset for chunk in chunks],
+                         [0] + list(np.cumsum([len(chunk.dataframe) for chunk in chunks[:-1]])))
+        self.assertEqual(sum((list(chunk.series_a) for chunk in chunks), []), list(tabular.series_a))
+        self.assertEqual(chunks[0].name, events_path)